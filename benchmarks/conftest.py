@@ -0,0 +1,34 @@
+import pytest
+import os
+
+from geth.wrapper import (
+    DEFAULT_PASSWORD_PATH,
+)
+
+FAKE_GETH_PATH = os.path.join(os.path.dirname(__file__), "fake_geth")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--geth-binary",
+        default=None,
+        help="Benchmark against this geth executable instead of the fake_geth "
+        "stand-in, which measures only the overhead of py-geth",
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def geth_binary(request):
+    geth_binary = request.config.getoption("--geth-binary") or FAKE_GETH_PATH
+    original_geth_binary = os.environ.get("GETH_BINARY")
+    os.environ["GETH_BINARY"] = geth_binary
+    yield geth_binary
+    if original_geth_binary is None:
+        del os.environ["GETH_BINARY"]
+    else:
+        os.environ["GETH_BINARY"] = original_geth_binary
+
+
+@pytest.fixture
+def chain_kwargs(data_dir):
+    return {"data_dir": data_dir, "password": DEFAULT_PASSWORD_PATH}
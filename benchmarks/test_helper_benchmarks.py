@@ -0,0 +1,55 @@
+from geth.accounts import (
+    create_new_account,
+    get_accounts,
+)
+from geth.main import (
+    get_geth_version,
+    get_geth_version_info_string,
+)
+from geth.wrapper import (
+    construct_popen_command,
+    construct_test_chain_kwargs,
+)
+
+
+def test_construct_popen_command(benchmark, data_dir):
+    geth_kwargs = construct_test_chain_kwargs(
+        data_dir=data_dir, port="30303", ws_port="8546", rpc_port="8545"
+    )
+
+    command = benchmark(construct_popen_command, **geth_kwargs)
+
+    assert "--datadir" in command
+
+
+def test_get_geth_version(benchmark):
+    # cached per executable after the first call
+    benchmark(get_geth_version)
+
+
+def test_get_geth_version_info_string(benchmark):
+    version_info = benchmark(get_geth_version_info_string)
+
+    assert "Version:" in version_info
+
+
+def test_create_new_account(benchmark, chain_kwargs):
+    account = benchmark(create_new_account, **chain_kwargs)
+
+    assert account.startswith("0x")
+
+
+def test_get_accounts(benchmark, chain_kwargs):
+    create_new_account(**chain_kwargs)
+
+    accounts = benchmark(get_accounts, **chain_kwargs)
+
+    assert len(accounts) == 1
+
+
+def test_get_accounts_with_subprocess(benchmark, chain_kwargs):
+    create_new_account(**chain_kwargs)
+
+    accounts = benchmark(get_accounts, use_subprocess=True, **chain_kwargs)
+
+    assert len(accounts) == 1
@@ -0,0 +1,76 @@
+import itertools
+import threading
+
+from geth import (
+    DevGethProcess,
+)
+from geth.mixins import (
+    InterceptedStreamsMixin,
+)
+from geth.utils.timeout import (
+    Timeout,
+)
+
+# log lines written by the node in the stream interception benchmark
+STREAM_LINES = 100_000
+
+
+class InterceptedDevGethProcess(InterceptedStreamsMixin, DevGethProcess):
+    pass
+
+
+def test_dev_geth_process_construction(benchmark, base_dir):
+    chain_names = (f"chain-{i}" for i in itertools.count())
+
+    def construct():
+        DevGethProcess(next(chain_names), base_dir=base_dir)
+
+    benchmark(construct)
+
+
+def test_start_until_ipc_is_ready(benchmark, base_dir):
+    geth = DevGethProcess("start", base_dir=base_dir)
+
+    def start():
+        geth.start()
+        geth.wait_for_ipc(30)
+
+    def stop():
+        geth.stop()
+
+    benchmark.pedantic(start, teardown=stop, rounds=20)
+
+
+def test_stop(benchmark, base_dir):
+    geth = DevGethProcess("stop", base_dir=base_dir)
+
+    def start():
+        geth.start()
+        geth.wait_for_ipc(30)
+
+    benchmark.pedantic(geth.stop, setup=start, rounds=20)
+
+
+def test_stream_interception_throughput(benchmark, base_dir, monkeypatch):
+    monkeypatch.setenv("FAKE_GETH_LOG_LINES", str(STREAM_LINES))
+    geth = InterceptedDevGethProcess("streams", base_dir=base_dir)
+    received = []
+    all_received = threading.Event()
+
+    def count_lines(lines):
+        received.append(len(lines))
+        if sum(received) >= STREAM_LINES:
+            all_received.set()
+
+    geth.register_stderr_batch_callback(count_lines)
+
+    def start():
+        received.clear()
+        all_received.clear()
+        geth.start()
+
+    def consume():
+        if not all_received.wait(60):
+            raise Timeout(60)
+
+    benchmark.pedantic(consume, setup=start, teardown=geth.stop, rounds=5)
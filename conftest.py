@@ -1,5 +1,7 @@
 import pytest
 import json
+import os
+import sys
 
 import requests
 
@@ -58,3 +60,19 @@ def data_dir(tmpdir):
 @pytest.fixture()
 def base_dir(tmpdir):
     return str(tmpdir.mkdir("base-dir"))
+
+
+@pytest.fixture
+def fake_geth(tmpdir, monkeypatch):
+    # what the ``py-geth-fake-geth`` console script does
+    executable_path = str(tmpdir.join("fake-geth"))
+    with open(executable_path, "w") as f:
+        f.write(
+            f"#!{sys.executable}\n"
+            "import sys\n"
+            "from geth.fake_geth import main\n"
+            "sys.exit(main())\n"
+        )
+    os.chmod(executable_path, 0o755)
+    monkeypatch.setenv("GETH_BINARY", executable_path)
+    return executable_path
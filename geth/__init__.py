@@ -1,28 +1,93 @@
-from importlib.metadata import (
-    version as __version,
+from __future__ import (
+    annotations,
 )
 
-from .install import (
-    install_geth,
+import importlib
+from typing import (
+    TYPE_CHECKING,
+    Any,
 )
-from .main import (
-    get_geth_version,
-)
-from .mixins import (
-    InterceptedStreamsMixin,
-    LoggingMixin,
-)
-from .process import (
-    DevGethProcess,
-    MainnetGethProcess,
-    SepoliaGethProcess,
-    TestnetGethProcess,
+
+from .exceptions import (
+    PyGethAttributeError,
 )
 
-__version__ = __version("py-geth")
+if TYPE_CHECKING:
+    from .async_process import (
+        AsyncDevGethProcess,
+    )
+    from .install import (
+        install_geth,
+        install_geth_many,
+    )
+    from .main import (
+        get_geth_version,
+    )
+    from .mixins import (
+        InterceptedStreamsMixin,
+        LoggingMixin,
+    )
+    from .pool import (
+        DevGethProcessPool,
+    )
+    from .process import (
+        DevGethProcess,
+        MainnetGethProcess,
+        SepoliaGethProcess,
+        TestnetGethProcess,
+        stop_all,
+    )
+    from .utils.validation import (
+        GethConfig,
+    )
+
+    __version__: str
+
+# public names are imported from their modules on first access so that importing
+# ``geth`` does not import e.g. ``requests`` or ``pydantic`` until they are needed
+_LAZY_ATTRIBUTES = {
+    "AsyncDevGethProcess": ".async_process",
+    "install_geth": ".install",
+    "install_geth_many": ".install",
+    "get_geth_version": ".main",
+    "InterceptedStreamsMixin": ".mixins",
+    "LoggingMixin": ".mixins",
+    "DevGethProcessPool": ".pool",
+    "DevGethProcess": ".process",
+    "MainnetGethProcess": ".process",
+    "SepoliaGethProcess": ".process",
+    "TestnetGethProcess": ".process",
+    "stop_all": ".process",
+    "GethConfig": ".utils.validation",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        from importlib.metadata import (
+            version,
+        )
+
+        value: Any = version("py-geth")
+    elif name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+    else:
+        raise PyGethAttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # cache the value so that ``__getattr__`` is only called once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES, "__version__"})
+
 
 __all__ = (
+    "AsyncDevGethProcess",
     "install_geth",
+    "install_geth_many",
     "get_geth_version",
     "InterceptedStreamsMixin",
     "LoggingMixin",
@@ -30,4 +95,7 @@ __all__ = (
     "SepoliaGethProcess",
     "TestnetGethProcess",
     "DevGethProcess",
+    "DevGethProcessPool",
+    "GethConfig",
+    "stop_all",
 )
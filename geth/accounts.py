@@ -2,8 +2,19 @@ from __future__ import (
     annotations,
 )
 
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+import datetime
+import json
 import os
 import re
+import secrets
+import tempfile
+from typing import (
+    Any,
+)
 
 from typing_extensions import (
     Unpack,
@@ -16,6 +27,7 @@ from geth.types import (
     GethKwargsTypedDict,
 )
 from geth.utils.validation import (
+    get_geth_config,
     validate_geth_kwargs,
 )
 
@@ -27,23 +39,93 @@ from .wrapper import (
 )
 
 
+def get_keystore_dir(data_dir: str) -> str:
+    return os.path.join(data_dir, "keystore")
+
+
+keystore_address_regex = re.compile(r"(?:0x)?([a-fA-F0-9]{40})")
+
+# keystore dir -> (file names, accounts)
+_keystore_accounts_cache: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {}
+
+
+def get_keystore_accounts(
+    keystore_dir: str, use_cache: bool = False
+) -> tuple[str, ...] | tuple[()]:
+    """
+    Reads the account addresses from the key files in a geth keystore directory,
+    in the same order as ``geth account list``.  With ``use_cache`` the key files
+    are only read again when the names of the files in the directory change.
+    """
+    try:
+        file_names = tuple(sorted(os.listdir(keystore_dir)))
+    except FileNotFoundError:
+        return tuple()
+
+    if use_cache and keystore_dir in _keystore_accounts_cache:
+        cached_file_names, cached_accounts = _keystore_accounts_cache[keystore_dir]
+        if cached_file_names == file_names:
+            return cached_accounts
+
+    accounts: list[str] = []
+    for file_name in file_names:
+        # geth ignores hidden files and editor backups in the keystore
+        if file_name.startswith(".") or file_name.endswith("~"):
+            continue
+
+        file_path = os.path.join(keystore_dir, file_name)
+        if not os.path.isfile(file_path):
+            continue
+
+        try:
+            with open(file_path) as key_file:
+                key_data = json.load(key_file)
+        except (OSError, ValueError):
+            continue
+
+        address = key_data.get("address") if isinstance(key_data, dict) else None
+        if not isinstance(address, str):
+            continue
+        address_match = keystore_address_regex.fullmatch(address)
+        if not address_match:
+            continue
+
+        account = "0x" + address_match.group(1).lower()
+        if account not in accounts:
+            accounts.append(account)
+
+    if use_cache:
+        _keystore_accounts_cache[keystore_dir] = (file_names, tuple(accounts))
+    return tuple(accounts)
+
+
 def get_accounts(
+    use_subprocess: bool = False,
+    use_cache: bool = False,
     **geth_kwargs: Unpack[GethKwargsTypedDict],
 ) -> tuple[str, ...] | tuple[()]:
     """
     Returns all geth accounts as tuple of hex encoded strings
 
+    Accounts are read directly from ``<data_dir>/keystore``.  Pass
+    ``use_cache=True`` to reuse the accounts until the key files in the keystore
+    change, or ``use_subprocess=True`` to ask ``geth account list`` instead.
+
     >>> get_accounts(data_dir='some/data/dir')
     ... ('0x...', '0x...')
     """
-    validate_geth_kwargs(geth_kwargs)
+    geth_config = get_geth_config(geth_kwargs)
 
-    if not geth_kwargs.get("data_dir"):
+    data_dir = geth_config.data_dir
+    if not data_dir:
         raise PyGethValueError("data_dir is required to get accounts")
 
-    geth_kwargs["suffix_args"] = ["account", "list"]
+    if not use_subprocess:
+        return get_keystore_accounts(get_keystore_dir(data_dir), use_cache)
 
-    command, proc = spawn_geth(geth_kwargs)
+    command, proc = spawn_geth(
+        geth_config.model_copy(update={"suffix_args": ["account", "list"]})
+    )
     stdoutdata, stderrdata = proc.communicate()
 
     if proc.returncode:
@@ -139,7 +221,7 @@ def create_new_account(**geth_kwargs: Unpack[GethKwargsTypedDict]) -> str:
     password = geth_kwargs.get("password")
 
     geth_kwargs.update({"suffix_args": ["account", "new"]})
-    validate_geth_kwargs(geth_kwargs)
+    geth_config = get_geth_config(geth_kwargs)
 
     if isinstance(password, str):
         if not os.path.exists(password):
@@ -149,7 +231,7 @@ def create_new_account(**geth_kwargs: Unpack[GethKwargsTypedDict]) -> str:
             "Password must be either a str (path to a file) or bytes"
         )
 
-    command, proc = spawn_geth(geth_kwargs)
+    command, proc = spawn_geth(geth_config)
 
     if isinstance(password, str):
         stdoutdata, stderrdata = proc.communicate()
@@ -182,11 +264,139 @@ def create_new_account(**geth_kwargs: Unpack[GethKwargsTypedDict]) -> str:
     return "0x" + match.groups()[0].decode()
 
 
+def _read_password(password: bytes | str) -> bytes:
+    if isinstance(password, str):
+        with open(password, "rb") as password_file:
+            password = password_file.read()
+    # like geth, only the first line of the password is used
+    lines = password.splitlines()
+    return lines[0] if lines else b""
+
+
+def write_keyfile(keystore_dir: str, key_data: dict[str, Any]) -> str:
+    """
+    Atomically writes a key file into the keystore using geth's file naming scheme.
+    Returns the path of the new file.
+    """
+    timestamp = datetime.datetime.now(datetime.timezone.utc).strftime(
+        "%Y-%m-%dT%H-%M-%S.%f000Z"
+    )
+    file_path = os.path.join(keystore_dir, f"UTC--{timestamp}--{key_data['address']}")
+
+    # geth ignores hidden files so a partially written key is never picked up
+    fd, scratch_path = tempfile.mkstemp(dir=keystore_dir, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w") as scratch_file:
+            json.dump(key_data, scratch_file)
+        os.chmod(scratch_path, 0o600)
+        os.replace(scratch_path, file_path)
+    except BaseException:
+        os.remove(scratch_path)
+        raise
+    return file_path
+
+
+def _create_keyfile(keystore_dir: str, password: bytes, kdf_iterations: int) -> str:
+    try:
+        from eth_keyfile import (
+            create_keyfile_json,
+        )
+    except ImportError:
+        raise PyGethValueError(
+            "Creating accounts in-process requires the `eth-keyfile` package.  "
+            "Install it with `python -m pip install py-geth[keyfile]`"
+        )
+
+    key_data = create_keyfile_json(
+        secrets.token_bytes(32),
+        password,
+        kdf="scrypt",
+        iterations=kdf_iterations,
+    )
+    address: str = key_data["address"].lower()
+    key_data["address"] = address
+    write_keyfile(keystore_dir, key_data)
+    return "0x" + address
+
+
+def create_new_accounts(
+    count: int,
+    kdf_iterations: int | None = None,
+    jobs: int | None = None,
+    **geth_kwargs: Unpack[GethKwargsTypedDict],
+) -> tuple[str, ...]:
+    r"""
+    Creates ``count`` new accounts in the keystore of ``data_dir``, running up to
+    ``jobs`` (default: one per CPU) key derivations in parallel.
+
+    By default each account is created by its own ``geth account new`` process.
+    When ``kdf_iterations`` is given the key files are instead generated with
+    ``eth-keyfile`` in a process pool, using that scrypt work factor (``N``).  A
+    small value such as ``2`` makes creating thousands of accounts for a dev chain
+    nearly free, at the cost of the key files being trivial to brute-force.
+
+    :param \**geth_kwargs: same as for :func:`create_new_account`
+    :return: the new accounts as 0x prefixed hex strings
+    """
+    if count < 0:
+        raise PyGethValueError("count must not be negative")
+
+    data_dir = geth_kwargs.get("data_dir")
+    if not data_dir:
+        raise PyGethValueError("data_dir is required to create new accounts")
+
+    password = geth_kwargs.get("password")
+    if not password:
+        raise PyGethValueError("password is required to create new accounts")
+
+    validate_geth_kwargs(geth_kwargs)
+
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    jobs = max(1, min(jobs, count))
+
+    if kdf_iterations is None:
+        # each `geth account new` is its own process, so threads are enough to
+        # run the key derivations in parallel.
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(create_new_account, **geth_kwargs) for _ in range(count)
+            ]
+            return tuple(future.result() for future in futures)
+
+    keystore_dir = get_keystore_dir(data_dir)
+    os.makedirs(keystore_dir, mode=0o700, exist_ok=True)
+    password_bytes = _read_password(password)
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(
+                _create_keyfile, keystore_dir, password_bytes, kdf_iterations
+            )
+            for _ in range(count)
+        ]
+        return tuple(future.result() for future in futures)
+
+
+DEFAULT_ACCOUNT_BALANCE = "1000000000000000000000000000000"
+
+
+def get_genesis_alloc(
+    accounts: tuple[str, ...] | list[str], balance: str = DEFAULT_ACCOUNT_BALANCE
+) -> dict[str, dict[str, Any]]:
+    """
+    Builds the ``alloc`` section of genesis data funding each of ``accounts``.
+
+    >>> genesis_data["alloc"].update(get_genesis_alloc(accounts))
+    """
+    return {account: {"balance": balance} for account in accounts}
+
+
 def ensure_account_exists(**geth_kwargs: Unpack[GethKwargsTypedDict]) -> str:
     if not geth_kwargs.get("data_dir"):
         raise PyGethValueError("data_dir is required to get accounts")
 
-    validate_geth_kwargs(geth_kwargs)
+    # ``get_accounts`` validates geth_kwargs
     accounts = get_accounts(**geth_kwargs)
     if not accounts:
         account = create_new_account(**geth_kwargs)
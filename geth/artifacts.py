@@ -0,0 +1,141 @@
+"""
+Cache of installation artifacts, i.e. source tarballs and geth binaries.
+
+Artifacts are addressed by a hash of everything that determines their content:
+their kind, the geth version, the platform and architecture and, for binaries
+built from source, the Go version.  Lookups check the local, writable cache
+first and then any number of read-only shared caches, e.g. an NFS mount or a
+directory baked into a CI image, so that each version only needs to be built
+once per fleet.
+"""
+from __future__ import (
+    annotations,
+)
+
+import functools
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+
+from geth.utils.filesystem import (
+    clone_file,
+    get_file_sha256,
+    publish_dir,
+)
+
+ARTIFACT_METADATA_FILENAME = "artifact.json"
+
+
+def get_local_artifact_cache_dir() -> str:
+    if "GETH_ARTIFACT_CACHE_DIR" in os.environ:
+        return os.environ["GETH_ARTIFACT_CACHE_DIR"]
+    return os.path.expanduser(
+        os.path.join(
+            "~",
+            ".py-geth",
+            "cache",
+        )
+    )
+
+
+def get_shared_artifact_cache_dirs() -> list[str]:
+    """
+    Read-only caches listed in ``GETH_SHARED_ARTIFACT_CACHE_DIRS``, separated by
+    ``os.pathsep``.
+    """
+    shared_dirs = os.environ.get("GETH_SHARED_ARTIFACT_CACHE_DIRS", "")
+    return [path for path in shared_dirs.split(os.pathsep) if path]
+
+
+@functools.cache
+def _get_go_version(go_executable: str) -> str | None:
+    try:
+        output = subprocess.check_output(
+            [go_executable, "env", "GOVERSION"], stderr=subprocess.DEVNULL
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode().strip() or None
+
+
+def get_go_version() -> str | None:
+    """
+    The version of the Go toolchain that would build geth, or ``None`` if it is
+    not available.
+    """
+    return _get_go_version(os.environ.get("GO_BINARY", "go"))
+
+
+def get_artifact_key(
+    kind: str,
+    identifier: str,
+    platform: str | None = None,
+    arch: str | None = None,
+    go_version: str | None = None,
+) -> str:
+    key = hashlib.sha256()
+    for part in (kind, identifier, platform, arch, go_version):
+        key.update((part or "").encode())
+        key.update(b"\x00")
+    return key.hexdigest()
+
+
+def get_artifact_dir(cache_dir: str, artifact_key: str) -> str:
+    return os.path.join(cache_dir, artifact_key[:2], artifact_key)
+
+
+def _is_valid_artifact(artifact_dir: str, filename: str) -> bool:
+    # the file must match the digest recorded when it was stored, anything else
+    # is a truncated, corrupted or tampered with copy
+    try:
+        with open(os.path.join(artifact_dir, ARTIFACT_METADATA_FILENAME)) as f:
+            sha256: str | None = json.load(f).get("sha256")
+        return sha256 == get_file_sha256(os.path.join(artifact_dir, filename))
+    except (OSError, ValueError):
+        return False
+
+
+def find_artifact(artifact_key: str, filename: str) -> str | None:
+    """
+    Returns the path of the cached artifact, looking in the local cache before the
+    shared caches, or ``None`` if it has not been cached.  Artifacts that do not
+    match the sha256 recorded in their metadata are skipped.
+    """
+    cache_dirs = [get_local_artifact_cache_dir(), *get_shared_artifact_cache_dirs()]
+    for cache_dir in cache_dirs:
+        artifact_dir = get_artifact_dir(cache_dir, artifact_key)
+        if _is_valid_artifact(artifact_dir, filename):
+            return os.path.join(artifact_dir, filename)
+    return None
+
+
+def store_artifact(
+    artifact_key: str, filename: str, path: str, **metadata: str | None
+) -> str:
+    """
+    Copies the file at ``path`` into the local cache and returns its cached path.
+    ``metadata`` is stored next to it to make the cache easier to inspect, along
+    with the sha256 that ``find_artifact`` verifies.
+    """
+    artifact_dir = get_artifact_dir(get_local_artifact_cache_dir(), artifact_key)
+    artifact_path = os.path.join(artifact_dir, filename)
+    if _is_valid_artifact(artifact_dir, filename):
+        return artifact_path
+    if os.path.isdir(artifact_dir):
+        # replace a corrupted copy
+        shutil.rmtree(artifact_dir, ignore_errors=True)
+
+    def populate(scratch_dir: str) -> None:
+        scratch_path = os.path.join(scratch_dir, filename)
+        clone_file(path, scratch_path)
+        with open(os.path.join(scratch_dir, ARTIFACT_METADATA_FILENAME), "w") as f:
+            json.dump(
+                dict(metadata, filename=filename, sha256=get_file_sha256(scratch_path)),
+                f,
+                sort_keys=True,
+            )
+
+    publish_dir(artifact_dir, populate)
+    return artifact_path
@@ -0,0 +1,236 @@
+from __future__ import (
+    annotations,
+)
+
+import asyncio
+from collections.abc import (
+    Awaitable,
+    Callable,
+)
+import logging
+import os
+import threading
+from types import (
+    TracebackType,
+)
+from typing import (
+    Any,
+)
+
+from geth.exceptions import (
+    PyGethTypeError,
+    PyGethValueError,
+)
+from geth.process import (
+    BaseGethProcess,
+    DevGethProcess,
+)
+from geth.utils.proc import (
+    async_kill_proc,
+)
+from geth.utils.readiness import (
+    READINESS_POLL_INTERVAL,
+)
+from geth.utils.timeout import (
+    Timeout,
+)
+
+logger = logging.getLogger(__name__)
+
+# maximum length of a single line of geth output
+STREAM_LINE_LIMIT = 2**20
+
+
+class AsyncBaseGethProcess(BaseGethProcess):
+    """
+    asyncio counterpart of ``BaseGethProcess``.  ``start``, ``stop`` and the
+    ``wait_for_*`` methods are coroutines, the subprocess is launched with
+    ``asyncio.create_subprocess_exec`` and its output is read by tasks on the
+    running event loop instead of by threads.
+
+    Mix it in ahead of a concrete process class::
+
+        class AsyncMainnetGethProcess(AsyncBaseGethProcess, MainnetGethProcess):
+            pass
+    """
+
+    async_proc: asyncio.subprocess.Process | None
+
+    stdout_callbacks: list[Callable[[bytes], None]]
+    stderr_callbacks: list[Callable[[bytes], None]]
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.async_proc = None
+        self.stdout_callbacks = []
+        self.stderr_callbacks = []
+        self._stream_tasks: list[asyncio.Task[None]] = []
+        self._readiness_changed = asyncio.Event()
+
+    def register_stdout_callback(self, callback_fn: Callable[[bytes], None]) -> None:
+        self.stdout_callbacks.append(callback_fn)
+
+    def register_stderr_callback(self, callback_fn: Callable[[bytes], None]) -> None:
+        self.stderr_callbacks.append(callback_fn)
+
+    async def _consume_stream(
+        self,
+        stream: asyncio.StreamReader,
+        callbacks: list[Callable[[bytes], None]],
+        is_stderr: bool,
+    ) -> None:
+        async for line in stream:
+            if is_stderr:
+                self.readiness.feed(line)
+                self._readiness_changed.set()
+            stripped_line = line.strip()
+            for fn in callbacks:
+                fn(stripped_line)
+
+    async def start(self) -> None:  # type: ignore[override]
+        if self.is_running:
+            raise PyGethValueError("Already running")
+        self.is_running = True
+        self.readiness.reset()
+        self.reserve_ports()
+
+        logger.info(f"Launching geth: {' '.join(self.command)}")
+        self.async_proc = await asyncio.create_subprocess_exec(
+            *self.command,
+            stdin=self.stdin,
+            stdout=self.stdout,
+            stderr=self.stderr,
+            limit=STREAM_LINE_LIMIT,
+        )
+
+        self._stream_tasks = []
+        if self.async_proc.stdout is not None:
+            self._stream_tasks.append(
+                asyncio.create_task(
+                    self._consume_stream(
+                        self.async_proc.stdout, self.stdout_callbacks, False
+                    )
+                )
+            )
+        if self.async_proc.stderr is not None:
+            self._stream_tasks.append(
+                asyncio.create_task(
+                    self._consume_stream(
+                        self.async_proc.stderr, self.stderr_callbacks, True
+                    )
+                )
+            )
+
+    async def stop(self) -> None:  # type: ignore[override]
+        if not self.is_running or self.async_proc is None:
+            raise PyGethValueError("Not running")
+
+        self.shutdown_stage = await async_kill_proc(
+            self.async_proc, self.shutdown_policy
+        )
+
+        if self._stream_tasks:
+            # the streams reach EOF once the process has exited
+            _, pending = await asyncio.wait(self._stream_tasks, timeout=5)
+            for task in pending:
+                task.cancel()
+            self._stream_tasks = []
+
+        self.release_ports()
+        self.is_running = False
+
+    def __enter__(self) -> BaseGethProcess:
+        raise PyGethTypeError(
+            f"{type(self).__name__} must be used with `async with`, not `with`"
+        )
+
+    async def __aenter__(self) -> AsyncBaseGethProcess:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.stop()
+
+    @property
+    def is_alive(self) -> bool:
+        return (
+            self.is_running
+            and self.async_proc is not None
+            and self.async_proc.returncode is None
+        )
+
+    @property
+    def is_stopped(self) -> bool:
+        return self.async_proc is not None and self.async_proc.returncode is not None
+
+    async def _is_rpc_connectable(self) -> bool:
+        try:
+            _, writer = await asyncio.open_connection(self.rpc_host, int(self.rpc_port))
+        except OSError:
+            return False
+        writer.close()
+        return True
+
+    async def _is_ipc_connectable(self) -> bool:
+        if not os.path.exists(self.ipc_path):
+            return False
+        try:
+            _, writer = await asyncio.open_unix_connection(self.ipc_path)
+        except OSError:
+            return False
+        writer.close()
+        return True
+
+    async def _wait_for_readiness(
+        self,
+        ready_event: threading.Event,
+        probe: Callable[[], Awaitable[bool]],
+        timeout: int,
+    ) -> None:
+        async def is_ready() -> bool:
+            self._readiness_changed.clear()
+            return ready_event.is_set() or await probe()
+
+        async def wait_until_ready() -> None:
+            while not await is_ready():
+                try:
+                    await asyncio.wait_for(
+                        self._readiness_changed.wait(), READINESS_POLL_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+        if await is_ready():
+            return
+        try:
+            await asyncio.wait_for(wait_until_ready(), timeout)
+        except asyncio.TimeoutError:
+            raise Timeout(timeout)
+
+    async def wait_for_rpc(self, timeout: int = 0) -> None:  # type: ignore[override]
+        if not self.rpc_enabled:
+            raise PyGethValueError("RPC interface is not enabled")
+        await self._wait_for_readiness(
+            self.readiness.rpc_ready, self._is_rpc_connectable, timeout
+        )
+
+    async def wait_for_ipc(self, timeout: int = 0) -> None:  # type: ignore[override]
+        if not self.ipc_enabled:
+            raise PyGethValueError("IPC interface is not enabled")
+        await self._wait_for_readiness(
+            self.readiness.ipc_ready, self._is_ipc_connectable, timeout
+        )
+
+
+class AsyncDevGethProcess(AsyncBaseGethProcess, DevGethProcess):
+    """
+    asyncio counterpart of ``DevGethProcess``.
+
+    Constructing the process still creates the account and initializes the chain
+    synchronously.
+    """
@@ -2,10 +2,13 @@ from __future__ import (
     annotations,
 )
 
+import hashlib
 import json
 import os
+import shutil
 import subprocess
 import sys
+import tempfile
 
 from typing_extensions import (
     Unpack,
@@ -22,8 +25,10 @@ from .utils.encoding import (
     force_obj_to_text,
 )
 from .utils.filesystem import (
+    copy_tree,
     ensure_path_exists,
     is_same_path,
+    publish_dir,
 )
 from .utils.validation import (
     validate_genesis_data,
@@ -147,3 +152,117 @@ def initialize_chain(genesis_data: GenesisDataTypedDict, data_dir: str) -> None:
             f"    stdout={stdoutdata.decode()}\n"
             f"    stderr={stderrdata.decode()}"
         )
+
+
+#
+# Pre-initialized data directory templates
+#
+def get_chain_template_cache_dir() -> str:
+    if "GETH_TEMPLATE_CACHE_DIR" in os.environ:
+        return os.environ["GETH_TEMPLATE_CACHE_DIR"]
+    return os.path.expanduser(
+        os.path.join(
+            "~",
+            ".py-geth",
+            "templates",
+        )
+    )
+
+
+def get_chain_template_key(
+    geth_version: str,
+    genesis_data: GenesisDataTypedDict,
+    password: bytes | str,
+) -> str:
+    """
+    Content address of an initialized data directory.  ``password`` is either
+    the password itself or the path to a file containing it.
+    """
+    if isinstance(password, str):
+        with open(password, "rb") as password_file:
+            password = password_file.read()
+
+    key = hashlib.sha256()
+    key.update(geth_version.encode())
+    key.update(b"\x00")
+    key.update(json.dumps(genesis_data, sort_keys=True).encode())
+    key.update(b"\x00")
+    key.update(password)
+    return key.hexdigest()
+
+
+def get_chain_template_path(template_key: str) -> str:
+    return os.path.join(get_chain_template_cache_dir(), template_key)
+
+
+def restore_chain_template(template_key: str, data_dir: str) -> bool:
+    """
+    Clone a cached template into ``data_dir``.  Returns ``False`` if no template
+    has been stored for ``template_key``.
+    """
+    template_path = get_chain_template_path(template_key)
+    if not os.path.isdir(template_path):
+        return False
+    copy_tree(template_path, data_dir)
+    return True
+
+
+def store_chain_template(template_key: str, data_dir: str) -> None:
+    template_path = get_chain_template_path(template_key)
+    if os.path.isdir(template_path):
+        return
+
+    publish_dir(template_path, lambda scratch_path: copy_tree(data_dir, scratch_path))
+
+
+def get_chain_snapshots_dir(data_dir: str) -> str:
+    """
+    Snapshots of a data directory are kept next to it rather than inside it, so
+    that restoring a snapshot can replace the data directory wholesale.
+    """
+    return os.path.abspath(data_dir).rstrip(os.sep) + ".snapshots"
+
+
+def store_chain_snapshot(data_dir: str, snapshot_id: str) -> str:
+    snapshot_path = os.path.join(get_chain_snapshots_dir(data_dir), snapshot_id)
+    copy_tree(data_dir, snapshot_path)
+    return snapshot_path
+
+
+def get_chain_snapshot_path(data_dir: str, snapshot_id: str) -> str:
+    snapshot_path = os.path.join(get_chain_snapshots_dir(data_dir), snapshot_id)
+    if not os.path.isdir(snapshot_path):
+        raise PyGethValueError(f"No snapshot found at {snapshot_path}")
+    return snapshot_path
+
+
+def restore_chain_snapshot(data_dir: str, snapshot_id: str) -> None:
+    snapshot_path = get_chain_snapshot_path(data_dir, snapshot_id)
+
+    # copy into a scratch directory next to the data directory first, so that a
+    # failed copy leaves the current chain state in place.
+    data_dir = os.path.abspath(data_dir).rstrip(os.sep)
+    scratch_path = tempfile.mkdtemp(dir=os.path.dirname(data_dir), prefix=".tmp-")
+    try:
+        copy_tree(snapshot_path, scratch_path)
+    except OSError:
+        shutil.rmtree(scratch_path, ignore_errors=True)
+        raise
+
+    replaced_path = f"{scratch_path}.replaced"
+    os.rename(data_dir, replaced_path)
+    try:
+        os.rename(scratch_path, data_dir)
+    except OSError:
+        os.rename(replaced_path, data_dir)
+        shutil.rmtree(scratch_path, ignore_errors=True)
+        raise
+    shutil.rmtree(replaced_path)
+
+
+def delete_chain_snapshot(data_dir: str, snapshot_id: str) -> None:
+    shutil.rmtree(get_chain_snapshot_path(data_dir, snapshot_id))
+
+
+def delete_chain_snapshots(data_dir: str) -> None:
+    shutil.rmtree(get_chain_snapshots_dir(data_dir), ignore_errors=True)
@@ -0,0 +1,481 @@
+"""
+A fast, pure python stand-in for the ``geth`` executable.
+
+It implements the subcommands py-geth runs (``version``, ``account list``,
+``account new``, ``init`` and ``removedb``) and a node that serves a minimal
+JSON-RPC API over HTTP and IPC, logging the same readiness lines as geth.  There
+is no actual chain: blocks are only "mined" every ``--dev.period`` seconds and
+keys are not encrypted.  Point ``GETH_BINARY`` at it to run py-geth, or code
+built on it, without building geth:
+
+    $ GETH_BINARY="$(which py-geth-fake-geth)" pytest
+
+or run it as ``python -m geth.fake_geth``.  ``FAKE_GETH_VERSION`` sets the version
+it reports and ``FAKE_GETH_LOG_LINES`` how many extra log lines the node writes once
+it is ready.  The node only runs on posix platforms.
+"""
+from __future__ import (
+    annotations,
+)
+
+from collections.abc import (
+    Callable,
+)
+import datetime
+import http.server
+import json
+import os
+import platform
+import secrets
+import shutil
+import signal
+import socketserver
+import sys
+import threading
+from typing import (
+    Any,
+)
+import uuid
+
+from geth.exceptions import (
+    PyGethException,
+)
+
+DEFAULT_FAKE_GETH_VERSION = "1.16.7-stable"
+
+DEFAULT_DEV_CHAIN_ID = 1337
+
+# flags that are not followed by a value, every other flag takes one
+SWITCH_FLAGS = frozenset(
+    (
+        "--dev",
+        "--http",
+        "--ws",
+        "--ipcdisable",
+        "--nodiscover",
+        "--mainnet",
+        "--sepolia",
+    )
+)
+
+# written by ``init`` so that the node knows its chain id
+GENESIS_FILENAME = "fake-geth-genesis.json"
+
+# the rest of the JSON-RPC error codes are never returned
+PARSE_ERROR = -32700
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+
+
+def get_fake_geth_version() -> str:
+    return os.environ.get("FAKE_GETH_VERSION", DEFAULT_FAKE_GETH_VERSION)
+
+
+def log(level: str, message: str, **context: Any) -> None:
+    """
+    Writes a log line to stderr in the format geth uses.
+    """
+    timestamp = datetime.datetime.now().strftime("%m-%d|%H:%M:%S.%f")[:-3]
+    line = f"{level:<5} [{timestamp}] {message:<40}"
+    if context:
+        line += " " + " ".join(f"{key}={value}" for key, value in context.items())
+    sys.stderr.write(line.rstrip() + "\n")
+    sys.stderr.flush()
+
+
+def fatal(message: str) -> int:
+    sys.stderr.write(f"Fatal: {message}\n")
+    return 1
+
+
+def parse_args(args: list[str]) -> tuple[dict[str, Any], list[str]]:
+    """
+    Splits ``args`` into a dict of flags, with ``True`` for switches, and the
+    subcommand with its arguments.
+    """
+    options: dict[str, Any] = {}
+    commands: list[str] = []
+    arg_iter = iter(args)
+    for arg in arg_iter:
+        if not arg.startswith("-"):
+            commands.append(arg)
+            continue
+        flag, has_value, value = arg.partition("=")
+        flag = "--" + flag.lstrip("-")
+        if has_value:
+            options[flag] = value
+        elif flag in SWITCH_FLAGS:
+            options[flag] = True
+        else:
+            options[flag] = next(arg_iter, "")
+    return options, commands
+
+
+def get_data_dir(options: dict[str, Any]) -> str:
+    return str(options.get("--datadir") or os.path.expanduser("~/.ethereum"))
+
+
+def get_keystore_dir(options: dict[str, Any]) -> str:
+    return str(
+        options.get("--keystore") or os.path.join(get_data_dir(options), "keystore")
+    )
+
+
+def read_keystore_accounts(keystore_dir: str) -> list[tuple[str, str]]:
+    """
+    Returns the ``(address, key file path)`` of each key in ``keystore_dir``.
+    """
+    if not os.path.isdir(keystore_dir):
+        return []
+
+    accounts = []
+    for file_name in sorted(os.listdir(keystore_dir)):
+        file_path = os.path.join(keystore_dir, file_name)
+        if file_name.startswith(".") or not os.path.isfile(file_path):
+            continue
+        try:
+            with open(file_path) as key_file:
+                address = json.load(key_file)["address"]
+        except (OSError, ValueError, KeyError, TypeError):
+            continue
+        accounts.append((str(address).lower().removeprefix("0x"), file_path))
+    return accounts
+
+
+#
+# Subcommands
+#
+def print_version() -> int:
+    print("Geth")
+    print(f"Version: {get_fake_geth_version()}")
+    print(f"Architecture: {platform.machine()}")
+    print(f"Go Version: go1.24.0 (python {platform.python_version()})")
+    print(f"Operating System: {sys.platform}")
+    return 0
+
+
+def list_accounts(options: dict[str, Any]) -> int:
+    for index, (address, file_path) in enumerate(
+        read_keystore_accounts(get_keystore_dir(options))
+    ):
+        print(f"Account #{index}: {{{address}}} keystore://{file_path}")
+    return 0
+
+
+def new_account(options: dict[str, Any]) -> int:
+    password_path = options.get("--password")
+    if password_path:
+        if not os.path.isfile(password_path):
+            return fatal(f"Failed to read password file: {password_path}")
+    else:
+        # the password and its confirmation
+        sys.stdin.readline()
+        sys.stdin.readline()
+
+    keystore_dir = get_keystore_dir(options)
+    os.makedirs(keystore_dir, mode=0o700, exist_ok=True)
+
+    address = secrets.token_hex(20)
+    timestamp = datetime.datetime.now(datetime.timezone.utc).strftime(
+        "%Y-%m-%dT%H-%M-%S.%f000Z"
+    )
+    file_path = os.path.join(keystore_dir, f"UTC--{timestamp}--{address}")
+    # a placeholder for the encrypted key, which the fake node never needs
+    key_data = {"address": address, "crypto": {}, "id": str(uuid.uuid4())}
+    with open(file_path, "w") as key_file:
+        json.dump(dict(key_data, version=3), key_file)
+
+    print("\nYour new key was generated\n")
+    print(f"Public address of the key:   0x{address}")
+    print(f"Path of the secret key file: {file_path}\n")
+    return 0
+
+
+def init_chain(options: dict[str, Any], genesis_path: str | None) -> int:
+    if genesis_path is None:
+        return fatal("need genesis.json file as the only argument")
+    try:
+        with open(genesis_path) as genesis_file:
+            genesis_data = json.load(genesis_file)
+    except (OSError, ValueError) as e:
+        return fatal(f"Failed to read genesis file: {e}")
+
+    chaindata_dir = os.path.join(get_data_dir(options), "geth", "chaindata")
+    os.makedirs(chaindata_dir, exist_ok=True)
+    with open(os.path.join(chaindata_dir, GENESIS_FILENAME), "w") as f:
+        json.dump(genesis_data, f)
+
+    log("INFO", "Successfully wrote genesis state", database="chaindata")
+    return 0
+
+
+def remove_db(options: dict[str, Any]) -> int:
+    chaindata_dir = os.path.join(get_data_dir(options), "geth", "chaindata")
+    log("INFO", "Removing chaindata", path=chaindata_dir)
+    shutil.rmtree(chaindata_dir, ignore_errors=True)
+    return 0
+
+
+#
+# Node
+#
+class RPCError(PyGethException):
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class FakeGethNode:
+    """
+    The JSON-RPC API and the state of a running fake node.
+    """
+
+    def __init__(self, options: dict[str, Any]) -> None:
+        self.options = options
+        self.data_dir = get_data_dir(options)
+        self.keystore_dir = get_keystore_dir(options)
+        self.chain_id = self._get_chain_id()
+        self.block_number = 0
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+
+        self.methods: dict[str, Callable[..., Any]] = {
+            "web3_clientVersion": self.web3_client_version,
+            "net_version": self.net_version,
+            "net_listening": lambda: True,
+            "net_peerCount": lambda: "0x0",
+            "eth_chainId": lambda: hex(self.chain_id),
+            "eth_blockNumber": self.eth_block_number,
+            "eth_accounts": self.eth_accounts,
+            "eth_coinbase": self.eth_coinbase,
+            "eth_syncing": lambda: False,
+            "debug_setHead": self.debug_set_head,
+        }
+
+    def _get_chain_id(self) -> int:
+        genesis_path = os.path.join(
+            self.data_dir, "geth", "chaindata", GENESIS_FILENAME
+        )
+        try:
+            with open(genesis_path) as genesis_file:
+                return int(json.load(genesis_file)["config"]["chainId"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        if "--dev" in self.options:
+            return DEFAULT_DEV_CHAIN_ID
+        return int(self.options.get("--networkid") or 1)
+
+    def web3_client_version(self) -> str:
+        return f"Geth/v{get_fake_geth_version()}/{sys.platform}/fake"
+
+    def net_version(self) -> str:
+        return str(self.options.get("--networkid") or self.chain_id)
+
+    def eth_block_number(self) -> str:
+        with self.lock:
+            return hex(self.block_number)
+
+    def eth_accounts(self) -> list[str]:
+        return [
+            f"0x{address}" for address, _ in read_keystore_accounts(self.keystore_dir)
+        ]
+
+    def eth_coinbase(self) -> str:
+        accounts = self.eth_accounts()
+        return accounts[0] if accounts else "0x" + "00" * 20
+
+    def debug_set_head(self, number: str) -> None:
+        try:
+            block_number = int(number, 16)
+        except (TypeError, ValueError):
+            raise RPCError(INVALID_PARAMS, f"invalid block number: {number!r}")
+        with self.lock:
+            if block_number > self.block_number:
+                raise RPCError(
+                    INVALID_PARAMS, f"block {block_number} is beyond the head"
+                )
+            self.block_number = block_number
+        log("INFO", "Rewinding blockchain to block", target=block_number)
+
+    def handle_request(self, request: Any) -> dict[str, Any]:
+        request_id = request.get("id") if isinstance(request, dict) else None
+        response: dict[str, Any] = {"jsonrpc": "2.0", "id": request_id}
+        try:
+            if not isinstance(request, dict):
+                raise RPCError(PARSE_ERROR, "invalid request")
+            method = self.methods.get(request.get("method", ""))
+            if method is None:
+                raise RPCError(
+                    METHOD_NOT_FOUND,
+                    f"the method {request.get('method')} does not "
+                    "exist/is not available",
+                )
+            try:
+                response["result"] = method(*request.get("params") or [])
+            except TypeError as e:
+                raise RPCError(INVALID_PARAMS, str(e))
+        except RPCError as e:
+            response["error"] = {"code": e.code, "message": e.message}
+        return response
+
+    def handle_payload(self, payload: Any) -> Any:
+        # a list of requests is a batch
+        if isinstance(payload, list):
+            return [self.handle_request(request) for request in payload]
+        return self.handle_request(payload)
+
+    def mine(self, period: float) -> None:
+        while not self.stopped.wait(period):
+            with self.lock:
+                self.block_number += 1
+                block_number = self.block_number
+            log("INFO", "Successfully sealed new block", number=block_number)
+
+    def serve_http(self) -> http.server.ThreadingHTTPServer:
+        node = self
+
+        class RPCRequestHandler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                self._respond(b"")
+
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                try:
+                    response = node.handle_payload(json.loads(body))
+                except ValueError:
+                    response = {
+                        "jsonrpc": "2.0",
+                        "id": None,
+                        "error": {"code": PARSE_ERROR, "message": "parse error"},
+                    }
+                self._respond(json.dumps(response).encode("utf-8"))
+
+            def _respond(self, body: bytes) -> None:
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        host = self.options.get("--http.addr") or "127.0.0.1"
+        port = int(self.options.get("--http.port") or 8545)
+        server = http.server.ThreadingHTTPServer((host, port), RPCRequestHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        log(
+            "INFO",
+            "HTTP server started",
+            endpoint=f"{host}:{port}",
+            auth="false",
+            prefix="",
+            cors=self.options.get("--http.corsdomain", ""),
+            vhosts="localhost",
+        )
+        return server
+
+    def serve_ipc(self, ipc_path: str) -> socketserver.ThreadingUnixStreamServer:
+        node = self
+
+        class IPCRequestHandler(socketserver.BaseRequestHandler):
+            def handle(self) -> None:
+                decoder = json.JSONDecoder()
+                buffer = ""
+                while True:
+                    chunk = self.request.recv(4096)
+                    if not chunk:
+                        return
+                    buffer += chunk.decode("utf-8")
+                    # requests are concatenated JSON values without delimiters
+                    while buffer.strip():
+                        try:
+                            payload, end = decoder.raw_decode(buffer.lstrip())
+                        except ValueError:
+                            # the request is incomplete
+                            break
+                        buffer = buffer.lstrip()[end:]
+                        response = node.handle_payload(payload)
+                        self.request.sendall(json.dumps(response).encode() + b"\n")
+
+        # geth creates the directory of the socket too
+        os.makedirs(os.path.dirname(os.path.abspath(ipc_path)), exist_ok=True)
+        if os.path.exists(ipc_path):
+            os.remove(ipc_path)
+        server = socketserver.ThreadingUnixStreamServer(ipc_path, IPCRequestHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        log("INFO", "IPC endpoint opened", url=ipc_path)
+        return server
+
+    def run(self) -> int:
+        # block the shutdown signals before any thread is started, so that every
+        # thread inherits the mask and only ``sigwait`` below receives them
+        shutdown_signals = {signal.SIGINT, signal.SIGTERM}
+        signal.pthread_sigmask(signal.SIG_BLOCK, shutdown_signals)
+
+        log("INFO", "Starting Geth (fake)", version=get_fake_geth_version())
+        if "--dev" in self.options:
+            coinbase = self.eth_coinbase()
+            log("INFO", "Using developer account", address=coinbase)
+
+        if "--http" in self.options:
+            self.serve_http()
+        if "--ws" in self.options:
+            log(
+                "INFO",
+                "WebSocket enabled (not served by fake geth)",
+                url=f"ws://127.0.0.1:{self.options.get('--ws.port') or 8546}",
+            )
+
+        ipc_path = self.options.get("--ipcpath") or os.path.join(
+            self.data_dir, "geth.ipc"
+        )
+        if "--ipcdisable" not in self.options:
+            self.serve_ipc(ipc_path)
+
+        period = float(self.options.get("--dev.period") or 0)
+        if "--dev" in self.options and period > 0:
+            threading.Thread(target=self.mine, args=(period,), daemon=True).start()
+
+        for index in range(int(os.environ.get("FAKE_GETH_LOG_LINES") or 0)):
+            sys.stderr.write(
+                f"DEBUG [01-01|00:00:00.000] Fake log line number={index}\n"
+            )
+        sys.stderr.flush()
+
+        signal.sigwait(shutdown_signals)
+        log("INFO", "Got interrupt, shutting down...")
+        self.stopped.set()
+
+        # the servers run in daemon threads that end with the process
+        if "--ipcdisable" not in self.options:
+            if os.path.exists(ipc_path):
+                os.remove(ipc_path)
+            log("INFO", "IPC endpoint closed", url=ipc_path)
+        return 0
+
+
+def main(args: list[str] | None = None) -> int:
+    options, commands = parse_args(sys.argv[1:] if args is None else args)
+
+    if not commands:
+        return FakeGethNode(options).run()
+
+    command = commands[0]
+    if command == "version":
+        return print_version()
+    elif command == "account" and commands[1:2] == ["list"]:
+        return list_accounts(options)
+    elif command == "account" and commands[1:2] == ["new"]:
+        return new_account(options)
+    elif command == "init":
+        return init_chain(options, commands[1] if len(commands) > 1 else None)
+    elif command == "removedb":
+        return remove_db(options)
+    return fatal(f"fake geth does not implement `{' '.join(commands)}`")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
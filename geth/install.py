@@ -5,27 +5,40 @@ from __future__ import (
     annotations,
 )
 
+import argparse
+import base64
 from collections.abc import (
     Generator,
+    Iterable,
+)
+from concurrent.futures import (
+    ThreadPoolExecutor,
 )
 import contextlib
+import fnmatch
 import functools
 import os
+import platform as platform_module
+import shutil
 import stat
 import subprocess
 import sys
 import tarfile
 from typing import (
+    IO,
     Any,
+    cast,
 )
-
-import requests
-from requests.exceptions import (
-    ConnectionError,
-    HTTPError,
-    Timeout,
+from xml.etree import (
+    ElementTree,
 )
 
+from geth.artifacts import (
+    find_artifact,
+    get_artifact_key,
+    get_go_version,
+    store_artifact,
+)
 from geth.exceptions import (
     PyGethException,
     PyGethKeyError,
@@ -35,6 +48,11 @@ from geth.exceptions import (
 from geth.types import (
     IO_Any,
 )
+from geth.utils.filesystem import (
+    clone_file,
+    get_file_hash,
+    get_file_sha256,
+)
 
 V1_16_0 = "v1.16.0"
 V1_16_1 = "v1.16.1"
@@ -49,6 +67,12 @@ V1_16_9 = "v1.16.9"
 V1_17_0 = "v1.17.0"
 V1_17_1 = "v1.17.1"
 
+# sha256 of the source code archive of a version, checked when it is downloaded.
+# GitHub publishes no checksums for the archives it generates, so a digest can
+# only be pinned here once it has been recorded from a trusted download;
+# versions without one are downloaded unverified.
+SOURCE_CODE_SHA256: dict[str, str] = {}
+
 
 LINUX = "linux"
 OSX = "darwin"
@@ -142,6 +166,25 @@ def chmod_plus_x(executable_path: str) -> None:
     os.chmod(executable_path, current_st.st_mode | stat.S_IEXEC)
 
 
+# ``platform.machine()`` -> architecture name used by the official geth builds
+ARCHITECTURES = {
+    "x86_64": "amd64",
+    "amd64": "amd64",
+    "aarch64": "arm64",
+    "arm64": "arm64",
+    "i386": "386",
+    "i686": "386",
+    "armv7l": "arm7",
+}
+
+
+def get_arch() -> str:
+    machine = platform_module.machine().lower()
+    if machine not in ARCHITECTURES:
+        raise PyGethKeyError(f"Unknown architecture: {machine}")
+    return ARCHITECTURES[machine]
+
+
 def get_go_executable_path() -> str:
     return os.environ.get("GO_BINARY", "go")
 
@@ -150,6 +193,20 @@ def is_go_available() -> bool:
     return is_executable_available(get_go_executable_path())
 
 
+def get_go_build_env() -> dict[str, str]:
+    """
+    The environment for ``make geth``.  Go shares its build and module caches
+    between all builds by default, ``GETH_GO_CACHE_DIR`` moves both caches for
+    the geth builds, e.g. to a directory that is persisted between CI runs.
+    """
+    env = dict(os.environ)
+    go_cache_dir = os.environ.get("GETH_GO_CACHE_DIR")
+    if go_cache_dir:
+        env.setdefault("GOCACHE", os.path.join(go_cache_dir, "build"))
+        env.setdefault("GOMODCACHE", os.path.join(go_cache_dir, "mod"))
+    return env
+
+
 #
 #  Installation filesystem path utilities
 #
@@ -169,10 +226,14 @@ def get_base_install_path(identifier: str) -> str:
         )
 
 
+SOURCE_CODE_ARCHIVE_FILENAME = "release.tar.gz"
+PREBUILT_ARCHIVE_FILENAME = "prebuilt.tar.gz"
+
+
 def get_source_code_archive_path(identifier: str) -> str:
     return os.path.join(
         get_base_install_path(identifier),
-        "release.tar.gz",
+        SOURCE_CODE_ARCHIVE_FILENAME,
     )
 
 
@@ -191,6 +252,13 @@ def get_source_code_path(identifier: str) -> str:
     )
 
 
+def get_prebuilt_archive_path(identifier: str) -> str:
+    return os.path.join(
+        get_base_install_path(identifier),
+        PREBUILT_ARCHIVE_FILENAME,
+    )
+
+
 def get_build_path(identifier: str) -> str:
     source_code_path = get_source_code_path(identifier)
     return os.path.join(
@@ -225,26 +293,202 @@ DOWNLOAD_SOURCE_CODE_URI_TEMPLATE = (
 )
 
 
+DOWNLOAD_CHUNK_SIZE = 2**16
+
+# seconds to wait for the connection, and then for each chunk of the response
+DOWNLOAD_TIMEOUT = 30
+
+
+def download_file(
+    download_uri: str,
+    path: str,
+    sha256: str | None = None,
+    timeout: float = DOWNLOAD_TIMEOUT,
+) -> None:
+    """
+    Streams ``download_uri`` to ``path``.  The response is written in chunks to
+    ``<path>.part``, which a later call resumes with an HTTP Range request if the
+    download is interrupted, and only renamed to ``path`` once it is complete and
+    matches ``sha256`` if given.
+    """
+    # imported here as ``requests`` is slow to import and only needed to install
+    import requests
+
+    partial_path = f"{path}.part"
+    ensure_parent_dir_exists(path)
+
+    resume_from = os.path.getsize(partial_path) if os.path.exists(partial_path) else 0
+    headers = {"Range": f"bytes={resume_from}-"} if resume_from else {}
+
+    try:
+        with requests.get(
+            download_uri, headers=headers, stream=True, timeout=timeout
+        ) as response:
+            if resume_from and response.status_code == 416:
+                # the partial download is stale, start over
+                os.remove(partial_path)
+                download_file(download_uri, path, sha256, timeout)
+                return
+            response.raise_for_status()
+
+            # servers that do not support ranges send the whole file
+            is_resumed = resume_from and response.status_code == 206
+            with open(partial_path, "ab" if is_resumed else "wb") as f:
+                for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+    except requests.RequestException as e:
+        raise PyGethException(
+            f"An error occurred while downloading from {download_uri}: {e}"
+        )
+
+    if sha256 is not None:
+        actual_sha256 = get_file_sha256(partial_path)
+        if actual_sha256 != sha256.lower():
+            os.remove(partial_path)
+            raise PyGethValueError(
+                f"Checksum mismatch for {download_uri}: expected sha256 {sha256} "
+                f"but got {actual_sha256}"
+            )
+
+    os.replace(partial_path, path)
+
+
 def download_source_code_release(identifier: str) -> None:
     download_uri = DOWNLOAD_SOURCE_CODE_URI_TEMPLATE.format(identifier)
     source_code_archive_path = get_source_code_archive_path(identifier)
 
-    ensure_parent_dir_exists(source_code_archive_path)
+    artifact_key = get_artifact_key("source", identifier)
+    cached_archive_path = find_artifact(artifact_key, SOURCE_CODE_ARCHIVE_FILENAME)
+    if cached_archive_path is not None:
+        print(f"Using cached source code release from {cached_archive_path}")
+        ensure_parent_dir_exists(source_code_archive_path)
+        clone_file(cached_archive_path, source_code_archive_path)
+        return
+
+    print(f"Downloading source code release from {download_uri}")
+    download_file(
+        download_uri, source_code_archive_path, SOURCE_CODE_SHA256.get(identifier)
+    )
+    store_artifact(
+        artifact_key,
+        SOURCE_CODE_ARCHIVE_FILENAME,
+        source_code_archive_path,
+        kind="source",
+        identifier=identifier,
+    )
+
+
+# parts of the go-ethereum tree that ``make geth`` never reads, matched against
+# paths relative to the top level directory of the archive
+DEFAULT_SOURCE_CODE_EXCLUDE = (
+    "*_test.go",
+    "docs/*",
+)
+
+
+@contextlib.contextmanager
+def open_gzip_stream(path: str) -> Generator[IO[bytes]]:
+    """
+    Opens the gzip file at ``path`` for sequential reading, decompressing it with
+    ``pigz`` or ``isal`` when either is available as they are several times faster
+    than the ``gzip`` module.
+    """
+    pigz_executable = shutil.which("pigz")
+    if pigz_executable is not None:
+        proc = subprocess.Popen(
+            [pigz_executable, "--decompress", "--stdout", path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        stdout = cast(IO[bytes], proc.stdout)
+        try:
+            yield stdout
+            # tar stops reading at the end of archive marker, drain the padding
+            # after it so that pigz does not fail with a broken pipe
+            while stdout.read(DOWNLOAD_CHUNK_SIZE):
+                pass
+        except BaseException:
+            proc.kill()
+            raise
+        finally:
+            stdout.close()
+            _, stderr = proc.communicate()
+        if proc.returncode != 0:
+            raise PyGethOSError(
+                f"Unable to decompress {path}: {stderr.decode(errors='replace')}"
+            )
+        return
+
     try:
-        response = requests.get(download_uri)
-        response.raise_for_status()
-        with open(source_code_archive_path, "wb") as f:
-            f.write(response.content)
+        from isal import (  # type: ignore[import-not-found, unused-ignore]
+            igzip as gzip_module,
+        )
+    except ImportError:
+        import gzip as gzip_module
+
+    with gzip_module.open(path, "rb") as stream:
+        yield cast(IO[bytes], stream)
+
+
+def is_within_directory(directory: str, target: str) -> bool:
+    abs_directory = os.path.abspath(directory)
+    abs_target = os.path.abspath(target)
+    return os.path.commonpath([abs_directory, abs_target]) == abs_directory
 
-        print(f"Downloading source code release from {download_uri}")
 
-    except (HTTPError, Timeout, ConnectionError) as e:
+def validate_archive_member(member: tarfile.TarInfo, path: str) -> None:
+    """
+    Rejects members that would be written outside of ``path``, links that point
+    outside of it and device files.
+    """
+    member_path = os.path.join(path, member.name)
+    if os.path.isabs(member.name) or not is_within_directory(path, member_path):
+        raise PyGethException(f"Attempted Path Traversal in Tar File: {member.name!r}")
+
+    if member.issym():
+        link_target = os.path.join(os.path.dirname(member_path), member.linkname)
+    elif member.islnk():
+        link_target = os.path.join(path, member.linkname)
+    else:
+        link_target = None
+    if link_target is not None and (
+        os.path.isabs(member.linkname) or not is_within_directory(path, link_target)
+    ):
         raise PyGethException(
-            f"An error occurred while downloading from {download_uri}: {e}"
+            f"Link outside of the extraction path in Tar File: {member.name!r} -> "
+            f"{member.linkname!r}"
         )
 
+    if member.isdev():
+        raise PyGethException(f"Device file in Tar File: {member.name!r}")
 
-def extract_source_code_release(identifier: str) -> None:
+
+def is_archive_member_included(
+    member: tarfile.TarInfo,
+    include: Iterable[str] | None,
+    exclude: Iterable[str],
+) -> bool:
+    # patterns apply below the ``go-ethereum-<version>/`` top level directory
+    _, _, relative_name = member.name.removeprefix("./").partition("/")
+    if not relative_name or member.isdir():
+        return True
+    if include is not None and not any(
+        fnmatch.fnmatchcase(relative_name, pattern) for pattern in include
+    ):
+        return False
+    return not any(fnmatch.fnmatchcase(relative_name, pattern) for pattern in exclude)
+
+
+def extract_source_code_release(
+    identifier: str,
+    include: Iterable[str] | None = None,
+    exclude: Iterable[str] = DEFAULT_SOURCE_CODE_EXCLUDE,
+) -> None:
+    """
+    Extracts the source code archive in a single streaming pass, validating each
+    member before it is written.  Only files matching one of the ``include``
+    patterns, if given, and none of the ``exclude`` patterns are extracted.
+    """
     source_code_archive_path = get_source_code_archive_path(identifier)
     source_code_extract_path = get_source_code_extract_path(identifier)
     ensure_path_exists(source_code_extract_path)
@@ -253,25 +497,25 @@ def extract_source_code_release(identifier: str) -> None:
         f"Extracting archive: {source_code_archive_path} -> {source_code_extract_path}"
     )
 
-    with tarfile.open(source_code_archive_path, "r:gz") as archive_file:
-
-        def is_within_directory(directory: str, target: str) -> bool:
-            abs_directory = os.path.abspath(directory)
-            abs_target = os.path.abspath(target)
-
-            prefix = os.path.commonprefix([abs_directory, abs_target])
-
-            return prefix == abs_directory
-
-        def safe_extract(tar: tarfile.TarFile, path: str = ".") -> None:
-            for member in tar.getmembers():
-                member_path = os.path.join(path, member.name)
-                if not is_within_directory(path, member_path):
-                    raise PyGethException("Attempted Path Traversal in Tar File")
-
-            tar.extractall(path)
-
-        safe_extract(archive_file, source_code_extract_path)
+    include = tuple(include) if include is not None else None
+    exclude = tuple(exclude)
+
+    with open_gzip_stream(source_code_archive_path) as stream:
+        with tarfile.open(fileobj=stream, mode="r|") as archive_file:
+            if hasattr(tarfile, "data_filter"):
+                # python 3.12+ and recent patch releases also sanitize the
+                # permissions and ownership of every extracted member
+                archive_file.extraction_filter = tarfile.data_filter
+            try:
+                for member in archive_file:
+                    if not is_archive_member_included(member, include, exclude):
+                        continue
+                    validate_archive_member(member, source_code_extract_path)
+                    archive_file.extract(member, source_code_extract_path)
+            except tarfile.TarError as err:
+                raise PyGethException(
+                    f"Unable to extract {source_code_archive_path}: {err}"
+                ) from err
 
 
 def build_from_source_code(identifier: str) -> None:
@@ -283,13 +527,14 @@ def build_from_source_code(identifier: str) -> None:
         )
     source_code_path = get_source_code_path(identifier)
 
-    with chdir(source_code_path):
-        make_command = ["make", "geth"]
-
-        check_subprocess_call(
-            make_command,
-            message="Building `geth` binary",
-        )
+    # ``cwd`` rather than ``chdir`` so that builds can run in parallel threads
+    make_command = ["make", "geth"]
+    check_subprocess_call(
+        make_command,
+        message="Building `geth` binary",
+        cwd=source_code_path,
+        env=get_go_build_env(),
+    )
 
     built_executable_path = get_built_executable_path(identifier)
     if not os.path.exists(built_executable_path):
@@ -302,22 +547,22 @@ def build_from_source_code(identifier: str) -> None:
 
     executable_path = get_executable_path(identifier)
     ensure_parent_dir_exists(executable_path)
-    if os.path.exists(executable_path):
-        if os.path.islink(executable_path):
-            os.remove(executable_path)
-        else:
-            raise PyGethOSError(
-                f"Non-symlink file already present at `{executable_path}`"
-            )
-    os.symlink(built_executable_path, executable_path)
+    # the executable may be a regular file left by a prebuilt install
+    scratch_path = f"{executable_path}.tmp"
+    if os.path.lexists(scratch_path):
+        os.remove(scratch_path)
+    os.symlink(built_executable_path, scratch_path)
+    os.replace(scratch_path, executable_path)
     chmod_plus_x(executable_path)
 
 
-def install_from_source_code_release(identifier: str) -> None:
-    download_source_code_release(identifier)
-    extract_source_code_release(identifier)
-    build_from_source_code(identifier)
+def replace_executable(scratch_path: str, identifier: str) -> None:
+    chmod_plus_x(scratch_path)
+    # also replaces the symlink left by a previous source build
+    os.replace(scratch_path, get_executable_path(identifier))
 
+
+def check_installed_executable(identifier: str) -> None:
     executable_path = get_executable_path(identifier)
     assert os.path.exists(executable_path), f"Executable not found @ {executable_path}"
 
@@ -331,6 +576,159 @@ def install_from_source_code_release(identifier: str) -> None:
     print(f"geth successfully installed at: {executable_path}\n\n{version_output}\n\n")
 
 
+def install_from_source_code_release(identifier: str) -> None:
+    # binaries are cached per Go version, which is unknown without a toolchain
+    go_version = get_go_version()
+    platform = get_platform()
+    arch = get_arch()
+    artifact_key = get_artifact_key("binary", identifier, platform, arch, go_version)
+    cached_executable_path = (
+        find_artifact(artifact_key, "geth") if go_version is not None else None
+    )
+
+    if cached_executable_path is not None:
+        print(f"Using cached geth binary from {cached_executable_path}")
+        executable_path = get_executable_path(identifier)
+        ensure_parent_dir_exists(executable_path)
+        scratch_path = f"{executable_path}.tmp"
+        clone_file(cached_executable_path, scratch_path)
+        replace_executable(scratch_path, identifier)
+    else:
+        download_source_code_release(identifier)
+        extract_source_code_release(identifier)
+        build_from_source_code(identifier)
+        if go_version is not None:
+            store_artifact(
+                artifact_key,
+                "geth",
+                get_built_executable_path(identifier),
+                kind="binary",
+                identifier=identifier,
+                platform=platform,
+                arch=arch,
+                go_version=go_version,
+            )
+
+    check_installed_executable(identifier)
+
+
+# the official prebuilt binaries, published as
+# ``geth-<platform>-<arch>-<version>-<commit>.tar.gz``
+PREBUILT_BASE_URI = "https://gethstore.blob.core.windows.net/builds"
+
+AZURE_BLOB_LISTING_QUERY = "?restype=container&comp=list&prefix={0}"
+
+
+def get_prebuilt_base_uri() -> str:
+    return os.environ.get("GETH_PREBUILT_BASE_URI", PREBUILT_BASE_URI)
+
+
+def find_prebuilt_release(
+    identifier: str, platform: str | None = None, arch: str | None = None
+) -> tuple[str, str | None] | None:
+    """
+    Looks up the official prebuilt archive of ``identifier`` for the platform in
+    the release bucket listing.  Returns the archive name and its base64 encoded
+    Content-MD5, if published, or ``None`` if there is no such archive.
+    """
+    prefix = (
+        f"geth-{platform or get_platform()}-{arch or get_arch()}-"
+        f"{identifier.lstrip('v')}-"
+    )
+    listing_uri = get_prebuilt_base_uri() + AZURE_BLOB_LISTING_QUERY.format(prefix)
+
+    import requests
+
+    try:
+        response = requests.get(listing_uri, timeout=DOWNLOAD_TIMEOUT)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        raise PyGethException(
+            f"An error occurred while listing prebuilt releases at {listing_uri}: {e}"
+        )
+
+    for blob in ElementTree.fromstring(response.content).iter("Blob"):
+        name = blob.findtext("Name") or ""
+        # skip signatures and other artifacts sharing the prefix
+        if name.startswith(prefix) and name.endswith(".tar.gz"):
+            return name, blob.findtext("Properties/Content-MD5") or None
+    return None
+
+
+def install_from_prebuilt_release(
+    identifier: str, platform: str | None = None, arch: str | None = None
+) -> None:
+    platform = platform or get_platform()
+    arch = arch or get_arch()
+    archive_path = get_prebuilt_archive_path(identifier)
+    ensure_parent_dir_exists(archive_path)
+
+    artifact_key = get_artifact_key("prebuilt", identifier, platform, arch)
+    cached_archive_path = find_artifact(artifact_key, PREBUILT_ARCHIVE_FILENAME)
+    if cached_archive_path is not None:
+        print(f"Using cached prebuilt release from {cached_archive_path}")
+        clone_file(cached_archive_path, archive_path)
+    else:
+        download_prebuilt_release(identifier, platform, arch)
+        store_artifact(
+            artifact_key,
+            PREBUILT_ARCHIVE_FILENAME,
+            archive_path,
+            kind="prebuilt",
+            identifier=identifier,
+            platform=platform,
+            arch=arch,
+        )
+
+    executable_path = get_executable_path(identifier)
+    scratch_path = f"{executable_path}.tmp"
+    ensure_parent_dir_exists(executable_path)
+    with tarfile.open(archive_path, "r:gz") as archive_file:
+        # the archive holds ``<archive name>/geth`` next to the license files
+        member = next(
+            (
+                member
+                for member in archive_file.getmembers()
+                if member.isfile() and os.path.basename(member.name) == "geth"
+            ),
+            None,
+        )
+        executable_file = None
+        if member is not None:
+            executable_file = archive_file.extractfile(member)
+        if executable_file is None:
+            raise PyGethValueError(f"No `geth` executable found in {archive_path}")
+        with executable_file, open(scratch_path, "wb") as f:
+            for chunk in iter(
+                functools.partial(executable_file.read, DOWNLOAD_CHUNK_SIZE), b""
+            ):
+                f.write(chunk)
+    replace_executable(scratch_path, identifier)
+
+    check_installed_executable(identifier)
+
+
+def download_prebuilt_release(identifier: str, platform: str, arch: str) -> None:
+    release = find_prebuilt_release(identifier, platform, arch)
+    if release is None:
+        raise PyGethValueError(f"No prebuilt release of geth {identifier} was found")
+    archive_name, content_md5 = release
+
+    download_uri = f"{get_prebuilt_base_uri()}/{archive_name}"
+    archive_path = get_prebuilt_archive_path(identifier)
+    print(f"Downloading prebuilt release from {download_uri}")
+    download_file(download_uri, archive_path)
+
+    if content_md5 is not None:
+        actual_md5 = base64.b64encode(get_file_hash(archive_path, "md5").digest())
+        if actual_md5.decode() != content_md5:
+            os.remove(archive_path)
+            raise PyGethValueError(
+                f"Checksum mismatch for {download_uri}: expected Content-MD5 "
+                f"{content_md5} but got {actual_md5.decode()}"
+            )
+
+
 install_v1_16_0 = functools.partial(install_from_source_code_release, V1_16_0)
 install_v1_16_1 = functools.partial(install_from_source_code_release, V1_16_1)
 install_v1_16_2 = functools.partial(install_from_source_code_release, V1_16_2)
@@ -376,7 +774,14 @@ INSTALL_FUNCTIONS = {
 }
 
 
-def install_geth(identifier: str, platform: str | None = None) -> None:
+def install_geth(
+    identifier: str, platform: str | None = None, from_source: bool = False
+) -> None:
+    """
+    Installs the official prebuilt binary of geth, falling back to building it
+    from source if there is no prebuilt binary for the platform or it cannot be
+    installed.  ``from_source=True`` always builds from source.
+    """
     if platform is None:
         platform = get_platform()
 
@@ -392,17 +797,82 @@ def install_geth(identifier: str, platform: str | None = None) -> None:
             f"{', '.join(sorted(INSTALL_FUNCTIONS[platform].keys()))}"
         )
 
+    if not from_source:
+        try:
+            install_from_prebuilt_release(identifier, platform)
+        except (PyGethException, OSError, tarfile.TarError, KeyError) as e:
+            print(
+                f"Unable to install a prebuilt geth binary, building from source: {e}"
+            )
+        else:
+            return
+
     install_fn = INSTALL_FUNCTIONS[platform][identifier]
     install_fn()
 
 
-if __name__ == "__main__":
-    try:
-        identifier = sys.argv[1]
-    except IndexError:
-        print(
-            "Invocation error. Should be invoked as `python -m geth.install <release-tag>`"  # noqa: E501
+def install_geth_many(
+    identifiers: Iterable[str],
+    jobs: int | None = None,
+    platform: str | None = None,
+    from_source: bool = False,
+) -> None:
+    """
+    Installs several versions of geth concurrently with up to ``jobs`` at a
+    time, by default one per CPU.  Every installation runs to completion before
+    any failures are raised together.
+    """
+    unique_identifiers = list(dict.fromkeys(identifiers))
+    if not unique_identifiers:
+        return
+    if jobs is None:
+        jobs = min(len(unique_identifiers), os.cpu_count() or 1)
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            identifier: executor.submit(
+                install_geth, identifier, platform=platform, from_source=from_source
+            )
+            for identifier in unique_identifiers
+        }
+
+    failures = {
+        identifier: future.exception()
+        for identifier, future in futures.items()
+        if future.exception() is not None
+    }
+    if failures:
+        raise PyGethException(
+            "Installation failed for "
+            + ", ".join(
+                f"geth=={identifier}: {e}" for identifier, e in failures.items()
+            )
         )
-        sys.exit(1)
 
-    install_geth(identifier)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="python -m geth.install",
+        description="Install supported versions of geth",
+    )
+    parser.add_argument(
+        "identifiers",
+        nargs="+",
+        metavar="identifier",
+        help="release tag, e.g. v1.17.1",
+    )
+    parser.add_argument(
+        "--from-source",
+        action="store_true",
+        help="build geth from source rather than installing the prebuilt binary",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of versions to install concurrently, defaults to one per CPU",
+    )
+    args = parser.parse_args()
+
+    install_geth_many(args.identifiers, jobs=args.jobs, from_source=args.from_source)
@@ -2,7 +2,11 @@ from __future__ import (
     annotations,
 )
 
+import json
+import os
 import re
+import shutil
+import tempfile
 
 import semantic_version
 from typing_extensions import (
@@ -24,6 +28,7 @@ from .utils.encoding import (
     force_text,
 )
 from .wrapper import (
+    get_geth_binary_path,
     geth_wrapper,
 )
 
@@ -35,7 +40,6 @@ def get_geth_version_info_string(**geth_kwargs: Unpack[GethKwargsTypedDict]) ->
             "`suffix_args` parameter"
         )
     geth_kwargs["suffix_args"] = ["version"]
-    validate_geth_kwargs(geth_kwargs)
     stdoutdata, stderrdata, command, proc = geth_wrapper(**geth_kwargs)
     return stdoutdata.decode("utf-8")
 
@@ -43,10 +47,137 @@ def get_geth_version_info_string(**geth_kwargs: Unpack[GethKwargsTypedDict]) ->
 VERSION_REGEX = r"Version: (.*)\n"
 
 
+# (resolved executable path, inode, mtime, size) -> version string
+GethExecutableKey = tuple[str, int, int, int]
+
+_geth_version_cache: dict[GethExecutableKey, str] = {}
+
+
+def clear_geth_version_cache() -> None:
+    _geth_version_cache.clear()
+
+
+def is_geth_version_disk_cache_enabled() -> bool:
+    return bool(os.environ.get("GETH_VERSION_DISK_CACHE"))
+
+
+def get_geth_version_disk_cache_path() -> str:
+    return os.path.expanduser(
+        os.path.join(
+            "~",
+            ".py-geth",
+            "geth-versions.json",
+        )
+    )
+
+
+def get_geth_executable_key(
+    geth_kwargs: GethKwargsTypedDict,
+) -> GethExecutableKey | None:
+    """
+    Identifies the geth executable that ``geth_kwargs`` would run by its real path
+    and file metadata, so that replacing the binary invalidates cached results.
+    """
+    executable = geth_kwargs.get("geth_executable") or get_geth_binary_path()
+    resolved_path = shutil.which(executable)
+    if resolved_path is None:
+        return None
+    resolved_path = os.path.realpath(resolved_path)
+    try:
+        stat_result = os.stat(resolved_path)
+    except OSError:
+        return None
+    return (
+        resolved_path,
+        stat_result.st_ino,
+        stat_result.st_mtime_ns,
+        stat_result.st_size,
+    )
+
+
+def _read_geth_version_disk_cache() -> dict[str, dict[str, int | str]]:
+    try:
+        with open(get_geth_version_disk_cache_path()) as cache_file:
+            cache = json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _load_cached_geth_version(executable_key: GethExecutableKey) -> str | None:
+    if executable_key in _geth_version_cache:
+        return _geth_version_cache[executable_key]
+
+    if not is_geth_version_disk_cache_enabled():
+        return None
+
+    path, inode, mtime_ns, size = executable_key
+    entry = _read_geth_version_disk_cache().get(path)
+    if entry is None:
+        return None
+    if (entry.get("inode"), entry.get("mtime_ns"), entry.get("size")) != (
+        inode,
+        mtime_ns,
+        size,
+    ):
+        return None
+
+    version_string = str(entry["version"])
+    _geth_version_cache[executable_key] = version_string
+    return version_string
+
+
+def _store_cached_geth_version(
+    executable_key: GethExecutableKey, version_string: str
+) -> None:
+    _geth_version_cache[executable_key] = version_string
+
+    if not is_geth_version_disk_cache_enabled():
+        return
+
+    path, inode, mtime_ns, size = executable_key
+    cache = _read_geth_version_disk_cache()
+    cache[path] = {
+        "inode": inode,
+        "mtime_ns": mtime_ns,
+        "size": size,
+        "version": version_string,
+    }
+
+    cache_path = get_geth_version_disk_cache_path()
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, scratch_path = tempfile.mkstemp(dir=cache_dir, prefix=".tmp-")
+        with os.fdopen(fd, "w") as scratch_file:
+            json.dump(cache, scratch_file)
+        os.replace(scratch_path, cache_path)
+    except OSError:
+        # the on-disk cache is best effort
+        pass
+
+
 def get_geth_version(
     **geth_kwargs: Unpack[GethKwargsTypedDict],
 ) -> semantic_version.Version:
+    """
+    Returns the version of the geth executable.  Results are cached per executable,
+    keyed on its resolved path, inode, mtime and size, and additionally persisted to
+    ``~/.py-geth/geth-versions.json`` when ``GETH_VERSION_DISK_CACHE`` is set.
+    """
     validate_geth_kwargs(geth_kwargs)
+    if "suffix_args" in geth_kwargs:
+        raise PyGethTypeError(
+            "The `get_geth_version` function cannot be called with the "
+            "`suffix_args` parameter"
+        )
+
+    executable_key = get_geth_executable_key(geth_kwargs)
+    if executable_key is not None:
+        cached_version_string = _load_cached_geth_version(executable_key)
+        if cached_version_string is not None:
+            return semantic_version.Version(cached_version_string)
+
     version_info_string = get_geth_version_info_string(**geth_kwargs)
     version_match = re.search(VERSION_REGEX, force_text(version_info_string, "utf8"))
     if not version_match:
@@ -54,4 +185,9 @@ def get_geth_version(
             f"Did not match version string in geth output:\n{version_info_string}"
         )
     version_string = version_match.groups()[0]
-    return semantic_version.Version(version_string)
+    version = semantic_version.Version(version_string)
+
+    if executable_key is not None:
+        _store_cached_geth_version(executable_key, version_string)
+
+    return version
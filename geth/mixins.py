@@ -6,21 +6,33 @@ from collections.abc import (
     Callable,
 )
 import datetime
-import logging
 import os
 import queue
-import time
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
+    Literal,
+    get_args,
 )
 
 from geth.exceptions import (
     PyGethAttributeError,
+    PyGethValueError,
 )
 from geth.utils.filesystem import (
     ensure_path_exists,
 )
+from geth.utils.logs import (
+    LogSink,
+)
+from geth.utils.readiness import (
+    ReadinessMonitor,
+)
+from geth.utils.streams import (
+    IS_STREAM_PUMP_SUPPORTED,
+    get_stream_pump,
+)
 from geth.utils.thread import (
     spawn,
 )
@@ -35,27 +47,6 @@ def construct_logger_file_path(prefix: str, suffix: str) -> str:
     return os.path.join("logs", timestamp)
 
 
-def _get_file_logger(name: str, filename: str) -> logging.Logger:
-    # create logger with 'spam_application'
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
-    # create file handler which logs even debug messages
-    fh = logging.FileHandler(filename)
-    fh.setLevel(logging.DEBUG)
-    # create console handler with a higher log level
-    ch = logging.StreamHandler()
-    ch.setLevel(logging.ERROR)
-    # create formatter and add it to the handlers
-    formatter = logging.Formatter("%(message)s")
-    fh.setFormatter(formatter)
-    ch.setFormatter(formatter)
-    # add the handlers to the logger
-    logger.addHandler(fh)
-    logger.addHandler(ch)
-
-    return logger
-
-
 # only needed until we drop support for python 3.8
 if TYPE_CHECKING:
     BaseQueue = queue.Queue[Any]
@@ -63,30 +54,169 @@ else:
     BaseQueue = queue.Queue
 
 
+QueueOverflowPolicy = Literal["block", "drop-oldest", "count-and-drop"]
+
+
+def _is_stop_iteration(item: Any) -> bool:
+    is_stop_iteration_type = isinstance(item, type) and issubclass(item, StopIteration)
+    return isinstance(item, StopIteration) or is_stop_iteration_type
+
+
+def _is_exception(item: Any) -> bool:
+    is_exception_type = isinstance(item, type) and issubclass(item, Exception)
+    return isinstance(item, Exception) or is_exception_type
+
+
 class JoinableQueue(BaseQueue):
+    """
+    Queue of output lines.  When bounded by ``maxsize`` the ``overflow_policy``
+    decides what ``put_lines`` does with lines that do not fit: ``block`` waits for
+    room, ``drop-oldest`` evicts the oldest queued line and ``count-and-drop``
+    discards the new line.  Lines that were not queued are counted in ``dropped``.
+    Producers that must never wait use ``offer_lines`` instead.
+    """
+
+    def __init__(
+        self, maxsize: int = 0, overflow_policy: QueueOverflowPolicy = "block"
+    ) -> None:
+        if overflow_policy not in get_args(QueueOverflowPolicy):
+            raise PyGethValueError(
+                f"Unknown queue overflow policy: {overflow_policy!r}, expected one "
+                f"of {get_args(QueueOverflowPolicy)}"
+            )
+        super().__init__(maxsize)
+        self.overflow_policy = overflow_policy
+        self.dropped = 0
+        self._on_room: Callable[[], None] | None = None
+
     def __iter__(self) -> Any:
         while True:
             item = self.get()
 
-            is_stop_iteration_type = isinstance(item, type) and issubclass(
-                item, StopIteration
-            )
-            if isinstance(item, StopIteration) or is_stop_iteration_type:
+            if _is_stop_iteration(item):
+                self.task_done()
                 return
 
-            elif isinstance(item, Exception):
+            elif _is_exception(item):
                 raise item
 
-            elif isinstance(item, type) and issubclass(item, Exception):
+            yield item
+
+    def iter_batches(self) -> Any:
+        """
+        Like iterating over the queue, but yields every item that is available at
+        once as a list, blocking only while the queue is empty.
+        """
+        while True:
+            batch = [self.get()]
+            # ``StopIteration`` is an ``Exception`` too, so this stops at either
+            while not _is_exception(batch[-1]):
+                try:
+                    batch.append(self.get_nowait())
+                except queue.Empty:
+                    break
+
+            item = batch[-1]
+            if _is_stop_iteration(item) or _is_exception(item):
+                if len(batch) > 1:
+                    yield batch[:-1]
+                if _is_stop_iteration(item):
+                    self.task_done()
+                    return
                 raise item
 
-            yield item
+            yield batch
+
+    def _is_full(self) -> bool:
+        return 0 < self.maxsize <= self._qsize()
+
+    def _get(self) -> Any:
+        item = super()._get()
+        if self._on_room is not None and not self._is_full():
+            on_room, self._on_room = self._on_room, None
+            on_room()
+        return item
+
+    def put_lines(self, lines: list[bytes]) -> None:
+        """
+        Queues ``lines`` under a single acquisition of the queue lock, applying the
+        overflow policy to any line that does not fit.
+        """
+        with self.not_full:
+            self._put_lines(lines, block=True)
+
+    def offer_lines(self, lines: list[bytes], on_room: Callable[[], None]) -> bool:
+        """
+        Like ``put_lines``, but never waits.  Under the ``block`` policy lines that
+        do not fit are queued past ``maxsize`` and ``False`` is returned, in which
+        case the producer should stop producing until ``on_room`` is called once
+        the queue is no longer full.
+        """
+        with self.not_full:
+            self._put_lines(lines, block=False)
+            if self.overflow_policy == "block" and self._is_full():
+                self._on_room = on_room
+                return False
+            return True
+
+    def _put_lines(self, lines: list[bytes], block: bool) -> None:
+        for line in lines:
+            if self._is_full():
+                if self.overflow_policy == "count-and-drop":
+                    self.dropped += 1
+                    continue
+                elif self.overflow_policy == "drop-oldest" and not (
+                    _is_stop_iteration(self.queue[0])
+                ):
+                    self._get()
+                    # the evicted line will never be consumed, so account
+                    # for it here rather than through ``task_done``
+                    self.unfinished_tasks -= 1
+                    self.dropped += 1
+                elif block:
+                    while self._is_full():
+                        self.not_full.wait()
+
+            self._put(line)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+    def close(self) -> None:
+        """
+        Terminates iteration over the queue once all queued items have been
+        consumed.  The terminating sentinel bypasses ``maxsize`` so that it can
+        never be blocked or dropped.
+        """
+        with self.mutex:
+            self._put(StopIteration)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
 
     def join(self, timeout: int | None = None) -> None:
-        with Timeout(timeout) as _timeout:
-            while not self.empty():
-                time.sleep(0)
-                _timeout.check()
+        """
+        Blocks until every queued item has been consumed and marked done with
+        ``task_done``, raising ``Timeout`` if that takes longer than ``timeout``.
+        """
+        with self.all_tasks_done:
+            if not self.all_tasks_done.wait_for(
+                lambda: not self.unfinished_tasks, timeout
+            ):
+                raise Timeout(timeout)
+
+
+def pump_stream(stream: IO[bytes], output_queue: JoinableQueue) -> None:
+    """
+    Queues the lines of ``stream`` from the shared stream pump.  The pump thread
+    must never wait on a full queue, so the stream is not read while its queue is
+    full, which only holds up the process writing to it.
+    """
+    stream_pump = get_stream_pump()
+
+    def on_lines(lines: list[bytes]) -> None:
+        if not output_queue.offer_lines(lines, lambda: stream_pump.resume(stream)):
+            stream_pump.pause(stream)
+
+    stream_pump.register(stream, on_lines, output_queue.close)
 
 
 class InterceptedStreamsMixin:
@@ -97,14 +227,22 @@ class InterceptedStreamsMixin:
 
     stdout_callbacks: list[Callable[[str], None]]
     stderr_callbacks: list[Callable[[str], None]]
+    stdout_batch_callbacks: list[Callable[[list[bytes]], None]]
+    stderr_batch_callbacks: list[Callable[[list[bytes]], None]]
+    readiness: ReadinessMonitor
 
     def __init__(self, *args: Any, **kwargs: Any):
+        queue_maxsize = kwargs.pop("queue_maxsize", 0)
+        queue_overflow_policy = kwargs.pop("queue_overflow_policy", "block")
+
         super().__init__(*args, **kwargs)
         self.stdout_callbacks = []
-        self.stdout_queue = JoinableQueue()
+        self.stdout_batch_callbacks = []
+        self.stdout_queue = JoinableQueue(queue_maxsize, queue_overflow_policy)
 
         self.stderr_callbacks = []
-        self.stderr_queue = JoinableQueue()
+        self.stderr_batch_callbacks = []
+        self.stderr_queue = JoinableQueue(queue_maxsize, queue_overflow_policy)
 
     def register_stdout_callback(self, callback_fn: Callable[[str], None]) -> None:
         self.stdout_callbacks.append(callback_fn)
@@ -112,43 +250,86 @@ class InterceptedStreamsMixin:
     def register_stderr_callback(self, callback_fn: Callable[[str], None]) -> None:
         self.stderr_callbacks.append(callback_fn)
 
+    def register_stdout_batch_callback(
+        self, callback_fn: Callable[[list[bytes]], None]
+    ) -> None:
+        """
+        Registers a callback that receives every stdout line that is available at
+        once, which is much cheaper than per line callbacks at high verbosity.
+        """
+        self.stdout_batch_callbacks.append(callback_fn)
+
+    def register_stderr_batch_callback(
+        self, callback_fn: Callable[[list[bytes]], None]
+    ) -> None:
+        """
+        Registers a callback that receives every stderr line that is available at
+        once, which is much cheaper than per line callbacks at high verbosity.
+        """
+        self.stderr_batch_callbacks.append(callback_fn)
+
+    @property
+    def dropped_stdout_lines(self) -> int:
+        return self.stdout_queue.dropped
+
+    @property
+    def dropped_stderr_lines(self) -> int:
+        return self.stderr_queue.dropped
+
     def produce_stdout_queue(self) -> None:
+        # only used on platforms that the shared stream pump does not support
         if hasattr(self, "proc"):
             for line in iter(self.proc.stdout.readline, b""):
-                self.stdout_queue.put(line)
-                time.sleep(0)
+                self.stdout_queue.put_lines([line])
+            self.stdout_queue.close()
         else:
             raise PyGethAttributeError("No `proc` attribute found")
 
     def produce_stderr_queue(self) -> None:
+        # only used on platforms that the shared stream pump does not support
         if hasattr(self, "proc"):
             for line in iter(self.proc.stderr.readline, b""):
-                self.stderr_queue.put(line)
-                time.sleep(0)
+                self.stderr_queue.put_lines([line])
+            self.stderr_queue.close()
         else:
             raise PyGethAttributeError("No `proc` attribute found")
 
     def consume_stdout_queue(self) -> None:
-        for line in self.stdout_queue:
-            for fn in self.stdout_callbacks:
-                fn(line.strip())
-            self.stdout_queue.task_done()
-            time.sleep(0)
+        for batch in self.stdout_queue.iter_batches():
+            lines = [line.strip() for line in batch]
+            for line in lines:
+                for fn in self.stdout_callbacks:
+                    fn(line)
+            for batch_fn in self.stdout_batch_callbacks:
+                batch_fn(lines)
+            for _ in batch:
+                self.stdout_queue.task_done()
 
     def consume_stderr_queue(self) -> None:
-        for line in self.stderr_queue:
-            for fn in self.stderr_callbacks:
-                fn(line.strip())
-            self.stderr_queue.task_done()
-            time.sleep(0)
+        for batch in self.stderr_queue.iter_batches():
+            lines = [line.strip() for line in batch]
+            for line in lines:
+                self.readiness.feed(line)
+                for fn in self.stderr_callbacks:
+                    fn(line)
+            for batch_fn in self.stderr_batch_callbacks:
+                batch_fn(lines)
+            for _ in batch:
+                self.stderr_queue.task_done()
 
     def start(self) -> None:
         # type ignored because this is a mixin but will always have a start method
         # because it will be mixed with BaseGethProcess
         super().start()  # type: ignore[misc]
 
-        spawn(self.produce_stdout_queue)
-        spawn(self.produce_stderr_queue)
+        if IS_STREAM_PUMP_SUPPORTED:
+            # one shared thread reads the output of every managed geth process
+            proc = self.proc  # type: ignore[attr-defined]
+            pump_stream(proc.stdout, self.stdout_queue)
+            pump_stream(proc.stderr, self.stderr_queue)
+        else:
+            spawn(self.produce_stdout_queue)
+            spawn(self.produce_stderr_queue)
 
         spawn(self.consume_stdout_queue)
         spawn(self.consume_stderr_queue)
@@ -158,20 +339,27 @@ class InterceptedStreamsMixin:
         # because it will be mixed with BaseGethProcess
         super().stop()  # type: ignore[misc]
 
+        # the queues are terminated once the output streams of the stopped
+        # process have been read to the end
         try:
-            self.stdout_queue.put(StopIteration)
             self.stdout_queue.join(5)
         except Timeout:
             pass
 
         try:
-            self.stderr_queue.put(StopIteration)
             self.stderr_queue.join(5)
         except Timeout:
             pass
 
 
 class LoggingMixin(InterceptedStreamsMixin):
+    """
+    Mixin class that writes the stdout and stderr output of the geth process to
+    per-process log files.  ``log_max_bytes``, ``log_rotate_interval``,
+    ``log_backup_count`` and ``log_compression`` configure the ``LogSink`` used for
+    each file.
+    """
+
     def __init__(self, *args: Any, **kwargs: Any):
         stdout_logfile_path = kwargs.pop(
             "stdout_logfile_path",
@@ -181,11 +369,23 @@ class LoggingMixin(InterceptedStreamsMixin):
             "stderr_logfile_path",
             construct_logger_file_path("geth", "stderr"),
         )
+        sink_kwargs = {
+            "max_bytes": kwargs.pop("log_max_bytes", None),
+            "rotate_interval": kwargs.pop("log_rotate_interval", None),
+            "backup_count": kwargs.pop("log_backup_count", None),
+            "compression": kwargs.pop("log_compression", None),
+        }
 
         super().__init__(*args, **kwargs)
 
-        stdout_logger = _get_file_logger("geth-stdout", stdout_logfile_path)
-        stderr_logger = _get_file_logger("geth-stderr", stderr_logfile_path)
+        self.stdout_log_sink = LogSink(stdout_logfile_path, **sink_kwargs)
+        self.stderr_log_sink = LogSink(stderr_logfile_path, **sink_kwargs)
+
+        self.register_stdout_callback(self.stdout_log_sink.write)
+        self.register_stderr_callback(self.stderr_log_sink.write)
+
+    def stop(self) -> None:
+        super().stop()
 
-        self.register_stdout_callback(stdout_logger.info)
-        self.register_stderr_callback(stderr_logger.info)
+        self.stdout_log_sink.close()
+        self.stderr_log_sink.close()
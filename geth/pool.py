@@ -0,0 +1,254 @@
+from __future__ import (
+    annotations,
+)
+
+from collections.abc import (
+    Generator,
+)
+import contextlib
+import copy
+import itertools
+import logging
+import os
+import queue
+import shutil
+import tempfile
+import threading
+from types import (
+    TracebackType,
+)
+from typing import (
+    Literal,
+    get_args,
+)
+
+from geth.exceptions import (
+    PyGethException,
+    PyGethValueError,
+)
+from geth.mixins import (
+    InterceptedStreamsMixin,
+)
+from geth.process import (
+    DevGethProcess,
+)
+from geth.types import (
+    GethKwargsTypedDict,
+)
+from geth.utils.filesystem import (
+    copy_tree,
+)
+from geth.utils.networking import (
+    ipc_request,
+)
+from geth.utils.thread import (
+    spawn,
+)
+from geth.utils.timeout import (
+    Timeout,
+)
+from geth.utils.validation import (
+    GenesisDataTypedDict,
+)
+
+logger = logging.getLogger(__name__)
+
+ResetStrategy = Literal["restart", "set_head"]
+
+TEMPLATE_CHAIN_NAME = "pool-template"
+
+
+class PooledDevGethProcess(InterceptedStreamsMixin, DevGethProcess):
+    """
+    Dev process managed by a ``DevGethProcessPool``.  The output of pooled nodes
+    is always consumed so that idle nodes never block on a full stderr pipe.
+    """
+
+
+class DevGethProcessPool:
+    """
+    Keeps ``size`` dev nodes started and ready so that leasing one takes no
+    longer than taking it off a queue.
+
+    Every node runs on its own copy of a data directory that is initialized once
+    for the pool.  When a node is released it is reset, either by restarting it on
+    a fresh copy of that data directory in the background (``"restart"``) or by
+    rewinding its chain to the genesis block with ``debug_setHead``
+    (``"set_head"``), which is faster but keeps e.g. the transaction pool.  If a
+    replacement node fails to start, the next ``lease()`` raises the error and
+    another replacement is started.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        base_dir: str | None = None,
+        overrides: GethKwargsTypedDict | None = None,
+        genesis_data: GenesisDataTypedDict | None = None,
+        reset_strategy: ResetStrategy = "restart",
+        ready_timeout: int = 60,
+    ) -> None:
+        if size < 1:
+            raise PyGethValueError("The pool size must be at least 1")
+        if reset_strategy not in get_args(ResetStrategy):
+            raise PyGethValueError(
+                f"Unknown reset strategy: {reset_strategy!r}, expected one of "
+                f"{get_args(ResetStrategy)}"
+            )
+
+        self.size = size
+        self.overrides = overrides or {}
+        self.reset_strategy = reset_strategy
+        self.ready_timeout = ready_timeout
+
+        self._owns_base_dir = base_dir is None
+        self.base_dir = base_dir or tempfile.mkdtemp(prefix="py-geth-pool-")
+
+        # idle nodes, and the errors of replacement nodes that failed to start
+        self._idle: queue.Queue[PooledDevGethProcess | Exception] = queue.Queue()
+        self._processes: set[PooledDevGethProcess] = set()
+        self._replacements: set[threading.Thread] = set()
+        self._lock = threading.Lock()
+        self._chain_names = (f"pool-{i}" for i in itertools.count())
+        self._is_closed = False
+
+        # initialize the template chain once; every node runs on a copy of it
+        template = DevGethProcess(
+            TEMPLATE_CHAIN_NAME,
+            base_dir=self.base_dir,
+            overrides=copy.deepcopy(self.overrides),
+            genesis_data=genesis_data,
+        )
+        template.release_ports()
+        self.template_dir = template.data_dir
+
+        try:
+            for _ in range(size):
+                self._idle.put(self._start_process())
+        except BaseException:
+            self.close()
+            raise
+
+    def _start_process(self) -> PooledDevGethProcess:
+        chain_name = next(self._chain_names)
+        copy_tree(self.template_dir, os.path.join(self.base_dir, chain_name))
+
+        geth = PooledDevGethProcess(
+            chain_name,
+            base_dir=self.base_dir,
+            overrides=copy.deepcopy(self.overrides),
+        )
+        with self._lock:
+            self._processes.add(geth)
+
+        geth.start()
+        geth.wait_for_ipc(self.ready_timeout)
+        return geth
+
+    def _discard_process(self, geth: PooledDevGethProcess) -> None:
+        with self._lock:
+            self._processes.discard(geth)
+        if geth.is_running:
+            geth.stop()
+        shutil.rmtree(geth.data_dir, ignore_errors=True)
+
+    def lease(self, timeout: int | None = None) -> DevGethProcess:
+        """
+        Takes a ready node out of the pool, waiting up to ``timeout`` seconds for
+        one to be released if all of them are in use.
+        """
+        if self._is_closed:
+            raise PyGethValueError("The pool is closed")
+        try:
+            item = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise Timeout(timeout)
+
+        if isinstance(item, Exception):
+            # keep the pool at its size for later leases
+            self._spawn_replacement(None)
+            raise PyGethException(f"Unable to start a pooled node: {item}") from item
+        return item
+
+    def release(self, geth: DevGethProcess) -> None:
+        """
+        Returns a leased node to the pool, which resets it before it is leased
+        again.
+        """
+        if not isinstance(geth, PooledDevGethProcess) or geth not in self._processes:
+            raise PyGethValueError("The process was not leased from this pool")
+
+        if self.reset_strategy == "set_head" and geth.is_alive:
+            try:
+                ipc_request(geth.ipc_path, "debug_setHead", ["0x0"])
+            except (OSError, PyGethException):
+                logger.exception("Unable to rewind a pooled node, restarting it")
+            else:
+                self._idle.put(geth)
+                return
+
+        self._spawn_replacement(geth)
+
+    def _spawn_replacement(self, geth: PooledDevGethProcess | None) -> None:
+        with self._lock:
+            # tracked under the lock, so that ``close()`` always waits for it
+            if not self._is_closed:
+                self._replacements.add(spawn(self._replace_process, geth))
+
+    def _replace_process(self, geth: PooledDevGethProcess | None) -> None:
+        try:
+            if geth is not None:
+                self._discard_process(geth)
+            if self._is_closed:
+                return
+            try:
+                replacement = self._start_process()
+            except Exception as err:
+                logger.exception("Unable to start a replacement pooled node")
+                self._idle.put(err)
+                return
+            if self._is_closed:
+                self._discard_process(replacement)
+            else:
+                self._idle.put(replacement)
+        finally:
+            with self._lock:
+                self._replacements.discard(threading.current_thread())
+
+    @contextlib.contextmanager
+    def leased(self, timeout: int | None = None) -> Generator[DevGethProcess]:
+        geth = self.lease(timeout)
+        try:
+            yield geth
+        finally:
+            self.release(geth)
+
+    def close(self) -> None:
+        """
+        Stops every node of the pool, including leased ones, once the nodes that
+        are being started to replace released ones are up.
+        """
+        with self._lock:
+            self._is_closed = True
+            replacements = list(self._replacements)
+        for thread in replacements:
+            thread.join()
+
+        with self._lock:
+            processes = list(self._processes)
+        for geth in processes:
+            self._discard_process(geth)
+
+        if self._owns_base_dir:
+            shutil.rmtree(self.base_dir, ignore_errors=True)
+
+    def __enter__(self) -> DevGethProcessPool:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
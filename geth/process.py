@@ -6,16 +6,21 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from collections.abc import (
+    Iterable,
+)
 import copy
+import functools
+import inspect
 import json
 import logging
 import os
 import subprocess
-import time
 from types import (
     TracebackType,
 )
 from typing import (
+    Any,
     cast,
 )
 from urllib.error import (
@@ -24,18 +29,21 @@ from urllib.error import (
 from urllib.request import (
     urlopen,
 )
+import uuid
+import weakref
 
 import semantic_version
 
-from geth import (
-    get_geth_version,
-)
 from geth.accounts import (
+    DEFAULT_ACCOUNT_BALANCE,
     ensure_account_exists,
     get_accounts,
 )
 from geth.chain import (
+    delete_chain_snapshot,
+    delete_chain_snapshots,
     get_chain_data_dir,
+    get_chain_template_key,
     get_default_base_dir,
     get_genesis_file_path,
     get_live_data_dir,
@@ -43,55 +51,118 @@ from geth.chain import (
     initialize_chain,
     is_live_chain,
     is_sepolia_chain,
+    restore_chain_snapshot,
+    restore_chain_template,
+    store_chain_snapshot,
+    store_chain_template,
 )
 from geth.exceptions import (
+    PyGethAttributeError,
     PyGethNotImplementedError,
+    PyGethTypeError,
     PyGethValueError,
 )
+from geth.main import (
+    get_geth_version,
+)
 from geth.types import (
     GethKwargsTypedDict,
     IO_Any,
 )
 from geth.utils.networking import (
     get_ipc_socket,
+    ipc_request,
+    release_port,
+    reserve_port,
+    try_reserve_port,
 )
 from geth.utils.proc import (
+    DEFAULT_SHUTDOWN_POLICY,
+    ShutdownPolicy,
+    ShutdownStage,
     kill_proc,
+    kill_procs,
+)
+from geth.utils.readiness import (
+    READINESS_POLL_INTERVAL,
+    ReadinessMonitor,
+)
+from geth.utils.thread import (
+    spawn,
 )
 from geth.utils.timeout import (
     Timeout,
 )
 from geth.utils.validation import (
     GenesisDataTypedDict,
+    GethConfig,
+    get_geth_config,
     validate_genesis_data,
-    validate_geth_kwargs,
 )
 from geth.wrapper import (
-    construct_popen_command,
+    DEFAULT_TEST_CHAIN_PORTS,
+    construct_geth_command,
     construct_test_chain_kwargs,
 )
 
 logger = logging.getLogger(__name__)
-with open(os.path.join(os.path.dirname(__file__), "genesis.json")) as genesis_file:
-    GENESIS_JSON = json.load(genesis_file)
+
+# the geth kwargs holding ports that are reserved while a process runs
+PORT_KWARGS = ("port", "ws_port", "rpc_port")
+
+
+def _release_ports(ports: set[str]) -> None:
+    for port in ports:
+        release_port(port)
+    ports.clear()
+
+
+@functools.cache
+def get_genesis_json() -> Any:
+    """
+    The default genesis data, read from ``genesis.json`` on first use.  Callers
+    must copy it before modifying it.
+    """
+    with open(os.path.join(os.path.dirname(__file__), "genesis.json")) as f:
+        return json.load(f)
+
+
+def __getattr__(name: str) -> Any:
+    # ``GENESIS_JSON`` is kept for backwards compatibility, without reading the
+    # file when the module is imported
+    if name == "GENESIS_JSON":
+        return get_genesis_json()
+    raise PyGethAttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class BaseGethProcess(ABC):
     _proc = None
+    # the ports reserved by this process object
+    _reserved_ports: set[str]
+
+    # how ``stop()`` escalates signals, e.g. set this to
+    # ``EPHEMERAL_SHUTDOWN_POLICY`` to kill throwaway chains straight away
+    shutdown_policy: ShutdownPolicy = DEFAULT_SHUTDOWN_POLICY
+    # the stage of ``shutdown_policy`` that stopped the process on ``stop()``
+    shutdown_stage: ShutdownStage | None = None
 
     def __init__(
         self,
-        geth_kwargs: GethKwargsTypedDict,
+        geth_kwargs: GethKwargsTypedDict | GethConfig,
         stdin: IO_Any = subprocess.PIPE,
         stdout: IO_Any = subprocess.PIPE,
         stderr: IO_Any = subprocess.PIPE,
     ):
-        validate_geth_kwargs(geth_kwargs)
+        self.geth_config = get_geth_config(geth_kwargs)
+        if isinstance(geth_kwargs, GethConfig):
+            geth_kwargs = geth_kwargs.to_kwargs()
         self.geth_kwargs = geth_kwargs
-        self.command = construct_popen_command(**geth_kwargs)
+        self.command = construct_geth_command(self.geth_config)
         self.stdin = stdin
         self.stdout = stdout
         self.stderr = stderr
+        self.readiness = ReadinessMonitor(self.rpc_port)
+        self._track_reserved_ports()
 
     is_running = False
 
@@ -99,6 +170,8 @@ class BaseGethProcess(ABC):
         if self.is_running:
             raise PyGethValueError("Already running")
         self.is_running = True
+        self.readiness.reset()
+        self.reserve_ports()
 
         logger.info(f"Launching geth: {' '.join(self.command)}")
         self.proc = subprocess.Popen(
@@ -116,11 +189,35 @@ class BaseGethProcess(ABC):
         if not self.is_running:
             raise PyGethValueError("Not running")
 
-        if self.proc.poll() is None:
-            kill_proc(self.proc)
+        self.shutdown_stage = kill_proc(self.proc, self.shutdown_policy)
 
+        self.release_ports()
         self.is_running = False
 
+    def _track_reserved_ports(self) -> set[str]:
+        # ports are released by ``stop()``, or once this object is garbage
+        # collected if it is never started or stopped
+        if "_reserved_ports" not in vars(self):
+            self._reserved_ports = set()
+            weakref.finalize(self, _release_ports, self._reserved_ports)
+        return self._reserved_ports
+
+    def reserve_ports(self) -> None:
+        """
+        Reserves the ports of the process while it runs.  Ports that are already
+        reserved by this process, or that cannot be reserved, are left alone.
+        """
+        reserved_ports = self._track_reserved_ports()
+        for key in PORT_KWARGS:
+            port = self.geth_kwargs.get(key)
+            if port is None or str(port) in reserved_ports:
+                continue
+            if try_reserve_port(cast(str, port)):
+                reserved_ports.add(str(port))
+
+    def release_ports(self) -> None:
+        _release_ports(self._track_reserved_ports())
+
     def __exit__(
         self,
         exc_type: type[BaseException] | None,
@@ -175,10 +272,9 @@ class BaseGethProcess(ABC):
             raise PyGethValueError("RPC interface is not enabled")
 
         with Timeout(timeout) as _timeout:
-            while True:
-                if self.is_rpc_ready:
+            while not self.readiness.rpc_ready.is_set() and not self.is_rpc_ready:
+                if self.readiness.rpc_ready.wait(READINESS_POLL_INTERVAL):
                     break
-                time.sleep(0.1)
                 _timeout.check()
 
     @property
@@ -211,10 +307,13 @@ class BaseGethProcess(ABC):
             raise PyGethValueError("IPC interface is not enabled")
 
         with Timeout(timeout) as _timeout:
-            while True:
-                if self.is_ipc_ready:
+            while not self.readiness.ipc_ready.is_set() and not (
+                # only attempt a connection once the socket file exists
+                os.path.exists(self.ipc_path)
+                and self.is_ipc_ready
+            ):
+                if self.readiness.ipc_ready.wait(READINESS_POLL_INTERVAL):
                     break
-                time.sleep(0.1)
                 _timeout.check()
 
     @property
@@ -222,10 +321,58 @@ class BaseGethProcess(ABC):
         return str(get_geth_version(**self.geth_kwargs))
 
 
+def stop_all(
+    processes: Iterable[BaseGethProcess], policy: ShutdownPolicy | None = None
+) -> None:
+    """
+    Stops every running process in ``processes`` concurrently, following
+    ``policy`` or else each process's own ``shutdown_policy``.  Stopping takes as
+    long as the slowest process rather than the sum of all of them.
+
+    asyncio processes, e.g. ``AsyncDevGethProcess``, are not supported, stop them
+    by awaiting their ``stop()`` instead.
+    """
+    processes = list(processes)
+    for geth in processes:
+        if inspect.iscoroutinefunction(geth.stop):
+            raise PyGethTypeError(
+                f"{type(geth).__name__} cannot be stopped with `stop_all`, "
+                "await its `stop()` instead"
+            )
+
+    running_processes = [geth for geth in processes if geth.is_running]
+
+    processes_by_policy: dict[ShutdownPolicy, list[BaseGethProcess]] = {}
+    for geth in running_processes:
+        processes_by_policy.setdefault(policy or geth.shutdown_policy, []).append(geth)
+
+    shutdown_stages: dict[BaseGethProcess, ShutdownStage | None] = {}
+
+    def _kill_group(group_policy: ShutdownPolicy, group: list[BaseGethProcess]) -> None:
+        group_stages = kill_procs([geth.proc for geth in group], group_policy)
+        shutdown_stages.update(zip(group, group_stages))
+
+    # processes that share a policy are signalled together, groups with
+    # different policies escalate independently of each other
+    threads = [
+        spawn(_kill_group, group_policy, group)
+        for group_policy, group in processes_by_policy.items()
+    ]
+    for thread in threads:
+        thread.join()
+
+    for geth in running_processes:
+        # the process has exited, this only runs the remaining cleanup
+        geth.stop()
+        geth.shutdown_stage = shutdown_stages.get(geth)
+
+
 class MainnetGethProcess(BaseGethProcess):
-    def __init__(self, geth_kwargs: GethKwargsTypedDict | None = None):
+    def __init__(self, geth_kwargs: GethKwargsTypedDict | GethConfig | None = None):
         if geth_kwargs is None:
             geth_kwargs = {}
+        elif isinstance(geth_kwargs, GethConfig):
+            geth_kwargs = geth_kwargs.to_kwargs()
 
         if "data_dir" in geth_kwargs:
             raise PyGethValueError(
@@ -240,9 +387,11 @@ class MainnetGethProcess(BaseGethProcess):
 
 
 class SepoliaGethProcess(BaseGethProcess):
-    def __init__(self, geth_kwargs: GethKwargsTypedDict | None = None):
+    def __init__(self, geth_kwargs: GethKwargsTypedDict | GethConfig | None = None):
         if geth_kwargs is None:
             geth_kwargs = {}
+        elif isinstance(geth_kwargs, GethConfig):
+            geth_kwargs = geth_kwargs.to_kwargs()
 
         if "data_dir" in geth_kwargs:
             raise PyGethValueError(
@@ -272,9 +421,19 @@ class TestnetGethProcess(SepoliaGethProcess):
 class DevGethProcess(BaseGethProcess):
     """
     Geth developer mode process for testing purposes.
+
+    With ``use_template_cache=True`` a fresh chain directory is cloned from a
+    cached, fully initialized data directory keyed on the geth version, the
+    genesis data and the account password, rather than creating an account and
+    running ``geth init`` every time.
+
+    ``snapshot()`` and ``revert()`` save and restore the chain state, see
+    ``snapshot()`` for details.
     """
 
     _data_dir: str
+    # snapshot id -> head block number, for snapshots taken of a running node
+    _head_snapshots: dict[str, str]
 
     def __init__(
         self,
@@ -282,13 +441,14 @@ class DevGethProcess(BaseGethProcess):
         base_dir: str | None = None,
         overrides: GethKwargsTypedDict | None = None,
         genesis_data: GenesisDataTypedDict | None = None,
+        use_template_cache: bool = False,
     ):
         if overrides is None:
             overrides = {}
 
         if genesis_data is None:
             # deepcopy since we may modify the data on init below
-            genesis_data = GenesisDataTypedDict(**copy.deepcopy(GENESIS_JSON))
+            genesis_data = GenesisDataTypedDict(**copy.deepcopy(get_genesis_json()))
 
         validate_genesis_data(genesis_data)
 
@@ -308,8 +468,26 @@ class DevGethProcess(BaseGethProcess):
             )
         overrides["network_id"] = None
 
+        # the ports are reserved from now on, so that chains created concurrently,
+        # even in other processes, never pick the same ports
+        reserved_ports = self._track_reserved_ports()
+        for key, preferred_port in DEFAULT_TEST_CHAIN_PORTS.items():
+            if key not in overrides:
+                port = reserve_port(preferred_port)
+                reserved_ports.add(port)
+                overrides[key] = port
+
         geth_kwargs = construct_test_chain_kwargs(**overrides)
-        validate_geth_kwargs(geth_kwargs)
+        # validated once here, the process is started from the same config
+        geth_config = get_geth_config(geth_kwargs)
+
+        template_key = None
+        password = geth_kwargs.get("password")
+        if use_template_cache and password and not os.listdir(self.data_dir):
+            template_key = get_chain_template_key(
+                str(get_geth_version()), genesis_data, password
+            )
+            restore_chain_template(template_key, self.data_dir)
 
         # ensure that an account is present
         coinbase = ensure_account_exists(**geth_kwargs)
@@ -326,18 +504,81 @@ class DevGethProcess(BaseGethProcess):
         if needs_init:
             genesis_data["coinbase"] = coinbase
             genesis_data.setdefault("alloc", {}).setdefault(
-                coinbase, {"balance": "1000000000000000000000000000000"}
+                coinbase, {"balance": DEFAULT_ACCOUNT_BALANCE}
             )
 
             modify_genesis_based_on_geth_version(genesis_data)
             initialize_chain(genesis_data, self.data_dir)
 
-        super().__init__(geth_kwargs)
+            if template_key is not None:
+                store_chain_template(template_key, self.data_dir)
+
+        super().__init__(geth_config)
+        self._head_snapshots = {}
 
     @property
     def data_dir(self) -> str:
         return self._data_dir
 
+    def snapshot(self) -> str:
+        """
+        Saves the current chain state and returns an id to ``revert()`` to it.
+
+        The snapshot of a stopped node is a copy of its data directory, reflinked
+        where the filesystem supports it, stored next to the data directory.  For a
+        running node only the head block number is recorded, and reverting rewinds
+        the chain to it with ``debug_setHead``.
+        """
+        snapshot_id = uuid.uuid4().hex
+        if self.is_running:
+            self._head_snapshots[snapshot_id] = ipc_request(
+                self.ipc_path, "eth_blockNumber"
+            )
+        else:
+            store_chain_snapshot(self.data_dir, snapshot_id)
+        return snapshot_id
+
+    def revert(self, snapshot_id: str) -> None:
+        """
+        Restores the chain state saved by ``snapshot()``.  Snapshots of a running
+        node can only be reverted while it runs and snapshots of a stopped node
+        only while it is stopped.  A snapshot can be reverted to repeatedly.
+        """
+        if snapshot_id in self._head_snapshots:
+            if not self.is_running:
+                raise PyGethValueError(
+                    "The snapshot was taken of a running node, start the node "
+                    "to revert to it"
+                )
+            ipc_request(
+                self.ipc_path, "debug_setHead", [self._head_snapshots[snapshot_id]]
+            )
+        else:
+            if self.is_running:
+                raise PyGethValueError(
+                    "The snapshot was taken of a stopped node, stop the node to "
+                    "revert to it"
+                )
+            restore_chain_snapshot(self.data_dir, snapshot_id)
+
+    def delete_snapshot(self, snapshot_id: str) -> None:
+        """
+        Discards a snapshot taken with ``snapshot()``, removing its copy of the data
+        directory if it was taken of a stopped node.
+        """
+        if snapshot_id in self._head_snapshots:
+            del self._head_snapshots[snapshot_id]
+        else:
+            delete_chain_snapshot(self.data_dir, snapshot_id)
+
+    def delete_snapshots(self) -> None:
+        """
+        Discards all snapshots of the chain, including those left behind by
+        earlier processes using the same data directory.
+        """
+        self._head_snapshots.clear()
+        delete_chain_snapshots(self.data_dir)
+
 
 def modify_genesis_based_on_geth_version(genesis_data: GenesisDataTypedDict) -> None:
     geth_version = get_geth_version()
@@ -1,5 +1,30 @@
+from collections.abc import (
+    Callable,
+)
+import functools
+import hashlib
 import os
 import shutil
+import stat
+import tempfile
+from typing import (
+    Any,
+)
+
+from geth.exceptions import (
+    PyGethFileNotFoundError,
+)
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore[assignment]
+
+# ioctl request number used to reflink (copy-on-write clone) a file on
+# filesystems that support it, e.g. btrfs and xfs.
+FICLONE = 0x40049409
+
+HASH_CHUNK_SIZE = 2**16
 
 
 def mkdir(path: str) -> None:
@@ -30,22 +55,59 @@ def remove_dir_if_exists(path: str) -> bool:
     return False
 
 
-def is_executable_available(program: str) -> bool:
-    def is_exe(fpath: str) -> bool:
-        return os.path.isfile(fpath) and os.access(fpath, os.X_OK)
+def get_file_hash(path: str, hash_name: str = "sha256") -> Any:
+    file_hash = hashlib.new(hash_name)
+    with open(path, "rb") as f:
+        for chunk in iter(functools.partial(f.read, HASH_CHUNK_SIZE), b""):
+            file_hash.update(chunk)
+    return file_hash
+
+
+def get_file_sha256(path: str) -> str:
+    return str(get_file_hash(path, "sha256").hexdigest())
+
+
+def _is_exe(fpath: str) -> bool:
+    return os.path.isfile(fpath) and os.access(fpath, os.X_OK)
 
-    fpath = os.path.dirname(program)
-    if fpath:
-        if is_exe(program):
-            return True
+
+@functools.lru_cache(maxsize=64)
+def _resolve_executable(program: str, search_path: str) -> str:
+    # raising on a miss keeps misses out of the cache, so that an executable
+    # installed later is still found
+    if os.path.dirname(program):
+        if _is_exe(program):
+            return program
     else:
-        for path in os.environ["PATH"].split(os.pathsep):
+        for path in search_path.split(os.pathsep):
             path = path.strip('"')
             exe_file = os.path.join(path, program)
-            if is_exe(exe_file):
-                return True
+            if _is_exe(exe_file):
+                return exe_file
+
+    raise PyGethFileNotFoundError(program)
 
-    return False
+
+def resolve_executable(program: str) -> str | None:
+    """
+    Returns the path of the executable ``program`` would run, or ``None`` if it
+    is not available.  Hits are cached per ``$PATH`` and resolved again once the
+    cached executable is gone.
+    """
+    search_path = os.environ.get("PATH", "")
+    try:
+        executable_path = _resolve_executable(program, search_path)
+        if not _is_exe(executable_path):
+            # ``lru_cache`` cannot evict a single entry
+            _resolve_executable.cache_clear()
+            executable_path = _resolve_executable(program, search_path)
+    except PyGethFileNotFoundError:
+        return None
+    return executable_path
+
+
+def is_executable_available(program: str) -> bool:
+    return resolve_executable(program) is not None
 
 
 def is_same_path(p1: str, p2: str) -> bool:
@@ -56,3 +118,65 @@ def is_same_path(p1: str, p2: str) -> bool:
         return os.path.samefile(n_p1, n_p2)
     except FileNotFoundError:
         return n_p1 == n_p2
+
+
+def clone_file(src: str, dst: str) -> None:
+    """
+    Copy a file, using a copy-on-write reflink when the filesystem supports it.
+    """
+    if fcntl is not None and hasattr(fcntl, "ioctl"):
+        try:
+            with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+                fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+        except OSError:
+            pass
+        else:
+            shutil.copystat(src, dst)
+            return
+    shutil.copy2(src, dst)
+
+
+def _ignore_non_regular_files(directory: str, names: list[str]) -> set[str]:
+    # unix sockets (e.g. ``geth.ipc``) and other special files cannot be copied
+    ignored = set()
+    for name in names:
+        mode = os.lstat(os.path.join(directory, name)).st_mode
+        if not (stat.S_ISREG(mode) or stat.S_ISDIR(mode)):
+            ignored.add(name)
+    return ignored
+
+
+def copy_tree(src: str, dst: str) -> None:
+    """
+    Recursively copy a directory of regular files, reflinking where possible.
+    """
+    shutil.copytree(
+        src,
+        dst,
+        copy_function=clone_file,
+        ignore=_ignore_non_regular_files,
+        dirs_exist_ok=True,
+    )
+
+
+def publish_dir(path: str, populate: Callable[[str], None]) -> bool:
+    """
+    Creates the directory ``path`` atomically: ``populate`` fills a scratch
+    directory next to it, which is then renamed into place, so that concurrent
+    readers never see a partially written directory.  Returns ``False`` if
+    another process published ``path`` first.
+    """
+    parent_dir = os.path.dirname(os.path.abspath(path))
+    ensure_path_exists(parent_dir)
+
+    scratch_path = tempfile.mkdtemp(dir=parent_dir, prefix=".tmp-")
+    try:
+        populate(scratch_path)
+        os.rename(scratch_path, path)
+    except BaseException as e:
+        shutil.rmtree(scratch_path, ignore_errors=True)
+        if isinstance(e, OSError) and os.path.isdir(path):
+            # another process published the directory first
+            return False
+        raise
+    return True
@@ -0,0 +1,289 @@
+from __future__ import (
+    annotations,
+)
+
+import collections
+import gzip
+import os
+import threading
+import time
+from typing import (
+    IO,
+    Any,
+    Literal,
+    Union,
+    cast,
+    get_args,
+)
+
+from geth.exceptions import (
+    PyGethValueError,
+)
+
+from .thread import (
+    spawn,
+)
+
+LogCompression = Literal["gzip", "zstd"]
+
+COMPRESSION_SUFFIXES = {
+    "gzip": ".gz",
+    "zstd": ".zst",
+}
+
+# used when rotation is enabled without an explicit ``backup_count``
+DEFAULT_LOG_BACKUP_COUNT = 5
+
+WRITE_BUFFER_SIZE = 2**20
+
+# lines queued beyond this while the writer falls behind are dropped
+DEFAULT_MAX_PENDING_LINES = 100_000
+
+_PendingItem = Union[bytes, threading.Event]
+
+
+def _import_zstd() -> Any:
+    try:
+        # python 3.14+
+        from compression import zstd  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        try:
+            import zstandard as zstd
+        except ImportError:
+            raise PyGethValueError(
+                "zstd log compression requires python 3.14 or the `zstandard` "
+                "package: `pip install py-geth[zstd]`"
+            )
+    return zstd
+
+
+class LogSink:
+    """
+    Writes raw output lines to a file from a background thread so that writing the
+    log never holds up the thread that produces the lines.
+
+    The file is rotated once it grows beyond ``max_bytes`` (measured before
+    compression) or has been open for ``rotate_interval`` seconds, keeping up to
+    ``backup_count`` rotated files next to it as ``<path>.1``, ``<path>.2`` and so
+    on.  This bounds the disk space used by long lived nodes.
+
+    Lines are dropped, and counted in ``dropped``, while more than
+    ``max_pending_lines`` are waiting to be written and after the file could not be
+    written.  The error is raised by the next call to ``flush`` or ``close``, after
+    which writing is attempted again.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int | None = None,
+        rotate_interval: float | None = None,
+        backup_count: int | None = None,
+        compression: LogCompression | None = None,
+        max_pending_lines: int = DEFAULT_MAX_PENDING_LINES,
+    ) -> None:
+        if compression is not None and compression not in get_args(LogCompression):
+            raise PyGethValueError(
+                f"Unknown log compression: {compression!r}, expected one of "
+                f"{get_args(LogCompression)}"
+            )
+        # fail here rather than in the writer thread
+        self._zstd = _import_zstd() if compression == "zstd" else None
+        if backup_count is None:
+            is_rotating = max_bytes is not None or rotate_interval is not None
+            backup_count = DEFAULT_LOG_BACKUP_COUNT if is_rotating else 0
+
+        self.suffix = COMPRESSION_SUFFIXES[compression] if compression else ""
+        self.base_path = path
+        self.path = path + self.suffix
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.compression = compression
+        self.max_pending_lines = max_pending_lines
+        self.dropped = 0
+
+        self._condition = threading.Condition()
+        self._pending: list[_PendingItem] = []
+        self._thread: threading.Thread | None = None
+        self._is_closing = False
+        self._error: Exception | None = None
+
+        self._file: IO[bytes] | None = None
+        self._file_size = 0
+        self._file_opened_at = 0.0
+
+    def write(self, line: bytes | str) -> None:
+        """
+        Queues a single line, without its line ending, to be written to the log.
+        """
+        if isinstance(line, str):
+            line = line.encode("utf-8")
+        with self._condition:
+            if self._error is not None or len(self._pending) >= self.max_pending_lines:
+                self.dropped += 1
+                return
+            self._ensure_writer_running()
+            self._pending.append(line + b"\n")
+            self._condition.notify()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Blocks until every line written so far has been flushed to the file.
+        Returns ``False`` if that did not happen within ``timeout`` seconds, and
+        raises the error if the file could not be written.
+        """
+        flushed = threading.Event()
+        with self._condition:
+            self._raise_error()
+            if self._thread is None:
+                return True
+            self._pending.append(flushed)
+            self._condition.notify()
+        is_flushed = flushed.wait(timeout)
+        with self._condition:
+            self._raise_error()
+        return is_flushed
+
+    def close(self) -> None:
+        """
+        Writes out every pending line and closes the file.  Writing to the sink
+        again reopens the file in append mode.
+        """
+        with self._condition:
+            thread = self._thread
+            if thread is not None:
+                self._is_closing = True
+                self._condition.notify()
+        if thread is not None:
+            thread.join()
+        with self._condition:
+            self._raise_error()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _ensure_writer_running(self) -> None:
+        if self._thread is None:
+            self._is_closing = False
+            self._thread = spawn(self._run)
+
+    def _run(self) -> None:
+        batch: collections.deque[_PendingItem] = collections.deque()
+        try:
+            while True:
+                with self._condition:
+                    self._condition.wait_for(lambda: self._pending or self._is_closing)
+                    batch.extend(self._pending)
+                    self._pending = []
+                    if not batch:
+                        self._close_file()
+                        self._thread = None
+                        return
+
+                self._write_pending(batch)
+        except Exception as err:
+            self._fail(err, batch)
+
+    def _fail(self, error: Exception, batch: collections.deque[_PendingItem]) -> None:
+        try:
+            self._close_file()
+        except Exception:
+            self._file = None
+
+        with self._condition:
+            self._error = error
+            self._thread = None
+            batch.extend(self._pending)
+            self._pending = []
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    # ``flush`` raises the error once it is woken up
+                    item.set()
+                else:
+                    self.dropped += 1
+
+    def _write_pending(self, batch: collections.deque[_PendingItem]) -> None:
+        if self._file is None:
+            self._open_file()
+            is_rotation_due = False
+        else:
+            is_rotation_due = self._should_rotate_by_time()
+
+        # items are only removed once written, so that ``_fail`` can account for
+        # the rest
+        while batch:
+            item = batch[0]
+            if isinstance(item, threading.Event):
+                self._get_file().flush()
+                item.set()
+                batch.popleft()
+                continue
+
+            # rotating for a batch of flushes alone would leave empty logs behind
+            if is_rotation_due:
+                self._rotate()
+                is_rotation_due = False
+            elif (
+                self.max_bytes is not None
+                and self._file_size
+                and self._file_size + len(item) > self.max_bytes
+            ):
+                self._rotate()
+
+            self._get_file().write(item)
+            self._file_size += len(item)
+            batch.popleft()
+
+    def _get_file(self) -> IO[bytes]:
+        if self._file is None:
+            self._open_file()
+        return cast(IO[bytes], self._file)
+
+    def _should_rotate_by_time(self) -> bool:
+        return (
+            self.rotate_interval is not None
+            and time.monotonic() - self._file_opened_at >= self.rotate_interval
+        )
+
+    def _open_file(self) -> None:
+        log_dir = os.path.dirname(self.path)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+
+        if self.compression == "gzip":
+            self._file = cast(IO[bytes], gzip.open(self.path, "ab"))
+        elif self._zstd is not None:
+            self._file = cast(IO[bytes], self._zstd.open(self.path, "ab"))
+        else:
+            self._file = open(self.path, "ab", buffering=WRITE_BUFFER_SIZE)
+
+        try:
+            self._file_size = os.path.getsize(self.path)
+        except OSError:
+            self._file_size = 0
+        self._file_opened_at = time.monotonic()
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _get_backup_path(self, index: int) -> str:
+        return f"{self.base_path}.{index}{self.suffix}"
+
+    def _rotate(self) -> None:
+        self._close_file()
+
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                backup_path = self._get_backup_path(index)
+                if os.path.exists(backup_path):
+                    os.replace(backup_path, self._get_backup_path(index + 1))
+            os.replace(self.path, self._get_backup_path(1))
+        else:
+            os.remove(self.path)
+
+        self._open_file()
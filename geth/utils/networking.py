@@ -1,9 +1,28 @@
+from __future__ import (
+    annotations,
+)
+
 from collections.abc import (
     Generator,
 )
 import contextlib
+import itertools
+import json
+import os
 import socket
+import sys
+import tempfile
+import threading
 import time
+from typing import (
+    IO,
+    Any,
+)
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
 
 from geth.exceptions import (
     PyGethValueError,
@@ -34,10 +53,129 @@ def get_open_port() -> str:
     return str(port)
 
 
+# the maximum number of random ports tried by ``reserve_port``
+MAX_PORT_RESERVATION_ATTEMPTS = 100
+
+# port -> lock file that is held for as long as the port is reserved
+_reserved_ports: dict[str, IO[str]] = {}
+_reserved_ports_lock = threading.Lock()
+
+
+def get_port_lock_dir() -> str:
+    """
+    The directory holding the lock files that coordinate port reservations
+    between processes, ``$GETH_PORT_LOCK_DIR`` or ``py-geth-ports`` in the system
+    temporary directory.
+    """
+    return os.environ.get(
+        "GETH_PORT_LOCK_DIR",
+        os.path.join(tempfile.gettempdir(), "py-geth-ports"),
+    )
+
+
+def _lock_file(lock_file: IO[str]) -> bool:
+    try:
+        if sys.platform == "win32":
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    else:
+        return True
+
+
+def _reserve_port(port: str, allow_reserved: bool, hold: bool = True) -> bool:
+    with _reserved_ports_lock:
+        if port in _reserved_ports:
+            return allow_reserved
+
+        lock_dir = get_port_lock_dir()
+        os.makedirs(lock_dir, exist_ok=True)
+        lock_file = open(os.path.join(lock_dir, f"{port}.lock"), "a")
+        if not _lock_file(lock_file):
+            lock_file.close()
+            return False
+
+        # the port could still be in use by something outside of py-geth
+        if not is_port_open(int(port)):
+            lock_file.close()
+            return False
+
+        if hold:
+            _reserved_ports[port] = lock_file
+        else:
+            lock_file.close()
+        return True
+
+
+def try_reserve_port(port: int | str) -> bool:
+    """
+    Reserves ``port`` if it is free and not reserved by any other process using
+    py-geth.  The reservation is a lock on a file in ``get_port_lock_dir()``, so
+    it is dropped automatically if this process dies.  Returns ``True`` if the
+    port is, or already was, reserved by this process.
+    """
+    return _reserve_port(str(port), allow_reserved=True)
+
+
+def reserve_port(preferred_port: int | None = None) -> str:
+    """
+    Reserves ``preferred_port`` if it is available and otherwise some other open
+    port, so that concurrent callers in any process never receive the same port.
+    """
+    if preferred_port is not None and _reserve_port(
+        str(preferred_port), allow_reserved=False
+    ):
+        return str(preferred_port)
+
+    for _ in range(MAX_PORT_RESERVATION_ATTEMPTS):
+        port = get_open_port()
+        if _reserve_port(port, allow_reserved=False):
+            return port
+
+    raise PyGethValueError(
+        f"Unable to reserve an open port after {MAX_PORT_RESERVATION_ATTEMPTS} "
+        "attempts"
+    )
+
+
+def find_open_port(preferred_port: int | None = None) -> str:
+    """
+    Returns ``preferred_port`` if it is open and not reserved by any process using
+    py-geth, and otherwise some other such port.  Unlike ``reserve_port`` the port
+    is not reserved, so it may be taken by someone else before it is used.
+    """
+    if preferred_port is not None and _reserve_port(
+        str(preferred_port), allow_reserved=False, hold=False
+    ):
+        return str(preferred_port)
+
+    for _ in range(MAX_PORT_RESERVATION_ATTEMPTS):
+        port = get_open_port()
+        if _reserve_port(port, allow_reserved=False, hold=False):
+            return port
+
+    raise PyGethValueError(
+        f"Unable to find an open port after {MAX_PORT_RESERVATION_ATTEMPTS} attempts"
+    )
+
+
+def release_port(port: int | str) -> None:
+    """
+    Releases a port reserved by this process.  Releasing a port that is not
+    reserved does nothing.
+    """
+    with _reserved_ports_lock:
+        lock_file = _reserved_ports.pop(str(port), None)
+    if lock_file is not None:
+        # closing the file drops the lock, the file itself is left in place as
+        # removing it could race with another process locking it
+        lock_file.close()
+
+
 @contextlib.contextmanager
-def get_ipc_socket(
-    ipc_path: str, timeout: float = 0.1
-) -> Generator[socket.socket, None, None]:
+def get_ipc_socket(ipc_path: str, timeout: float = 0.1) -> Generator[socket.socket]:
     sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
     sock.connect(ipc_path)
     sock.settimeout(timeout)
@@ -47,6 +185,50 @@ def get_ipc_socket(
     sock.close()
 
 
+_ipc_request_ids = itertools.count(1)
+
+
+def ipc_request(
+    ipc_path: str,
+    method: str,
+    params: list[Any] | None = None,
+    timeout: float = 5,
+) -> Any:
+    """
+    Makes a single JSON-RPC request over the IPC socket at ``ipc_path`` and
+    returns its result.
+    """
+    request_id = next(_ipc_request_ids)
+    request = {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": method,
+        "params": params or [],
+    }
+
+    response_data = b""
+    with get_ipc_socket(ipc_path, timeout) as sock:
+        sock.sendall(json.dumps(request).encode("utf-8"))
+        while True:
+            chunk = sock.recv(4096)
+            if not chunk:
+                raise PyGethValueError(
+                    f"IPC connection closed before `{method}` returned a response"
+                )
+            response_data += chunk
+            try:
+                response = json.loads(response_data)
+            except ValueError:
+                # the response is incomplete
+                continue
+            else:
+                break
+
+    if response.get("error"):
+        raise PyGethValueError(f"`{method}` failed: {response['error']}")
+    return response.get("result")
+
+
 def wait_for_http_connection(port: int, timeout: int = 5) -> None:
     with Timeout(timeout) as _timeout:
         while True:
@@ -2,53 +2,236 @@ from __future__ import (
     annotations,
 )
 
+import asyncio
+from collections.abc import (
+    Sequence,
+)
+import os
+import selectors
 import signal
 import subprocess
 import time
 from typing import (
     AnyStr,
+    Literal,
+    NamedTuple,
 )
 
-from .timeout import (
-    Timeout,
+ShutdownStage = Literal["exited", "interrupt", "terminate", "kill"]
+
+
+class ShutdownPolicy(NamedTuple):
+    """
+    How long to wait for a process to exit after each of SIGINT, SIGTERM and
+    SIGKILL before escalating to the next signal.  A stage with a timeout of
+    ``None`` is skipped.
+    """
+
+    interrupt_timeout: float | None = 30
+    terminate_timeout: float | None = 10
+    kill_timeout: float = 2
+
+    @property
+    def stages(self) -> tuple[tuple[ShutdownStage, float], ...]:
+        stages: tuple[tuple[ShutdownStage, float | None], ...] = (
+            ("interrupt", self.interrupt_timeout),
+            ("terminate", self.terminate_timeout),
+            ("kill", self.kill_timeout),
+        )
+        return tuple(
+            (stage, timeout) for stage, timeout in stages if timeout is not None
+        )
+
+
+# lets geth flush its database on shutdown
+DEFAULT_SHUTDOWN_POLICY = ShutdownPolicy()
+
+# for throwaway chains whose database does not need to be flushed
+EPHEMERAL_SHUTDOWN_POLICY = ShutdownPolicy(
+    interrupt_timeout=None,
+    terminate_timeout=None,
 )
 
+STAGE_SIGNALS: dict[ShutdownStage, signal.Signals] = {
+    "interrupt": signal.SIGINT,
+    "terminate": signal.SIGTERM,
+    # ``signal.SIGKILL`` does not exist on windows
+    "kill": getattr(signal, "SIGKILL", signal.SIGTERM),
+}
+
 
-def wait_for_popen(proc: subprocess.Popen[AnyStr], timeout: int = 30) -> None:
+def wait_for_popen(proc: subprocess.Popen[AnyStr], timeout: float = 30) -> bool:
+    """
+    Waits up to ``timeout`` seconds for ``proc`` to exit and returns whether it
+    did.
+    """
     try:
-        with Timeout(timeout) as _timeout:
-            while proc.poll() is None:
-                time.sleep(0.1)
-                _timeout.check()
-    except Timeout:
-        pass
+        proc.wait(timeout)
+    except subprocess.TimeoutExpired:
+        return False
+    else:
+        return True
+
+
+def _signal_proc(proc: subprocess.Popen[AnyStr], stage: ShutdownStage) -> None:
+    if stage == "kill":
+        proc.kill()
+    elif stage == "terminate":
+        proc.terminate()
+    else:
+        proc.send_signal(STAGE_SIGNALS[stage])
 
 
-def kill_proc(proc: subprocess.Popen[AnyStr]) -> None:
+def kill_proc(
+    proc: subprocess.Popen[AnyStr],
+    policy: ShutdownPolicy = DEFAULT_SHUTDOWN_POLICY,
+) -> ShutdownStage | None:
+    """
+    Stops ``proc`` by escalating through the stages of ``policy`` and returns the
+    stage that stopped it, ``"exited"`` if it had already exited, or ``None`` if
+    it was still alive after the last stage.
+    """
+    if proc.poll() is not None:
+        return "exited"
+
+    stages = policy.stages
     try:
-        if proc.poll() is None:
+        for index, (stage, timeout) in enumerate(stages):
             try:
-                proc.send_signal(signal.SIGINT)
-                wait_for_popen(proc, 30)
+                _signal_proc(proc, stage)
+                if wait_for_popen(proc, timeout):
+                    return stage
             except KeyboardInterrupt:
+                remaining_stages = len(stages) - index - 1
+                if not remaining_stages:
+                    raise
                 print(
-                    "Trying to close geth process.  Press Ctrl+C 2 more times "
-                    "to force quit"
+                    "Trying to close geth process.  Press Ctrl+C "
+                    f"{remaining_stages} more times to force quit"
                 )
-        if proc.poll() is None:
-            try:
-                proc.terminate()
-                wait_for_popen(proc, 10)
-            except KeyboardInterrupt:
-                print(
-                    "Trying to close geth process.  Press Ctrl+C 1 more times "
-                    "to force quit"
-                )
-        if proc.poll() is None:
-            proc.kill()
-            wait_for_popen(proc, 2)
     except KeyboardInterrupt:
         proc.kill()
+        return "kill"
+
+    return None
+
+
+def _wait_for_procs_with_pidfds(
+    procs: Sequence[subprocess.Popen[AnyStr]], deadline: float
+) -> None:
+    pidfds: dict[int, subprocess.Popen[AnyStr]] = {}
+    try:
+        for proc in procs:
+            if proc.poll() is None:
+                pidfds[os.pidfd_open(proc.pid)] = proc
+
+        with selectors.DefaultSelector() as selector:
+            for pidfd in pidfds:
+                selector.register(pidfd, selectors.EVENT_READ)
+
+            remaining = len(pidfds)
+            while remaining:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    return
+                for key, _ in selector.select(timeout):
+                    selector.unregister(key.fd)
+                    # reap the process so that ``returncode`` is set
+                    pidfds[key.fd].poll()
+                    remaining -= 1
+    finally:
+        for pidfd in pidfds:
+            os.close(pidfd)
+
+
+def _wait_for_procs(procs: Sequence[subprocess.Popen[AnyStr]], timeout: float) -> None:
+    """
+    Waits up to ``timeout`` seconds in total for all of ``procs`` to exit.  On
+    linux a single selector waits on a pidfd per process.
+    """
+    deadline = time.monotonic() + timeout
+    if hasattr(os, "pidfd_open"):
+        try:
+            _wait_for_procs_with_pidfds(procs, deadline)
+        except OSError:
+            # e.g. a kernel older than 5.3, fall back to waiting in turn
+            pass
+        else:
+            return
+
+    for proc in procs:
+        wait_for_popen(proc, max(deadline - time.monotonic(), 0))
+
+
+def kill_procs(
+    procs: Sequence[subprocess.Popen[AnyStr]],
+    policy: ShutdownPolicy = DEFAULT_SHUTDOWN_POLICY,
+) -> list[ShutdownStage | None]:
+    """
+    ``kill_proc`` for many processes at once.  Every stage signals all processes
+    that are still alive and then waits on all of them together, so stopping
+    them takes as long as the slowest process rather than the sum of all.
+    Returns the stage that stopped each process.
+    """
+    stages: list[ShutdownStage | None] = [
+        "exited" if proc.poll() is not None else None for proc in procs
+    ]
+    try:
+        for stage, timeout in policy.stages:
+            pending = [
+                index for index, proc in enumerate(procs) if stages[index] is None
+            ]
+            if not pending:
+                break
+
+            for index in pending:
+                _signal_proc(procs[index], stage)
+            _wait_for_procs([procs[index] for index in pending], timeout)
+
+            for index in pending:
+                if procs[index].poll() is not None:
+                    stages[index] = stage
+    except KeyboardInterrupt:
+        for index, proc in enumerate(procs):
+            if stages[index] is None:
+                proc.kill()
+                stages[index] = "kill"
+        raise
+
+    return stages
+
+
+async def _async_wait_for_proc(
+    proc: asyncio.subprocess.Process, timeout: float
+) -> bool:
+    try:
+        await asyncio.wait_for(proc.wait(), timeout)
+    except asyncio.TimeoutError:
+        return False
+    else:
+        return True
+
+
+async def async_kill_proc(
+    proc: asyncio.subprocess.Process,
+    policy: ShutdownPolicy = DEFAULT_SHUTDOWN_POLICY,
+) -> ShutdownStage | None:
+    """
+    ``kill_proc`` for processes started with ``asyncio.create_subprocess_exec``.
+    """
+    if proc.returncode is not None:
+        return "exited"
+
+    for stage, timeout in policy.stages:
+        try:
+            proc.send_signal(STAGE_SIGNALS[stage])
+        except ProcessLookupError:
+            # the process exited before it could be signalled
+            return "exited"
+        if await _async_wait_for_proc(proc, timeout):
+            return stage
+
+    return None
 
 
 def format_error_message(
@@ -0,0 +1,48 @@
+from __future__ import (
+    annotations,
+)
+
+import re
+import threading
+
+# geth logs these lines to stderr once the corresponding endpoint is accepting
+# connections.
+HTTP_SERVER_STARTED_REGEX = re.compile(rb"HTTP server started.*?endpoint=\S*:(\d+)")
+IPC_ENDPOINT_OPENED_REGEX = re.compile(rb"IPC endpoint opened")
+
+# how often to fall back to probing an endpoint directly when no log line has
+# been seen, e.g. when nothing is consuming the stderr of the geth process.
+READINESS_POLL_INTERVAL = 0.1
+
+
+class ReadinessMonitor:
+    """
+    Tracks whether the RPC and IPC endpoints of a geth process are live by
+    watching the log lines geth writes to stderr as they come up.
+    """
+
+    def __init__(self, rpc_port: str | None = None) -> None:
+        self.rpc_port = rpc_port
+        self.rpc_ready = threading.Event()
+        self.ipc_ready = threading.Event()
+
+    def reset(self) -> None:
+        self.rpc_ready.clear()
+        self.ipc_ready.clear()
+
+    def feed(self, line: str | bytes) -> None:
+        if isinstance(line, str):
+            line = line.encode("utf8")
+
+        if not self.rpc_ready.is_set():
+            http_match = HTTP_SERVER_STARTED_REGEX.search(line)
+            # geth also starts an authenticated HTTP server for the engine API
+            # so only the endpoint bound to our RPC port counts.
+            if http_match and (
+                self.rpc_port is None
+                or http_match.group(1).decode() == str(self.rpc_port)
+            ):
+                self.rpc_ready.set()
+
+        if not self.ipc_ready.is_set() and IPC_ENDPOINT_OPENED_REGEX.search(line):
+            self.ipc_ready.set()
@@ -0,0 +1,244 @@
+from __future__ import (
+    annotations,
+)
+
+from collections.abc import (
+    Callable,
+)
+import logging
+import os
+import selectors
+import threading
+from typing import (
+    IO,
+    Any,
+)
+
+from .thread import (
+    spawn,
+)
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK_SIZE = 2**16
+
+# ``select`` only supports pipes on posix platforms
+IS_STREAM_PUMP_SUPPORTED = os.name == "posix"
+
+
+class _PumpedStream:
+    def __init__(
+        self,
+        on_lines: Callable[[list[bytes]], None],
+        on_close: Callable[[], None],
+    ) -> None:
+        self.on_lines = on_lines
+        self.on_close = on_close
+        self.buffer = bytearray()
+
+
+class StreamPump:
+    """
+    Reads the output streams of any number of subprocesses from a single thread.
+    Streams are read in large non-blocking chunks and every complete line is
+    handed to the ``on_lines`` callback registered for the stream.
+    """
+
+    def __init__(self) -> None:
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._pending: list[Callable[[], None]] = []
+        # fd -> stream that is not read until it is resumed
+        self._paused: dict[int, _PumpedStream] = {}
+
+        # writing to this pipe wakes the pump thread up so that it can pick up
+        # (un)registrations made from other threads.
+        self._wakeup_read_fd, self._wakeup_write_fd = os.pipe()
+        os.set_blocking(self._wakeup_read_fd, False)
+        os.set_blocking(self._wakeup_write_fd, False)
+        self._selector.register(self._wakeup_read_fd, selectors.EVENT_READ, None)
+
+        self._thread = spawn(self._run)
+
+    def register(
+        self,
+        stream: IO[bytes],
+        on_lines: Callable[[list[bytes]], None],
+        on_close: Callable[[], None],
+    ) -> None:
+        """
+        Start pumping ``stream``.  ``on_close`` is called once the end of the
+        stream has been reached and all of its lines have been delivered.
+        """
+        fd = stream.fileno()
+        os.set_blocking(fd, False)
+        pumped_stream = _PumpedStream(on_lines, on_close)
+
+        def _register() -> None:
+            # a stream that was closed without being unregistered leaves a stale
+            # registration behind when the OS reuses its fd for a new stream
+            if fd in self._selector.get_map():
+                self._selector.unregister(fd)
+            self._paused.pop(fd, None)
+            self._selector.register(fd, selectors.EVENT_READ, pumped_stream)
+
+        self._call_in_pump_thread(_register)
+
+    def unregister(self, stream: IO[bytes]) -> None:
+        """
+        Stop pumping ``stream`` without calling its ``on_close`` callback.
+        """
+        fd = stream.fileno()
+
+        def _unregister() -> None:
+            if fd in self._selector.get_map():
+                self._selector.unregister(fd)
+            self._paused.pop(fd, None)
+
+        self._call_in_pump_thread(_unregister)
+
+    def pause(self, stream: IO[bytes]) -> None:
+        """
+        Stop reading ``stream`` until ``resume`` is called.  The process writing
+        to it blocks once the pipe is full, while the output of every other
+        stream keeps being read.
+        """
+        fd = stream.fileno()
+
+        def _pause() -> None:
+            key = self._selector.get_map().get(fd)
+            if key is not None and key.data is not None:
+                self._selector.unregister(fd)
+                self._paused[fd] = key.data
+
+        self._call_in_pump_thread(_pause)
+
+    def resume(self, stream: IO[bytes]) -> None:
+        """
+        Start reading a paused ``stream`` again.
+        """
+        fd = stream.fileno()
+
+        def _resume() -> None:
+            pumped_stream = self._paused.pop(fd, None)
+            if pumped_stream is not None:
+                self._selector.register(fd, selectors.EVENT_READ, pumped_stream)
+
+        self._call_in_pump_thread(_resume)
+
+    def _call_in_pump_thread(self, fn: Callable[[], None]) -> None:
+        if threading.current_thread() is self._thread:
+            # e.g. a callback pausing its own stream, which must take effect
+            # before the stream is read again
+            fn()
+            return
+
+        with self._lock:
+            self._pending.append(fn)
+        try:
+            os.write(self._wakeup_write_fd, b"\0")
+        except BlockingIOError:
+            # the pump thread already has a wake up pending
+            pass
+
+    def _run_pending(self) -> None:
+        try:
+            while os.read(self._wakeup_read_fd, READ_CHUNK_SIZE):
+                pass
+        except BlockingIOError:
+            pass
+
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for fn in pending:
+            try:
+                fn()
+            except Exception:
+                logger.exception("Error in stream pump (un)registration")
+
+    def _run(self) -> None:
+        # the pump thread is shared by every process, so it must survive errors
+        # in any single stream
+        while True:
+            try:
+                events = self._selector.select()
+            except Exception:
+                logger.exception("Error waiting for output streams")
+                self._close_invalid_streams()
+                continue
+
+            for key, _ in events:
+                if key.data is None:
+                    self._run_pending()
+                    continue
+                try:
+                    self._pump(key.fd, key.data)
+                except Exception:
+                    logger.exception(
+                        "Error reading output stream with fd %d, closing it", key.fd
+                    )
+                    self._close(key.fd, key.data)
+
+    def _close_invalid_streams(self) -> None:
+        for key in list(self._selector.get_map().values()):
+            if key.data is None:
+                continue
+            try:
+                os.fstat(key.fd)
+            except OSError:
+                self._close(key.fd, key.data)
+
+    def _pump(self, fd: int, pumped_stream: _PumpedStream) -> None:
+        try:
+            data = os.read(fd, READ_CHUNK_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+
+        buffer = pumped_stream.buffer
+        if data:
+            buffer += data
+            line_end = buffer.rfind(b"\n")
+            if line_end == -1:
+                return
+            chunk = bytes(buffer[:line_end])
+            del buffer[: line_end + 1]
+            self._dispatch(
+                pumped_stream.on_lines,
+                [line + b"\n" for line in chunk.split(b"\n")],
+            )
+        else:
+            self._close(fd, pumped_stream)
+
+    def _close(self, fd: int, pumped_stream: _PumpedStream) -> None:
+        key = self._selector.get_map().get(fd)
+        if key is not None and key.data is pumped_stream:
+            self._selector.unregister(fd)
+        buffer = pumped_stream.buffer
+        if buffer:
+            self._dispatch(pumped_stream.on_lines, [bytes(buffer)])
+            buffer.clear()
+        self._dispatch(pumped_stream.on_close)
+
+    def _dispatch(self, fn: Callable[..., None], *args: Any) -> None:
+        # an error in one callback must not stop the streams of other processes
+        try:
+            fn(*args)
+        except Exception:
+            logger.exception("Error in stream pump callback")
+
+
+_stream_pump: StreamPump | None = None
+_stream_pump_lock = threading.Lock()
+
+
+def get_stream_pump() -> StreamPump:
+    """
+    Returns the process-wide ``StreamPump``, starting it on first use.
+    """
+    global _stream_pump
+    with _stream_pump_lock:
+        if _stream_pump is None:
+            _stream_pump = StreamPump()
+        return _stream_pump
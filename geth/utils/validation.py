@@ -5,6 +5,7 @@ from __future__ import (
 from typing import (
     Any,
     Literal,
+    cast,
 )
 
 from pydantic import (
@@ -60,18 +61,47 @@ class GethKwargs(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
-def validate_geth_kwargs(geth_kwargs: GethKwargsTypedDict) -> None:
+class GethConfig(GethKwargs):
     """
-    Converts geth_kwargs to GethKwargs and raises a ValueError if the conversion fails.
+    Validated, immutable geth kwargs.  Functions that take a ``GethConfig`` in place
+    of a dict of geth kwargs use it as is, without validating it again, so that
+    kwargs that are used many times only need to be validated once.
+
+    >>> geth_config = get_geth_config({"data_dir": "some/data/dir"})
+    >>> geth_config.model_copy(update={"suffix_args": ["account", "list"]})
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    def to_kwargs(self) -> GethKwargsTypedDict:
+        """
+        Returns the kwargs that were set when the config was created as a dict.
+        """
+        return cast(GethKwargsTypedDict, self.model_dump(exclude_unset=True))
+
+
+def get_geth_config(geth_kwargs: GethKwargsTypedDict | GethConfig) -> GethConfig:
     """
+    Converts geth_kwargs to GethConfig and raises a ValueError if the conversion
+    fails.  A GethConfig is returned as is.
+    """
+    if isinstance(geth_kwargs, GethConfig):
+        return geth_kwargs
     try:
-        GethKwargs(**geth_kwargs)
+        return GethConfig(**geth_kwargs)
     except ValidationError as e:
         raise PyGethValueError(f"geth_kwargs validation failed: {e}")
     except TypeError as e:
         raise PyGethValueError(f"error while validating geth_kwargs: {e}")
 
 
+def validate_geth_kwargs(geth_kwargs: GethKwargsTypedDict | GethConfig) -> None:
+    """
+    Converts geth_kwargs to GethKwargs and raises a ValueError if the conversion fails.
+    """
+    get_geth_config(geth_kwargs)
+
+
 class GenesisDataConfig(BaseModel):
     """
     Default values are pulled from the ``genesis.json`` file internal to the repository.
@@ -2,16 +2,13 @@ from __future__ import (
     annotations,
 )
 
-from collections.abc import (
-    Iterable,
-)
-import functools
 import os
 import subprocess
 import sys
 import tempfile
 from typing import (
-    Any,
+    Literal,
+    NamedTuple,
     cast,
 )
 
@@ -31,18 +28,20 @@ from geth.utils.encoding import (
     force_bytes,
 )
 from geth.utils.filesystem import (
-    is_executable_available,
+    resolve_executable,
 )
 from geth.utils.networking import (
-    get_open_port,
-    is_port_open,
+    find_open_port,
 )
 from geth.utils.validation import (
-    GethKwargs,
+    GethConfig,
+    get_geth_config,
     validate_geth_kwargs,
 )
 
-is_nice_available = functools.partial(is_executable_available, "nice")
+
+def is_nice_available() -> bool:
+    return resolve_executable("nice") is not None
 
 
 PYGETH_DIR = os.path.abspath(os.path.dirname(__file__))
@@ -65,6 +64,14 @@ def get_max_socket_path_length() -> int:
         return 260
 
 
+# the ports that test chains use when they are available
+DEFAULT_TEST_CHAIN_PORTS: dict[Literal["port", "ws_port", "rpc_port"], int] = {
+    "port": 30303,
+    "ws_port": 8546,
+    "rpc_port": 8545,
+}
+
+
 def construct_test_chain_kwargs(
     **overrides: Unpack[GethKwargsTypedDict],
 ) -> GethKwargsTypedDict:
@@ -75,25 +82,21 @@ def construct_test_chain_kwargs(
     overrides.setdefault("max_peers", "0")
     overrides.setdefault("network_id", "1234")
 
-    if is_port_open(30303):
-        overrides.setdefault("port", "30303")
-    else:
-        overrides.setdefault("port", get_open_port())
+    # ports reserved by other test chains, even in other processes, are skipped.
+    # ``DevGethProcess`` reserves its ports itself before calling this.
+    if "port" not in overrides:
+        overrides["port"] = find_open_port(DEFAULT_TEST_CHAIN_PORTS["port"])
 
     overrides.setdefault("ws_enabled", True)
     overrides.setdefault("ws_api", ALL_APIS)
 
-    if is_port_open(8546):
-        overrides.setdefault("ws_port", "8546")
-    else:
-        overrides.setdefault("ws_port", get_open_port())
+    if "ws_port" not in overrides:
+        overrides["ws_port"] = find_open_port(DEFAULT_TEST_CHAIN_PORTS["ws_port"])
 
     overrides.setdefault("rpc_enabled", True)
     overrides.setdefault("rpc_api", ALL_APIS)
-    if is_port_open(8545):
-        overrides.setdefault("rpc_port", "8545")
-    else:
-        overrides.setdefault("rpc_port", get_open_port())
+    if "rpc_port" not in overrides:
+        overrides["rpc_port"] = find_open_port(DEFAULT_TEST_CHAIN_PORTS["rpc_port"])
 
     if "ipc_path" not in overrides:
         # try to use a `geth.ipc` within the provided data_dir if the path is
@@ -120,135 +123,94 @@ def get_geth_binary_path() -> str:
     return os.environ.get("GETH_BINARY", "geth")
 
 
-class CommandBuilder:
-    def __init__(self) -> None:
-        self.command: list[str] = []
-
-    def append(self, value: Any) -> None:
-        self.command.append(str(value))
-
-    def extend(self, value_list: Iterable[Any]) -> None:
-        self.command.extend([str(v) for v in value_list])
+class GethFlag(NamedTuple):
+    field: str
+    flag: str
+    # switches are passed without a value when the field is truthy, every other
+    # flag is followed by the value of the field when it is set
+    is_switch: bool = False
+
+
+# how ``GethKwargs`` fields map to geth flags, in command line order
+GETH_FLAGS = (
+    GethFlag("dev_mode", "--dev", is_switch=True),
+    GethFlag("dev_period", "--dev.period"),
+    GethFlag("rpc_enabled", "--http", is_switch=True),
+    GethFlag("rpc_addr", "--http.addr"),
+    GethFlag("rpc_port", "--http.port"),
+    GethFlag("rpc_api", "--http.api"),
+    GethFlag("rpc_cors_domain", "--http.corsdomain"),
+    GethFlag("ws_enabled", "--ws", is_switch=True),
+    GethFlag("ws_addr", "--ws.addr"),
+    GethFlag("ws_origins", "--ws.origins"),
+    GethFlag("ws_port", "--ws.port"),
+    GethFlag("ws_api", "--ws.api"),
+    GethFlag("data_dir", "--datadir"),
+    GethFlag("max_peers", "--maxpeers"),
+    GethFlag("network_id", "--networkid"),
+    GethFlag("port", "--port"),
+    GethFlag("ipc_disable", "--ipcdisable", is_switch=True),
+    GethFlag("ipc_path", "--ipcpath"),
+    GethFlag("verbosity", "--verbosity"),
+    GethFlag("preload", "--preload"),
+    GethFlag("no_discover", "--nodiscover", is_switch=True),
+    GethFlag("tx_pool_global_slots", "--txpool.globalslots"),
+    GethFlag("tx_pool_lifetime", "--txpool.lifetime"),
+    GethFlag("tx_pool_price_limit", "--txpool.pricelimit"),
+    GethFlag("cache", "--cache"),
+    GethFlag("gcmode", "--gcmode"),
+)
 
 
 def construct_popen_command(**geth_kwargs: Unpack[GethKwargsTypedDict]) -> list[str]:
     # validate geth_kwargs and fill defaults that may not have been provided
-    validate_geth_kwargs(geth_kwargs)
-    gk = GethKwargs(**geth_kwargs)
+    return construct_geth_command(get_geth_config(geth_kwargs))
 
-    if gk.geth_executable is None:
-        gk.geth_executable = get_geth_binary_path()
 
-    if not is_executable_available(gk.geth_executable):
+def construct_geth_command(geth_config: GethConfig) -> list[str]:
+    """
+    Builds the geth command line for kwargs that have already been validated.
+    """
+    geth_executable = geth_config.geth_executable or get_geth_binary_path()
+    if resolve_executable(geth_executable) is None:
         raise PyGethValueError(
             "No geth executable found.  Please ensure geth is installed and "
             "available on your PATH or use the GETH_BINARY environment variable"
         )
 
-    builder = CommandBuilder()
-
-    if gk.nice and is_nice_available():
-        builder.extend(("nice", "-n", "20"))
-
-    builder.append(gk.geth_executable)
-
-    if gk.dev_mode:
-        builder.append("--dev")
-
-    if gk.dev_period is not None:
-        builder.extend(("--dev.period", gk.dev_period))
-
-    if gk.rpc_enabled:
-        builder.append("--http")
-
-    if gk.rpc_addr is not None:
-        builder.extend(("--http.addr", gk.rpc_addr))
-
-    if gk.rpc_port is not None:
-        builder.extend(("--http.port", gk.rpc_port))
-
-    if gk.rpc_api is not None:
-        builder.extend(("--http.api", gk.rpc_api))
-
-    if gk.rpc_cors_domain is not None:
-        builder.extend(("--http.corsdomain", gk.rpc_cors_domain))
-
-    if gk.ws_enabled:
-        builder.append("--ws")
+    command: list[str] = []
 
-    if gk.ws_addr is not None:
-        builder.extend(("--ws.addr", gk.ws_addr))
+    if geth_config.nice and is_nice_available():
+        command.extend(("nice", "-n", "20"))
 
-    if gk.ws_origins is not None:
-        builder.extend(("--ws.origins", gk.ws_port))
+    command.append(geth_executable)
 
-    if gk.ws_port is not None:
-        builder.extend(("--ws.port", gk.ws_port))
+    for geth_flag in GETH_FLAGS:
+        value = getattr(geth_config, geth_flag.field)
+        if geth_flag.is_switch:
+            if value:
+                command.append(geth_flag.flag)
+        elif value is not None:
+            command.extend((geth_flag.flag, str(value)))
 
-    if gk.ws_api is not None:
-        builder.extend(("--ws.api", gk.ws_api))
-
-    if gk.data_dir is not None:
-        builder.extend(("--datadir", gk.data_dir))
-
-    if gk.max_peers is not None:
-        builder.extend(("--maxpeers", gk.max_peers))
-
-    if gk.network_id is not None:
-        builder.extend(("--networkid", gk.network_id))
-
-    if gk.port is not None:
-        builder.extend(("--port", gk.port))
-
-    if gk.ipc_disable:
-        builder.append("--ipcdisable")
-
-    if gk.ipc_path is not None:
-        builder.extend(("--ipcpath", gk.ipc_path))
-
-    if gk.verbosity is not None:
-        builder.extend(("--verbosity", gk.verbosity))
-
-    if isinstance(gk.password, str) and gk.password is not None:
+    if isinstance(geth_config.password, str):
         # If password is a string, it's a file path
         # If password is bytes, it's the password itself and is passed directly to
         # the geth process elsewhere
-        builder.extend(("--password", gk.password))
+        command.extend(("--password", geth_config.password))
 
-    if gk.preload is not None:
-        builder.extend(("--preload", gk.preload))
+    if geth_config.suffix_kwargs:
+        command.extend(geth_config.suffix_kwargs)
 
-    if gk.no_discover:
-        builder.append("--nodiscover")
+    if geth_config.suffix_args:
+        command.extend(geth_config.suffix_args)
 
-    if gk.tx_pool_global_slots is not None:
-        builder.extend(("--txpool.globalslots", gk.tx_pool_global_slots))
-
-    if gk.tx_pool_lifetime is not None:
-        builder.extend(("--txpool.lifetime", gk.tx_pool_lifetime))
-
-    if gk.tx_pool_price_limit is not None:
-        builder.extend(("--txpool.pricelimit", gk.tx_pool_price_limit))
-
-    if gk.cache:
-        builder.extend(("--cache", gk.cache))
-
-    if gk.gcmode:
-        builder.extend(("--gcmode", gk.gcmode))
-
-    if gk.suffix_kwargs:
-        builder.extend(gk.suffix_kwargs)
-
-    if gk.suffix_args:
-        builder.extend(gk.suffix_args)
-
-    return builder.command
+    return command
 
 
 def geth_wrapper(
     **geth_kwargs: Unpack[GethKwargsTypedDict],
 ) -> tuple[bytes, bytes, list[str], subprocess.Popen[bytes]]:
-    validate_geth_kwargs(geth_kwargs)
     stdin = geth_kwargs.pop("stdin", None)
     command = construct_popen_command(**geth_kwargs)
 
@@ -277,13 +239,12 @@ def geth_wrapper(
 
 
 def spawn_geth(
-    geth_kwargs: GethKwargsTypedDict,
+    geth_kwargs: GethKwargsTypedDict | GethConfig,
     stdin: IO_Any = subprocess.PIPE,
     stdout: IO_Any = subprocess.PIPE,
     stderr: IO_Any = subprocess.PIPE,
 ) -> tuple[list[str], subprocess.Popen[bytes]]:
-    validate_geth_kwargs(geth_kwargs)
-    command = construct_popen_command(**geth_kwargs)
+    command = construct_geth_command(get_geth_config(geth_kwargs))
 
     proc = subprocess.Popen(
         command,
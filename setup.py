@@ -5,6 +5,9 @@ from setuptools import (
 )
 
 extras_require = {
+    "benchmark": [
+        "pytest-benchmark>=4.0.0",
+    ],
     "dev": [
         "build>=0.9.0",
         "bump_my_version>=0.19.0",
@@ -18,11 +21,21 @@ extras_require = {
     "docs": [
         "towncrier>=24,<25",
     ],
+    "isal": [
+        "isal>=1.6.0",
+    ],
+    "keyfile": [
+        "eth-keyfile>=0.8.0",
+    ],
     "test": [
+        "eth-keyfile>=0.8.0",
         "flaky>=3.2.0",
         "pytest>=7.0.0",
         "pytest-xdist>=2.4.0",
     ],
+    "zstd": [
+        "zstandard>=0.22.0; python_version < '3.14'",
+    ],
 }
 
 extras_require["dev"] = (
@@ -60,6 +73,11 @@ setup(
     keywords="ethereum go-ethereum geth",
     packages=find_packages(exclude=["scripts", "scripts.*", "tests", "tests.*"]),
     package_data={"geth": ["py.typed"]},
+    entry_points={
+        "console_scripts": [
+            "py-geth-fake-geth=geth.fake_geth:main",
+        ],
+    },
     classifiers=[
         "Development Status :: 2 - Pre-Alpha",
         "Intended Audience :: Developers",
@@ -0,0 +1,71 @@
+import pytest
+import os
+
+from geth.accounts import (
+    create_new_accounts,
+    get_accounts,
+    get_genesis_alloc,
+    get_keystore_dir,
+)
+from geth.exceptions import (
+    PyGethValueError,
+)
+
+
+def test_create_new_accounts_with_geth(data_dir):
+    accounts = create_new_accounts(
+        3, jobs=2, data_dir=data_dir, password=b"some-text-password"
+    )
+
+    assert len(set(accounts)) == 3
+    assert sorted(accounts) == sorted(get_accounts(data_dir=data_dir))
+
+
+def test_create_new_accounts_in_process(data_dir):
+    pytest.importorskip("eth_keyfile")
+
+    accounts = create_new_accounts(
+        4,
+        kdf_iterations=2,
+        data_dir=data_dir,
+        password=b"some-text-password",
+    )
+
+    assert len(set(accounts)) == 4
+    assert sorted(accounts) == sorted(get_accounts(data_dir=data_dir))
+
+    keystore_dir = get_keystore_dir(data_dir)
+    assert not [name for name in os.listdir(keystore_dir) if name.startswith(".")]
+
+
+def test_in_process_key_files_decrypt_with_file_password(data_dir):
+    eth_keyfile = pytest.importorskip("eth_keyfile")
+
+    password_path = os.path.join(data_dir, "password")
+    with open(password_path, "w") as password_file:
+        password_file.write("some-text-password-in-a-file\n")
+
+    (account,) = create_new_accounts(
+        1, kdf_iterations=2, data_dir=data_dir, password=password_path
+    )
+
+    keystore_dir = get_keystore_dir(data_dir)
+    (key_file_name,) = os.listdir(keystore_dir)
+    assert key_file_name.startswith("UTC--")
+    assert key_file_name.endswith(account[2:])
+
+    private_key = eth_keyfile.extract_key_from_keyfile(
+        os.path.join(keystore_dir, key_file_name), b"some-text-password-in-a-file"
+    )
+    assert len(private_key) == 32
+
+
+def test_create_new_accounts_requires_password(data_dir):
+    with pytest.raises(PyGethValueError):
+        create_new_accounts(1, data_dir=data_dir)
+
+
+def test_get_genesis_alloc():
+    assert get_genesis_alloc(("0x" + "ab" * 20,), balance="1") == {
+        "0x" + "ab" * 20: {"balance": "1"}
+    }
@@ -0,0 +1,74 @@
+import json
+import os
+import shutil
+
+from geth.accounts import (
+    get_accounts,
+    get_keystore_accounts,
+    get_keystore_dir,
+)
+
+
+def test_keystore_accounts_in_file_name_order(three_account_data_dir):
+    accounts = get_keystore_accounts(get_keystore_dir(three_account_data_dir))
+    assert accounts == (
+        "0xae71658b3ab452f7e4f03bda6f777b860b2e2ff2",
+        "0xe8e085862a8d951dd78ec5ea784b3e22ee1ca9c6",
+        "0x0da70f43a568e88168436be52ed129f4a9bbdaf5",
+    )
+
+
+def test_missing_keystore_has_no_accounts(no_account_data_dir):
+    assert get_keystore_accounts(get_keystore_dir(no_account_data_dir)) == tuple()
+
+
+def test_non_key_files_are_ignored(tmpdir, one_account_data_dir):
+    keystore_dir = str(tmpdir.join("keystore"))
+    shutil.copytree(get_keystore_dir(one_account_data_dir), keystore_dir)
+
+    with open(os.path.join(keystore_dir, "README"), "w") as readme_file:
+        readme_file.write("not a key file")
+    with open(os.path.join(keystore_dir, ".hidden-key"), "w") as hidden_file:
+        json.dump({"address": "e8e085862a8d951dd78ec5ea784b3e22ee1ca9c6"}, hidden_file)
+    os.mkdir(os.path.join(keystore_dir, "subdirectory"))
+
+    assert get_keystore_accounts(keystore_dir) == (
+        "0xae71658b3ab452f7e4f03bda6f777b860b2e2ff2",
+    )
+
+
+def test_keystore_cache_is_invalidated_by_new_key_files(tmpdir):
+    keystore_dir = str(tmpdir.mkdir("keystore"))
+    assert get_keystore_accounts(keystore_dir, use_cache=True) == tuple()
+
+    key_path = os.path.join(
+        keystore_dir, "UTC--2015-08-24T21-30-14.222885490Z--" + "ab" * 20
+    )
+    with open(key_path, "w") as key_file:
+        json.dump({"address": "AB" * 20}, key_file)
+
+    assert get_keystore_accounts(keystore_dir, use_cache=True) == ("0x" + "ab" * 20,)
+
+
+def test_keystore_is_read_again_without_cache(tmpdir, one_account_data_dir):
+    keystore_dir = str(tmpdir.join("keystore"))
+    shutil.copytree(get_keystore_dir(one_account_data_dir), keystore_dir)
+    (key_file_name,) = os.listdir(keystore_dir)
+    assert get_keystore_accounts(keystore_dir, use_cache=True) == (
+        "0xae71658b3ab452f7e4f03bda6f777b860b2e2ff2",
+    )
+
+    # a key file replaced under the same name is only seen without the cache
+    with open(os.path.join(keystore_dir, key_file_name), "w") as key_file:
+        json.dump({"address": "AB" * 20}, key_file)
+
+    assert get_keystore_accounts(keystore_dir, use_cache=True) == (
+        "0xae71658b3ab452f7e4f03bda6f777b860b2e2ff2",
+    )
+    assert get_keystore_accounts(keystore_dir) == ("0x" + "ab" * 20,)
+
+
+def test_get_accounts_with_subprocess_matches_keystore(three_account_data_dir):
+    assert sorted(
+        get_accounts(use_subprocess=True, data_dir=three_account_data_dir)
+    ) == sorted(get_accounts(data_dir=three_account_data_dir))
@@ -0,0 +1,82 @@
+import pytest
+import http.server
+import threading
+
+
+class FileServer(http.server.ThreadingHTTPServer):
+    """
+    Serves ``files`` (path -> bytes) with support for HTTP Range requests.
+    ``truncate_next`` cuts the next response short to simulate a dropped
+    connection.
+    """
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FileRequestHandler)
+        self.files = {}
+        self.extra_headers = {}
+        self.requests = []
+        self.truncate_next = False
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class FileRequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.requests.append((self.path, dict(self.headers)))
+        content = self.server.files.get(self.path)
+        if content is None:
+            self.send_error(404)
+            return
+
+        start = 0
+        range_header = self.headers.get("Range")
+        if range_header:
+            start = int(range_header.split("=")[1].rstrip("-"))
+            if start >= len(content):
+                self.send_error(416)
+                return
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(content) - 1}/{len(content)}"
+            )
+        else:
+            self.send_response(200)
+
+        body = content[start:]
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in self.server.extra_headers.get(self.path, {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+        if self.server.truncate_next:
+            self.server.truncate_next = False
+            self.wfile.write(body[: len(body) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def file_server():
+    server = FileServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def artifact_cache_dir(tmpdir, monkeypatch):
+    cache_dir = str(tmpdir.mkdir("artifact-cache"))
+    monkeypatch.setenv("GETH_ARTIFACT_CACHE_DIR", cache_dir)
+    monkeypatch.delenv("GETH_SHARED_ARTIFACT_CACHE_DIRS", raising=False)
+    return cache_dir
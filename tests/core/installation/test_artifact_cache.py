@@ -0,0 +1,106 @@
+import pytest
+import json
+import os
+import subprocess
+
+from geth.artifacts import (
+    ARTIFACT_METADATA_FILENAME,
+    find_artifact,
+    get_artifact_key,
+    store_artifact,
+)
+import geth.install
+from geth.install import (
+    V1_17_1,
+    get_arch,
+    get_executable_path,
+    get_platform,
+    install_from_source_code_release,
+)
+from geth.utils.filesystem import (
+    get_file_sha256,
+)
+
+FAKE_GETH_SCRIPT = b"#!/bin/sh\necho 'Geth\nVersion: 1.17.1-stable'\n"
+
+
+@pytest.fixture
+def fake_geth(tmpdir):
+    path = str(tmpdir.join("geth"))
+    with open(path, "wb") as f:
+        f.write(FAKE_GETH_SCRIPT)
+    os.chmod(path, 0o755)
+    return path
+
+
+def test_stored_artifacts_are_found(fake_geth):
+    artifact_key = get_artifact_key("binary", V1_17_1, "linux", "amd64", "go1.24.0")
+
+    assert find_artifact(artifact_key, "geth") is None
+    cached_path = store_artifact(artifact_key, "geth", fake_geth)
+
+    assert find_artifact(artifact_key, "geth") == cached_path
+    with open(cached_path, "rb") as f:
+        assert f.read() == FAKE_GETH_SCRIPT
+
+
+def test_artifact_keys_include_the_go_version():
+    assert get_artifact_key(
+        "binary", V1_17_1, "linux", "amd64", "go1.24.0"
+    ) != get_artifact_key("binary", V1_17_1, "linux", "amd64", "go1.25.0")
+
+
+def test_shared_caches_are_searched(fake_geth, tmpdir, monkeypatch):
+    artifact_key = get_artifact_key("source", V1_17_1)
+    shared_path = store_artifact(artifact_key, "release.tar.gz", fake_geth)
+
+    shared_cache_dir = os.environ["GETH_ARTIFACT_CACHE_DIR"]
+    monkeypatch.setenv("GETH_ARTIFACT_CACHE_DIR", str(tmpdir.mkdir("empty-cache")))
+    monkeypatch.setenv(
+        "GETH_SHARED_ARTIFACT_CACHE_DIRS",
+        os.pathsep.join((str(tmpdir.join("missing")), shared_cache_dir)),
+    )
+
+    assert find_artifact(artifact_key, "release.tar.gz") == shared_path
+
+
+def test_source_install_uses_cached_binary(fake_geth, tmpdir, monkeypatch):
+    monkeypatch.setenv("GETH_BASE_INSTALL_PATH", str(tmpdir.mkdir("install")))
+    monkeypatch.setattr(geth.install, "get_go_version", lambda: "go1.24.0")
+
+    def fail(identifier):
+        raise AssertionError("should have used the cached binary")
+
+    monkeypatch.setattr(geth.install, "download_source_code_release", fail)
+    monkeypatch.setattr(geth.install, "build_from_source_code", fail)
+
+    store_artifact(
+        get_artifact_key("binary", V1_17_1, get_platform(), get_arch(), "go1.24.0"),
+        "geth",
+        fake_geth,
+    )
+
+    install_from_source_code_release(V1_17_1)
+
+    version_output = subprocess.check_output((get_executable_path(V1_17_1), "version"))
+    assert b"Version: 1.17.1-stable" in version_output
+
+
+def test_corrupted_artifacts_are_skipped_and_replaced(fake_geth):
+    artifact_key = get_artifact_key("binary", V1_17_1, "linux", "amd64", "go1.24.0")
+    cached_path = store_artifact(artifact_key, "geth", fake_geth)
+
+    metadata_path = os.path.join(
+        os.path.dirname(cached_path), ARTIFACT_METADATA_FILENAME
+    )
+    with open(metadata_path) as f:
+        assert json.load(f)["sha256"] == get_file_sha256(fake_geth)
+
+    with open(cached_path, "r+b") as f:
+        f.truncate(10)
+    assert find_artifact(artifact_key, "geth") is None
+
+    assert store_artifact(artifact_key, "geth", fake_geth) == cached_path
+    assert find_artifact(artifact_key, "geth") == cached_path
+    with open(cached_path, "rb") as f:
+        assert f.read() == FAKE_GETH_SCRIPT
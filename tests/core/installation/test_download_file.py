@@ -0,0 +1,100 @@
+import pytest
+import hashlib
+import os
+
+from geth.exceptions import (
+    PyGethException,
+    PyGethValueError,
+)
+import geth.install
+from geth.install import (
+    V1_17_1,
+    download_file,
+    download_source_code_release,
+    get_source_code_archive_path,
+)
+
+CONTENT = os.urandom(300_000)
+CONTENT_SHA256 = hashlib.sha256(CONTENT).hexdigest()
+
+
+def test_download_file(file_server, tmpdir):
+    file_server.files["/release.tar.gz"] = CONTENT
+    path = str(tmpdir.join("release.tar.gz"))
+
+    download_file(f"{file_server.url}/release.tar.gz", path, CONTENT_SHA256)
+
+    with open(path, "rb") as f:
+        assert f.read() == CONTENT
+    assert not os.path.exists(f"{path}.part")
+
+
+def test_interrupted_download_is_resumed(file_server, tmpdir):
+    file_server.files["/release.tar.gz"] = CONTENT
+    file_server.truncate_next = True
+    path = str(tmpdir.join("release.tar.gz"))
+    uri = f"{file_server.url}/release.tar.gz"
+
+    with pytest.raises(PyGethException):
+        download_file(uri, path)
+    assert not os.path.exists(path)
+    partial_size = os.path.getsize(f"{path}.part")
+    assert 0 < partial_size < len(CONTENT)
+
+    download_file(uri, path, CONTENT_SHA256)
+
+    _, resumed_headers = file_server.requests[-1]
+    assert resumed_headers["Range"] == f"bytes={partial_size}-"
+    with open(path, "rb") as f:
+        assert f.read() == CONTENT
+
+
+def test_stale_partial_download_is_restarted(file_server, tmpdir):
+    file_server.files["/release.tar.gz"] = CONTENT
+    path = str(tmpdir.join("release.tar.gz"))
+    with open(f"{path}.part", "wb") as f:
+        f.write(b"\0" * (len(CONTENT) + 1))
+
+    download_file(f"{file_server.url}/release.tar.gz", path, CONTENT_SHA256)
+
+    with open(path, "rb") as f:
+        assert f.read() == CONTENT
+
+
+def test_checksum_mismatch(file_server, tmpdir):
+    file_server.files["/release.tar.gz"] = CONTENT
+    path = str(tmpdir.join("release.tar.gz"))
+
+    with pytest.raises(PyGethValueError, match="Checksum mismatch"):
+        download_file(f"{file_server.url}/release.tar.gz", path, "00" * 32)
+
+    assert not os.path.exists(path)
+    assert not os.path.exists(f"{path}.part")
+
+
+def test_http_error(file_server, tmpdir):
+    with pytest.raises(PyGethException):
+        download_file(f"{file_server.url}/missing", str(tmpdir.join("missing")))
+
+
+def test_source_code_release_is_checked_against_pinned_sha256(
+    file_server, tmpdir, monkeypatch
+):
+    monkeypatch.setenv("GETH_BASE_INSTALL_PATH", str(tmpdir.mkdir("install")))
+    monkeypatch.setattr(
+        geth.install,
+        "DOWNLOAD_SOURCE_CODE_URI_TEMPLATE",
+        f"{file_server.url}/{{0}}.tar.gz",
+    )
+    monkeypatch.setitem(geth.install.SOURCE_CODE_SHA256, V1_17_1, "00" * 32)
+    file_server.files[f"/{V1_17_1}.tar.gz"] = CONTENT
+
+    with pytest.raises(PyGethValueError, match="Checksum mismatch"):
+        download_source_code_release(V1_17_1)
+    assert not os.path.exists(get_source_code_archive_path(V1_17_1))
+
+    monkeypatch.setitem(geth.install.SOURCE_CODE_SHA256, V1_17_1, CONTENT_SHA256)
+    download_source_code_release(V1_17_1)
+
+    with open(get_source_code_archive_path(V1_17_1), "rb") as f:
+        assert f.read() == CONTENT
@@ -0,0 +1,106 @@
+import pytest
+import io
+import os
+import shutil
+import tarfile
+
+from geth.exceptions import (
+    PyGethException,
+)
+import geth.install
+from geth.install import (
+    V1_17_1,
+    extract_source_code_release,
+    get_source_code_archive_path,
+    get_source_code_path,
+)
+
+SOURCE_FILES = {
+    "Makefile": b"geth:\n",
+    "cmd/geth/main.go": b"package main\n",
+    "cmd/geth/main_test.go": b"package main\n",
+    "docs/postmortems/README.md": b"# postmortems\n",
+}
+
+
+def write_archive(identifier, members):
+    archive_path = get_source_code_archive_path(identifier)
+    os.makedirs(os.path.dirname(archive_path), exist_ok=True)
+    with tarfile.open(archive_path, "w:gz") as archive_file:
+        for member, data in members:
+            archive_file.addfile(member, io.BytesIO(data) if data else None)
+
+
+def source_members(identifier, files):
+    top_level = f"go-ethereum-{identifier.lstrip('v')}"
+    members = [(tarfile.TarInfo(top_level), None)]
+    members[0][0].type = tarfile.DIRTYPE
+    for name, data in files.items():
+        member = tarfile.TarInfo(f"{top_level}/{name}")
+        member.size = len(data)
+        members.append((member, data))
+    return members
+
+
+def extracted_files(identifier):
+    source_code_path = get_source_code_path(identifier)
+    return sorted(
+        os.path.relpath(os.path.join(root, name), source_code_path)
+        for root, _, names in os.walk(source_code_path)
+        for name in names
+    )
+
+
+@pytest.fixture(autouse=True)
+def base_install_path(tmpdir, monkeypatch):
+    monkeypatch.setenv("GETH_BASE_INSTALL_PATH", str(tmpdir))
+
+
+@pytest.fixture(params=["gzip", "pigz"])
+def decompressor(request, monkeypatch):
+    if request.param == "pigz":
+        if shutil.which("pigz") is None:
+            pytest.skip("pigz is not installed")
+    else:
+        monkeypatch.setattr(geth.install.shutil, "which", lambda program: None)
+
+
+def test_tests_and_docs_are_not_extracted(decompressor):
+    write_archive(V1_17_1, source_members(V1_17_1, SOURCE_FILES))
+
+    extract_source_code_release(V1_17_1)
+
+    assert extracted_files(V1_17_1) == ["Makefile", "cmd/geth/main.go"]
+    with open(os.path.join(get_source_code_path(V1_17_1), "Makefile"), "rb") as f:
+        assert f.read() == b"geth:\n"
+
+
+def test_include_and_exclude_filters(decompressor):
+    write_archive(V1_17_1, source_members(V1_17_1, SOURCE_FILES))
+
+    extract_source_code_release(V1_17_1, include=["cmd/*"], exclude=[])
+
+    assert extracted_files(V1_17_1) == ["cmd/geth/main.go", "cmd/geth/main_test.go"]
+
+
+@pytest.mark.parametrize(
+    "name,linkname,type",
+    (
+        ("../escaped.go", "", tarfile.REGTYPE),
+        ("/tmp/escaped.go", "", tarfile.REGTYPE),
+        ("go-ethereum-1.17.1/link", "../../../escaped", tarfile.SYMTYPE),
+        ("go-ethereum-1.17.1/link", "/etc/passwd", tarfile.LNKTYPE),
+        ("go-ethereum-1.17.1/device", "", tarfile.CHRTYPE),
+    ),
+)
+def test_unsafe_members_are_rejected(tmpdir, name, linkname, type):
+    member = tarfile.TarInfo(name)
+    member.type = type
+    member.linkname = linkname
+    write_archive(V1_17_1, [(member, None)])
+
+    with pytest.raises(PyGethException):
+        extract_source_code_release(V1_17_1)
+
+    assert not os.path.exists(os.path.join(str(tmpdir), "escaped.go"))
+    assert not os.path.exists(os.path.join(str(tmpdir), "escaped"))
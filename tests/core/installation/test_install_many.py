@@ -0,0 +1,60 @@
+import pytest
+import threading
+import time
+
+from geth.exceptions import (
+    PyGethException,
+)
+import geth.install
+from geth.install import (
+    V1_16_9,
+    V1_17_0,
+    V1_17_1,
+    get_go_build_env,
+    install_geth_many,
+)
+
+
+@pytest.fixture
+def installs(monkeypatch):
+    installs = []
+    lock = threading.Lock()
+    running = []
+
+    def fake_install_geth(identifier, platform=None, from_source=False):
+        with lock:
+            running.append(identifier)
+            installs.append((identifier, len(running)))
+        time.sleep(0.2)
+        with lock:
+            running.remove(identifier)
+        if identifier == V1_16_9:
+            raise PyGethException("build failed")
+
+    monkeypatch.setattr(geth.install, "install_geth", fake_install_geth)
+    return installs
+
+
+def test_versions_are_installed_concurrently(installs):
+    install_geth_many([V1_17_0, V1_17_1, V1_17_0], jobs=2)
+
+    assert sorted(identifier for identifier, _ in installs) == [V1_17_0, V1_17_1]
+    assert max(concurrency for _, concurrency in installs) == 2
+
+
+def test_failures_are_raised_after_all_installs(installs):
+    with pytest.raises(PyGethException, match=f"geth=={V1_16_9}: build failed"):
+        install_geth_many([V1_16_9, V1_17_0, V1_17_1], jobs=1)
+
+    assert len(installs) == 3
+
+
+def test_go_cache_dir_is_shared_between_builds(monkeypatch, tmpdir):
+    monkeypatch.delenv("GOCACHE", raising=False)
+    monkeypatch.delenv("GOMODCACHE", raising=False)
+    monkeypatch.setenv("GETH_GO_CACHE_DIR", str(tmpdir))
+
+    env = get_go_build_env()
+
+    assert env["GOCACHE"] == str(tmpdir.join("build"))
+    assert env["GOMODCACHE"] == str(tmpdir.join("mod"))
@@ -0,0 +1,142 @@
+import pytest
+import base64
+import hashlib
+import io
+import os
+import subprocess
+import tarfile
+
+from geth import (
+    install_geth,
+)
+from geth.exceptions import (
+    PyGethValueError,
+)
+from geth.install import (
+    INSTALL_FUNCTIONS,
+    V1_17_1,
+    get_arch,
+    get_executable_path,
+    get_platform,
+    install_from_prebuilt_release,
+)
+
+pytestmark = pytest.mark.skipif(
+    get_platform() not in INSTALL_FUNCTIONS, reason="Unsupported platform"
+)
+
+FAKE_GETH_SCRIPT = b"#!/bin/sh\necho 'Geth\nVersion: 1.17.1-stable'\n"
+
+
+def make_archive(archive_dir):
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode="w:gz") as tar:
+        for name, content, mode in (
+            ("COPYING", b"license", 0o644),
+            ("geth", FAKE_GETH_SCRIPT, 0o755),
+        ):
+            info = tarfile.TarInfo(f"{archive_dir}/{name}")
+            info.size = len(content)
+            info.mode = mode
+            tar.addfile(info, io.BytesIO(content))
+    return archive.getvalue()
+
+
+def make_listing(*blobs):
+    entries = "".join(
+        f"<Blob><Name>{name}</Name><Properties>"
+        f"<Content-MD5>{content_md5}</Content-MD5></Properties></Blob>"
+        for name, content_md5 in blobs
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?><EnumerationResults>'
+        f"<Blobs>{entries}</Blobs></EnumerationResults>"
+    ).encode()
+
+
+@pytest.fixture
+def prebuilt_release(file_server, tmpdir, monkeypatch):
+    monkeypatch.setenv("GETH_BASE_INSTALL_PATH", str(tmpdir.mkdir("install")))
+    monkeypatch.setenv("GETH_PREBUILT_BASE_URI", f"{file_server.url}/builds")
+
+    prefix = f"geth-{get_platform()}-{get_arch()}-1.17.1-"
+    archive_dir = f"{prefix}aaaabbbb"
+    archive = make_archive(archive_dir)
+    content_md5 = base64.b64encode(hashlib.md5(archive).digest()).decode()
+
+    listing_path = f"/builds?restype=container&comp=list&prefix={prefix}"
+    file_server.files[listing_path] = make_listing(
+        (f"{archive_dir}.tar.gz.asc", "c2lnbmF0dXJl"),
+        (f"{archive_dir}.tar.gz", content_md5),
+    )
+    file_server.files[f"/builds/{archive_dir}.tar.gz"] = archive
+    return file_server, listing_path
+
+
+def test_install_from_prebuilt_release(prebuilt_release):
+    install_from_prebuilt_release(V1_17_1)
+
+    executable_path = get_executable_path(V1_17_1)
+    version_output = subprocess.check_output((executable_path, "version"))
+    assert b"Version: 1.17.1-stable" in version_output
+
+
+def test_prebuilt_release_checksum_mismatch(prebuilt_release):
+    file_server, listing_path = prebuilt_release
+    file_server.files[listing_path] = file_server.files[listing_path].replace(
+        b"</Content-MD5></Properties></Blob></Blobs>",
+        b"x</Content-MD5></Properties></Blob></Blobs>",
+    )
+
+    with pytest.raises(PyGethValueError, match="Checksum mismatch"):
+        install_from_prebuilt_release(V1_17_1)
+    assert not os.path.exists(get_executable_path(V1_17_1))
+
+
+def test_install_geth_prefers_prebuilt_release(prebuilt_release, monkeypatch):
+    def fail_source_install():
+        raise AssertionError("should not build from source")
+
+    monkeypatch.setitem(INSTALL_FUNCTIONS[get_platform()], V1_17_1, fail_source_install)
+
+    install_geth(V1_17_1)
+
+    assert os.path.exists(get_executable_path(V1_17_1))
+
+
+def test_install_geth_falls_back_to_source(prebuilt_release, monkeypatch):
+    file_server, listing_path = prebuilt_release
+    file_server.files[listing_path] = make_listing()
+    source_installs = []
+    monkeypatch.setitem(
+        INSTALL_FUNCTIONS[get_platform()], V1_17_1, lambda: source_installs.append(1)
+    )
+
+    install_geth(V1_17_1)
+
+    assert source_installs == [1]
+
+
+def test_install_geth_from_source(prebuilt_release, monkeypatch):
+    file_server, _ = prebuilt_release
+    source_installs = []
+    monkeypatch.setitem(
+        INSTALL_FUNCTIONS[get_platform()], V1_17_1, lambda: source_installs.append(1)
+    )
+
+    install_geth(V1_17_1, from_source=True)
+
+    assert source_installs == [1]
+    assert not file_server.requests
+
+
+def test_prebuilt_release_is_cached(prebuilt_release, tmpdir, monkeypatch):
+    file_server, _ = prebuilt_release
+    install_from_prebuilt_release(V1_17_1)
+    request_count = len(file_server.requests)
+
+    monkeypatch.setenv("GETH_BASE_INSTALL_PATH", str(tmpdir.mkdir("other-install")))
+    install_from_prebuilt_release(V1_17_1)
+
+    assert len(file_server.requests) == request_count
+    assert os.path.exists(get_executable_path(V1_17_1))
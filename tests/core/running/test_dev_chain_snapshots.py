@@ -0,0 +1,133 @@
+import pytest
+import os
+import time
+
+from geth import (
+    DevGethProcess,
+)
+import geth.chain
+from geth.chain import (
+    get_chain_snapshots_dir,
+)
+from geth.exceptions import (
+    PyGethValueError,
+)
+from geth.utils.networking import (
+    ipc_request,
+)
+
+
+def get_block_number(dev_geth):
+    return int(ipc_request(dev_geth.ipc_path, "eth_blockNumber"), 16)
+
+
+def test_revert_restores_stopped_data_dir(base_dir):
+    geth = DevGethProcess("testing", base_dir=base_dir)
+    snapshot_id = geth.snapshot()
+
+    marker_path = os.path.join(geth.data_dir, "marker")
+    with open(marker_path, "w") as marker_file:
+        marker_file.write("added after the snapshot")
+    os.remove(os.path.join(geth.data_dir, "genesis.json"))
+
+    geth.revert(snapshot_id)
+
+    assert not os.path.exists(marker_path)
+    assert os.path.exists(os.path.join(geth.data_dir, "genesis.json"))
+
+    # a snapshot can be reverted to more than once
+    with open(marker_path, "w") as marker_file:
+        marker_file.write("added again")
+    geth.revert(snapshot_id)
+    assert not os.path.exists(marker_path)
+
+    with geth:
+        assert geth.is_alive
+
+
+def test_revert_rewinds_running_node(fake_geth, base_dir):
+    with DevGethProcess(
+        "testing", base_dir=base_dir, overrides={"dev_period": "1"}
+    ) as dev_geth:
+        dev_geth.wait_for_ipc(5)
+        snapshot_id = dev_geth.snapshot()
+        snapshot_block = get_block_number(dev_geth)
+
+        deadline = time.monotonic() + 5
+        while get_block_number(dev_geth) <= snapshot_block:
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+
+        dev_geth.revert(snapshot_id)
+        # a block may be mined between the rewind and the check
+        assert get_block_number(dev_geth) in (snapshot_block, snapshot_block + 1)
+
+
+def test_failed_revert_keeps_data_dir(base_dir, monkeypatch):
+    dev_geth = DevGethProcess("testing", base_dir=base_dir)
+    snapshot_id = dev_geth.snapshot()
+
+    marker_path = os.path.join(dev_geth.data_dir, "marker")
+    with open(marker_path, "w") as marker_file:
+        marker_file.write("added after the snapshot")
+
+    def failing_copy_tree(src, dst):
+        with open(os.path.join(dst, "partial"), "w"):
+            pass
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(geth.chain, "copy_tree", failing_copy_tree)
+
+    with pytest.raises(OSError, match="No space left"):
+        dev_geth.revert(snapshot_id)
+
+    assert os.path.exists(marker_path)
+    assert not os.path.exists(os.path.join(dev_geth.data_dir, "partial"))
+    assert sorted(os.listdir(os.path.dirname(dev_geth.data_dir))) == [
+        "testing",
+        "testing.snapshots",
+    ]
+
+
+def test_delete_snapshots(fake_geth, base_dir):
+    dev_geth = DevGethProcess("testing", base_dir=base_dir)
+    snapshot_id = dev_geth.snapshot()
+    other_snapshot_id = dev_geth.snapshot()
+    snapshots_dir = get_chain_snapshots_dir(dev_geth.data_dir)
+
+    dev_geth.delete_snapshot(snapshot_id)
+
+    assert os.listdir(snapshots_dir) == [other_snapshot_id]
+    with pytest.raises(PyGethValueError):
+        dev_geth.revert(snapshot_id)
+    with pytest.raises(PyGethValueError):
+        dev_geth.delete_snapshot(snapshot_id)
+
+    with dev_geth:
+        dev_geth.wait_for_ipc(5)
+        head_snapshot_id = dev_geth.snapshot()
+        dev_geth.delete_snapshot(head_snapshot_id)
+        with pytest.raises(PyGethValueError):
+            dev_geth.revert(head_snapshot_id)
+
+    dev_geth.delete_snapshots()
+
+    assert not os.path.exists(snapshots_dir)
+    with pytest.raises(PyGethValueError):
+        dev_geth.revert(other_snapshot_id)
+
+
+def test_revert_requires_matching_node_state(base_dir):
+    dev_geth = DevGethProcess("testing", base_dir=base_dir)
+    snapshot_id = dev_geth.snapshot()
+
+    with dev_geth:
+        with pytest.raises(PyGethValueError):
+            dev_geth.revert(snapshot_id)
+
+
+def test_revert_to_unknown_snapshot(base_dir):
+    dev_geth = DevGethProcess("testing", base_dir=base_dir)
+
+    with pytest.raises(PyGethValueError):
+        dev_geth.revert("unknown")
@@ -0,0 +1,64 @@
+import pytest
+import copy
+import json
+import os
+
+from geth import (
+    DevGethProcess,
+)
+import geth.process
+
+
+@pytest.fixture(autouse=True)
+def template_cache_dir(tmpdir, monkeypatch):
+    cache_dir = str(tmpdir.mkdir("template-cache"))
+    monkeypatch.setenv("GETH_TEMPLATE_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+def test_first_chain_populates_template_cache(base_dir, template_cache_dir):
+    DevGethProcess("testing", base_dir=base_dir, use_template_cache=True)
+
+    assert len(os.listdir(template_cache_dir)) == 1
+
+
+def test_fresh_chain_is_cloned_from_template(base_dir, monkeypatch):
+    geth_0 = DevGethProcess("chain-0", base_dir=base_dir, use_template_cache=True)
+
+    def fail_initialize_chain(*args, **kwargs):
+        raise AssertionError("chain should have been cloned from the template")
+
+    monkeypatch.setattr(geth.process, "initialize_chain", fail_initialize_chain)
+
+    geth_1 = DevGethProcess("chain-1", base_dir=base_dir, use_template_cache=True)
+
+    assert geth_1.data_dir != geth_0.data_dir
+    assert geth_1.accounts == geth_0.accounts
+
+    with open(os.path.join(geth_1.data_dir, "genesis.json")) as genesis_file:
+        genesis_data = json.load(genesis_file)
+    assert genesis_data["coinbase"] == geth_1.accounts[0]
+
+    with geth_1:
+        assert geth_1.is_alive
+
+
+def test_different_genesis_data_uses_different_template(base_dir, template_cache_dir):
+    genesis_data = copy.deepcopy(geth.process.GENESIS_JSON)
+    genesis_data["gasLimit"] = "0x1c9c380"
+
+    DevGethProcess("chain-0", base_dir=base_dir, use_template_cache=True)
+    DevGethProcess(
+        "chain-1",
+        base_dir=base_dir,
+        genesis_data=genesis_data,
+        use_template_cache=True,
+    )
+
+    assert len(os.listdir(template_cache_dir)) == 2
+
+
+def test_template_cache_is_opt_in(base_dir, template_cache_dir):
+    DevGethProcess("testing", base_dir=base_dir)
+
+    assert not os.listdir(template_cache_dir)
@@ -0,0 +1,95 @@
+import pytest
+
+from geth import (
+    DevGethProcess,
+    DevGethProcessPool,
+)
+from geth.exceptions import (
+    PyGethException,
+    PyGethValueError,
+)
+from geth.utils.timeout import (
+    Timeout,
+)
+
+
+@pytest.fixture
+def pool(base_dir):
+    with DevGethProcessPool(size=1, base_dir=base_dir) as geth_pool:
+        yield geth_pool
+
+
+def test_leased_nodes_are_ready(pool):
+    with pool.leased() as geth:
+        assert geth.is_alive
+        assert geth.is_ipc_ready
+
+
+def test_released_nodes_are_replaced_on_a_fresh_data_dir(pool):
+    first_geth = pool.lease()
+    first_accounts = first_geth.accounts
+    pool.release(first_geth)
+
+    with pool.leased(timeout=60) as second_geth:
+        assert second_geth is not first_geth
+        assert second_geth.data_dir != first_geth.data_dir
+        assert second_geth.accounts == first_accounts
+        assert second_geth.is_alive
+
+    assert first_geth.is_stopped
+
+
+def test_lease_times_out_when_all_nodes_are_in_use(pool):
+    with pool.leased():
+        with pytest.raises(Timeout):
+            pool.lease(timeout=0)
+
+
+def test_releasing_a_foreign_process_is_rejected(pool, base_dir):
+    with pytest.raises(PyGethValueError):
+        pool.release(DevGethProcess("foreign", base_dir=base_dir))
+
+
+def test_close_stops_leased_nodes(base_dir):
+    pool = DevGethProcessPool(size=2, base_dir=base_dir)
+    geth = pool.lease()
+    pool.close()
+
+    assert geth.is_stopped
+    with pytest.raises(PyGethValueError):
+        pool.lease()
+
+
+def test_close_waits_for_replacement_nodes(base_dir):
+    pool = DevGethProcessPool(size=1, base_dir=base_dir)
+    start_process = pool._start_process
+    replacements = []
+
+    def record_replacement():
+        replacements.append(start_process())
+        return replacements[-1]
+
+    pool._start_process = record_replacement
+    pool.release(pool.lease())
+    pool.close()
+
+    assert not pool._replacements
+    assert len(replacements) <= 1
+    assert all(geth.is_stopped for geth in replacements)
+
+
+def test_failed_replacement_is_raised_by_lease(pool):
+    start_process = pool._start_process
+
+    def fail_once():
+        pool._start_process = start_process
+        raise PyGethException("no geth for you")
+
+    pool._start_process = fail_once
+    pool.release(pool.lease())
+    with pytest.raises(PyGethException, match="no geth for you"):
+        pool.lease(timeout=60)
+
+    # another replacement is started for the next lease
+    with pool.leased(timeout=60) as geth:
+        assert geth.is_alive
@@ -0,0 +1,110 @@
+import pytest
+import subprocess
+import sys
+import threading
+
+from geth import (
+    DevGethProcess,
+)
+from geth.mixins import (
+    InterceptedStreamsMixin,
+)
+from geth.utils.readiness import (
+    ReadinessMonitor,
+)
+from geth.utils.streams import (
+    IS_STREAM_PUMP_SUPPORTED,
+)
+
+
+class InterceptedGeth(InterceptedStreamsMixin, DevGethProcess):
+    pass
+
+
+class ScriptProcess:
+    def __init__(self, script):
+        self.script = script
+        self.readiness = ReadinessMonitor()
+
+    def start(self):
+        self.proc = subprocess.Popen(
+            (sys.executable, "-c", self.script),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+    def stop(self):
+        self.proc.wait()
+
+
+class InterceptedScript(InterceptedStreamsMixin, ScriptProcess):
+    pass
+
+
+def test_batch_callbacks_receive_stripped_lines(base_dir):
+    batches = []
+    lines = []
+
+    geth = InterceptedGeth("testing", base_dir=base_dir)
+    geth.register_stderr_batch_callback(batches.append)
+    geth.register_stderr_callback(lines.append)
+
+    with geth:
+        geth.wait_for_ipc(timeout=60)
+
+    assert batches
+    assert [line for batch in batches for line in batch] == lines
+    assert all(line == line.strip() for line in lines)
+
+
+def test_bounded_queue_counts_dropped_lines(base_dir):
+    geth = InterceptedGeth(
+        "testing",
+        base_dir=base_dir,
+        queue_maxsize=1,
+        queue_overflow_policy="count-and-drop",
+    )
+    assert geth.stderr_queue.maxsize == 1
+
+    with geth:
+        geth.wait_for_ipc(timeout=60)
+
+    assert geth.is_stopped
+    assert isinstance(geth.dropped_stderr_lines, int)
+
+
+@pytest.mark.skipif(
+    not IS_STREAM_PUMP_SUPPORTED,
+    reason="The stream pump is not supported on this platform",
+)
+def test_full_bounded_queue_does_not_stall_other_processes():
+    stalled = InterceptedScript(
+        "import sys\nfor i in range(10000): sys.stderr.write(f'{i}\\n')",
+        queue_maxsize=1,
+    )
+    release = threading.Event()
+    stalled_lines = []
+    stalled_done = threading.Event()
+
+    def stall(line):
+        release.wait(30)
+        stalled_lines.append(line)
+        if len(stalled_lines) == 10000:
+            stalled_done.set()
+
+    stalled.register_stderr_callback(stall)
+    stalled.start()
+
+    other = InterceptedScript("import sys; sys.stderr.write('still flowing\\n')")
+    other_received = threading.Event()
+    other.register_stderr_callback(lambda line: other_received.set())
+    other.start()
+    assert other_received.wait(10)
+    other.stop()
+
+    release.set()
+    assert stalled_done.wait(30)
+    stalled.stop()
+    # the default policy holds up the process instead of dropping its output
+    assert stalled_lines == [str(i).encode() for i in range(10000)]
+    assert stalled.dropped_stderr_lines == 0
@@ -0,0 +1,83 @@
+import pytest
+import asyncio
+
+from geth import (
+    AsyncDevGethProcess,
+    DevGethProcess,
+    stop_all,
+)
+from geth.exceptions import (
+    PyGethTypeError,
+)
+
+
+def test_start_and_stop(base_dir):
+    async def run():
+        geth = AsyncDevGethProcess("testing", base_dir=base_dir)
+
+        await geth.start()
+        assert geth.is_running
+        assert geth.is_alive
+
+        await geth.stop()
+        assert not geth.is_running
+        assert geth.is_stopped
+
+    asyncio.run(run())
+
+
+def test_using_as_an_async_context_manager(base_dir):
+    async def run():
+        geth = AsyncDevGethProcess("testing", base_dir=base_dir)
+        stderr_lines = []
+        geth.register_stderr_callback(stderr_lines.append)
+
+        async with geth:
+            await geth.wait_for_ipc(timeout=20)
+            await geth.wait_for_rpc(timeout=20)
+            assert geth.is_alive
+
+        assert geth.is_stopped
+        assert stderr_lines
+
+    asyncio.run(run())
+
+
+def test_many_processes_on_one_event_loop(base_dir):
+    async def run():
+        processes = [
+            AsyncDevGethProcess(f"testing-{i}", base_dir=base_dir) for i in range(3)
+        ]
+        await asyncio.gather(*(geth.start() for geth in processes))
+        await asyncio.gather(*(geth.wait_for_ipc(timeout=20) for geth in processes))
+        await asyncio.gather(*(geth.stop() for geth in processes))
+
+        assert all(geth.is_stopped for geth in processes)
+
+    asyncio.run(run())
+
+
+def test_sync_context_manager_is_rejected(base_dir):
+    geth = AsyncDevGethProcess("testing", base_dir=base_dir)
+
+    with pytest.raises(PyGethTypeError):
+        with geth:
+            pass
+
+
+def test_stop_all_rejects_async_processes(base_dir):
+    async def run():
+        sync_geth = DevGethProcess("testing-sync", base_dir=base_dir)
+        async_geth = AsyncDevGethProcess("testing-async", base_dir=base_dir)
+
+        sync_geth.start()
+        async with async_geth:
+            with pytest.raises(PyGethTypeError, match="await its"):
+                stop_all([sync_geth, async_geth])
+
+            # nothing is stopped if any of the processes is rejected
+            assert sync_geth.is_alive
+            assert async_geth.is_alive
+        sync_geth.stop()
+
+    asyncio.run(run())
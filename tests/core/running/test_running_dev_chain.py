@@ -1,10 +1,22 @@
 import copy
+import gc
 import json
 import os
 import re
 
 from geth import (
     DevGethProcess,
+    stop_all,
+)
+from geth.utils.networking import (
+    release_port,
+    reserve_port,
+)
+from geth.utils.proc import (
+    EPHEMERAL_SHUTDOWN_POLICY,
+)
+from geth.utils.validation import (
+    GethConfig,
 )
 
 # open genesis.json file from geth main directory
@@ -93,3 +105,67 @@ def test_default_config(base_dir):
     assert geth.is_alive
     geth.stop()
     assert geth.is_stopped
+
+
+def test_shutdown_policy(base_dir):
+    geth = DevGethProcess("testing", base_dir=base_dir)
+    geth.shutdown_policy = EPHEMERAL_SHUTDOWN_POLICY
+
+    geth.start()
+    geth.stop()
+
+    assert geth.is_stopped
+    assert geth.shutdown_stage == "kill"
+
+
+def test_stop_all(base_dir):
+    processes = [DevGethProcess(f"testing-{i}", base_dir=base_dir) for i in range(3)]
+    processes[0].shutdown_policy = EPHEMERAL_SHUTDOWN_POLICY
+    for geth in processes:
+        geth.start()
+
+    stop_all(processes)
+
+    assert all(geth.is_stopped and not geth.is_running for geth in processes)
+    assert [geth.shutdown_stage for geth in processes] == [
+        "kill",
+        "interrupt",
+        "interrupt",
+    ]
+
+
+def test_dev_geth_process_validates_geth_kwargs_once(base_dir, monkeypatch):
+    # create the account up front, spawning ``geth account new`` validates the
+    # kwargs of that command
+    DevGethProcess("testing", base_dir=base_dir)
+
+    validated = []
+    original_init = GethConfig.__init__
+
+    def counting_init(self, **kwargs):
+        validated.append(kwargs)
+        original_init(self, **kwargs)
+
+    monkeypatch.setattr(GethConfig, "__init__", counting_init)
+    geth = DevGethProcess("testing", base_dir=base_dir)
+
+    # the overrides, the test chain kwargs, and their account lookup
+    assert len(validated) == 3
+    assert geth.geth_config.data_dir == geth.data_dir
+    assert geth.geth_kwargs == geth.geth_config.to_kwargs()
+
+
+def test_unstarted_process_releases_ports_when_garbage_collected(base_dir):
+    geth = DevGethProcess("testing", base_dir=base_dir)
+    ports = [geth.geth_kwargs[key] for key in ("port", "ws_port", "rpc_port")]
+    other_ports = [reserve_port(int(port)) for port in ports]
+    assert not set(other_ports) & set(ports)
+    for port in other_ports:
+        release_port(port)
+
+    del geth
+    gc.collect()
+
+    assert [reserve_port(int(port)) for port in ports] == ports
+    for port in ports:
+        release_port(port)
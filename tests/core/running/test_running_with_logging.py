@@ -53,15 +53,46 @@ def test_with_logging(base_dir, caplog):
     stdout_logger_info = geth.stdout_callbacks[0]
     stderr_logger_info = geth.stderr_callbacks[0]
 
+    geth.wait_for_ipc(timeout=60)
+
     stdout_logger_info("test_out")
     stderr_logger_info("test_err")
 
+    assert geth.stdout_log_sink.flush(5)
+    assert geth.stderr_log_sink.flush(5)
+
     with open(test_stdout_path) as out_log_file:
-        line = out_log_file.readline()
-        assert line == "test_out\n"
+        assert "test_out\n" in out_log_file.readlines()
 
     with open(test_stderr_path) as err_log_file:
-        line = err_log_file.readline()
-        assert line == "test_err\n"
+        assert "test_err\n" in err_log_file.readlines()
 
     geth.stop()
+
+    with open(test_stderr_path) as err_log_file:
+        assert "IPC endpoint opened" in err_log_file.read()
+
+
+def test_logging_is_per_process(base_dir):
+    geth_0 = WithLogging(
+        "chain-0",
+        base_dir=base_dir,
+        stdout_logfile_path=f"{base_dir}/chain-0-stdout.log",
+        stderr_logfile_path=f"{base_dir}/chain-0-stderr.log",
+    )
+    geth_1 = WithLogging(
+        "chain-1",
+        base_dir=base_dir,
+        stdout_logfile_path=f"{base_dir}/chain-1-stdout.log",
+        stderr_logfile_path=f"{base_dir}/chain-1-stderr.log",
+    )
+
+    geth_0.stderr_callbacks[0]("only-in-chain-0")
+    geth_1.stderr_callbacks[0]("only-in-chain-1")
+    geth_0.stderr_log_sink.close()
+    geth_1.stderr_log_sink.close()
+
+    with open(f"{base_dir}/chain-0-stderr.log") as log_file:
+        assert log_file.read() == "only-in-chain-0\n"
+    with open(f"{base_dir}/chain-1-stderr.log") as log_file:
+        assert log_file.read() == "only-in-chain-1\n"
@@ -1,4 +1,33 @@
+import subprocess
+import sys
+
+import geth
+
+# slow to import and only needed by parts of py-geth that are imported on use
+HEAVY_MODULES = ("requests", "pydantic", "tarfile", "semantic_version")
+
+
 def test_import_and_version():
     import geth
 
     assert isinstance(geth.__version__, str)
+
+
+def test_public_names_are_importable():
+    for name in geth.__all__:
+        assert getattr(geth, name).__name__ == name
+    assert set(geth.__all__) <= set(dir(geth))
+
+
+def test_import_does_not_import_heavy_modules():
+    # a fresh interpreter, as the test session has imported everything already
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            "import sys, geth; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))",
+        ]
+    )
+
+    assert output.decode().strip() == ""
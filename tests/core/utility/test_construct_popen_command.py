@@ -0,0 +1,119 @@
+import pytest
+import os
+
+from geth.exceptions import (
+    PyGethValueError,
+)
+from geth.utils.filesystem import (
+    resolve_executable,
+)
+from geth.utils.validation import (
+    GethKwargs,
+)
+from geth.wrapper import (
+    GETH_FLAGS,
+    construct_popen_command,
+)
+
+
+@pytest.fixture
+def geth_executable(tmpdir):
+    executable_path = str(tmpdir.join("geth"))
+    with open(executable_path, "w") as f:
+        f.write("#!/bin/sh\n")
+    os.chmod(executable_path, 0o755)
+    return executable_path
+
+
+def test_every_flag_maps_to_a_geth_kwarg():
+    assert {geth_flag.field for geth_flag in GETH_FLAGS} <= set(GethKwargs.model_fields)
+
+
+def test_command_from_flag_table(geth_executable):
+    command = construct_popen_command(
+        geth_executable=geth_executable,
+        nice=False,
+        dev_mode=True,
+        ws_enabled=True,
+        ws_origins="*",
+        ws_port="8546",
+        ipc_disable=False,
+        password=b"not a path",
+        suffix_args=["account", "list"],
+    )
+
+    assert command == [
+        geth_executable,
+        "--dev",
+        "--ws",
+        "--ws.origins",
+        "*",
+        "--ws.port",
+        "8546",
+        "account",
+        "list",
+    ]
+
+
+def test_password_file_is_passed(geth_executable):
+    command = construct_popen_command(
+        geth_executable=geth_executable, nice=False, password="/tmp/password"
+    )
+
+    assert command == [geth_executable, "--password", "/tmp/password"]
+
+
+def test_missing_executable_is_rejected(tmpdir):
+    with pytest.raises(PyGethValueError, match="No geth executable found"):
+        construct_popen_command(geth_executable=str(tmpdir.join("missing")))
+
+
+def test_invalid_kwargs_are_rejected(geth_executable):
+    with pytest.raises(PyGethValueError, match="geth_kwargs validation failed"):
+        construct_popen_command(geth_executable=geth_executable, not_a_kwarg=True)
+
+
+def test_resolved_executables_are_cached_per_path(tmpdir, monkeypatch):
+    first_dir = tmpdir.mkdir("first")
+    second_dir = tmpdir.mkdir("second")
+    monkeypatch.setenv("PATH", os.pathsep.join((str(first_dir), str(second_dir))))
+    assert resolve_executable("geth") is None
+
+    executable_path = str(second_dir.join("geth"))
+    with open(executable_path, "w") as f:
+        f.write("#!/bin/sh\n")
+    os.chmod(executable_path, 0o755)
+
+    # misses are not cached
+    assert resolve_executable("geth") == executable_path
+
+    shadowing_path = str(first_dir.join("geth"))
+    with open(shadowing_path, "w") as f:
+        f.write("#!/bin/sh\n")
+    os.chmod(shadowing_path, 0o755)
+    assert resolve_executable("geth") == executable_path
+
+    monkeypatch.setenv("PATH", os.pathsep.join((str(first_dir), os.defpath)))
+    assert resolve_executable("geth") == shadowing_path
+
+
+def test_removed_executables_are_resolved_again(tmpdir, monkeypatch):
+    first_dir = tmpdir.mkdir("first")
+    second_dir = tmpdir.mkdir("second")
+    monkeypatch.setenv("PATH", os.pathsep.join((str(first_dir), str(second_dir))))
+
+    executable_paths = []
+    for directory in (first_dir, second_dir):
+        executable_path = str(directory.join("geth"))
+        with open(executable_path, "w") as f:
+            f.write("#!/bin/sh\n")
+        os.chmod(executable_path, 0o755)
+        executable_paths.append(executable_path)
+
+    assert resolve_executable("geth") == executable_paths[0]
+
+    os.remove(executable_paths[0])
+    assert resolve_executable("geth") == executable_paths[1]
+
+    os.remove(executable_paths[1])
+    assert resolve_executable("geth") is None
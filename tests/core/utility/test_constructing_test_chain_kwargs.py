@@ -3,6 +3,10 @@ import os
 import shutil
 import tempfile
 
+from geth.utils.networking import (
+    release_port,
+    reserve_port,
+)
 from geth.wrapper import (
     construct_test_chain_kwargs,
     get_max_socket_path_length,
@@ -44,3 +48,13 @@ def test_long_data_directory_paths_use_tempfile_geth_ipc_socket():
         chain_kwargs = construct_test_chain_kwargs(data_dir=data_dir)
 
         assert chain_kwargs["ipc_path"] != data_dir_ipc_path
+
+
+def test_ports_are_not_held_by_the_kwargs():
+    with tempdir() as data_dir:
+        chain_kwargs = construct_test_chain_kwargs(data_dir=data_dir)
+
+    ports = [chain_kwargs[key] for key in ("port", "ws_port", "rpc_port")]
+    assert [reserve_port(int(port)) for port in ports] == ports
+    for port in ports:
+        release_port(port)
@@ -0,0 +1,119 @@
+import pytest
+import json
+import os
+import subprocess
+from urllib.request import (
+    Request,
+    urlopen,
+)
+
+from geth import (
+    DevGethProcess,
+)
+from geth.accounts import (
+    create_new_account,
+    get_accounts,
+)
+from geth.exceptions import (
+    PyGethValueError,
+)
+from geth.fake_geth import (
+    parse_args,
+)
+from geth.main import (
+    get_geth_version,
+)
+from geth.utils.networking import (
+    ipc_request,
+)
+from geth.wrapper import (
+    DEFAULT_PASSWORD_PATH,
+)
+
+
+def test_parse_args():
+    options, commands = parse_args(
+        ["--dev", "--datadir", "/tmp/data", "--http.port=8545", "account", "list"]
+    )
+
+    assert options == {"--dev": True, "--datadir": "/tmp/data", "--http.port": "8545"}
+    assert commands == ["account", "list"]
+
+
+def test_version(fake_geth, monkeypatch):
+    monkeypatch.setenv("FAKE_GETH_VERSION", "1.17.1-stable")
+
+    assert str(get_geth_version()) == "1.17.1-stable"
+
+
+def test_accounts(fake_geth, data_dir):
+    account = create_new_account(data_dir=data_dir, password=DEFAULT_PASSWORD_PATH)
+
+    assert get_accounts(data_dir=data_dir, use_subprocess=True) == (account,)
+    assert get_accounts(data_dir=data_dir) == (account,)
+
+
+def test_removedb(fake_geth, data_dir):
+    chaindata_dir = os.path.join(data_dir, "geth", "chaindata")
+    os.makedirs(chaindata_dir)
+
+    proc = subprocess.run(
+        [fake_geth, "--datadir", data_dir, "removedb"], capture_output=True
+    )
+
+    assert proc.returncode == 0
+    assert b"Removing chaindata" in proc.stderr
+    assert not os.path.exists(chaindata_dir)
+
+
+def test_unknown_command_fails(fake_geth):
+    proc = subprocess.run([fake_geth, "attach"], capture_output=True)
+
+    assert proc.returncode == 1
+    assert b"Fatal:" in proc.stderr
+
+
+def test_dev_node_serves_json_rpc(fake_geth, base_dir):
+    with DevGethProcess("testing", base_dir=base_dir) as geth:
+        geth.wait_for_ipc(5)
+        geth.wait_for_rpc(5)
+
+        assert ipc_request(geth.ipc_path, "eth_blockNumber") == "0x0"
+        assert ipc_request(geth.ipc_path, "eth_accounts") == list(geth.accounts)
+        with pytest.raises(PyGethValueError, match="does not exist"):
+            ipc_request(geth.ipc_path, "eth_sendTransaction")
+
+        request = Request(
+            f"http://127.0.0.1:{geth.rpc_port}",
+            data=json.dumps(
+                [
+                    {"jsonrpc": "2.0", "id": 1, "method": "eth_chainId"},
+                    {"jsonrpc": "2.0", "id": 2, "method": "net_listening"},
+                ]
+            ).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        with urlopen(request) as response:
+            responses = json.load(response)
+        assert [r["result"] for r in responses] == ["0x539", True]
+
+    assert geth.shutdown_stage == "interrupt"
+    assert not os.path.exists(geth.ipc_path)
+
+
+def test_ipc_socket_directory_is_created(fake_geth, base_dir, tmpdir):
+    ipc_path = str(tmpdir.join("nested", "sockets", "geth.ipc"))
+
+    with DevGethProcess(
+        "testing", base_dir=base_dir, overrides={"ipc_path": ipc_path}
+    ) as geth:
+        geth.wait_for_ipc(5)
+        assert ipc_request(ipc_path, "net_listening") is True
+
+
+def test_set_head_beyond_the_head_fails(fake_geth, base_dir):
+    with DevGethProcess("testing", base_dir=base_dir) as geth:
+        geth.wait_for_ipc(5)
+
+        with pytest.raises(PyGethValueError, match="beyond the head"):
+            ipc_request(geth.ipc_path, "debug_setHead", ["0xffff"])
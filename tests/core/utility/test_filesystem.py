@@ -0,0 +1,39 @@
+import pytest
+import os
+
+from geth.utils.filesystem import (
+    publish_dir,
+)
+
+
+def write_marker(content):
+    def populate(scratch_path):
+        with open(os.path.join(scratch_path, "marker"), "w") as f:
+            f.write(content)
+
+    return populate
+
+
+def test_publish_dir(tmpdir):
+    path = str(tmpdir.join("cache", "entry"))
+
+    assert publish_dir(path, write_marker("first")) is True
+    # the directory was published first, the second copy is discarded
+    assert publish_dir(path, write_marker("second")) is False
+
+    with open(os.path.join(path, "marker")) as f:
+        assert f.read() == "first"
+    assert os.listdir(os.path.dirname(path)) == ["entry"]
+
+
+def test_failed_publish_leaves_nothing_behind(tmpdir):
+    path = str(tmpdir.join("cache", "entry"))
+
+    def failing_populate(scratch_path):
+        write_marker("partial")(scratch_path)
+        raise OSError("No space left on device")
+
+    with pytest.raises(OSError, match="No space left"):
+        publish_dir(path, failing_populate)
+
+    assert os.listdir(os.path.dirname(path)) == []
@@ -1,11 +1,83 @@
+import pytest
+import os
+import shutil
+
 import semantic_version
 
 from geth import (
     get_geth_version,
 )
+import geth.main
+from geth.main import (
+    clear_geth_version_cache,
+    get_geth_version_disk_cache_path,
+)
+from geth.wrapper import (
+    get_geth_binary_path,
+)
 
 
 def test_get_geth_version():
     version = get_geth_version()
 
     assert isinstance(version, semantic_version.Version)
+
+
+@pytest.fixture
+def geth_binary_copy(tmpdir, monkeypatch):
+    clear_geth_version_cache()
+    binary_path = str(tmpdir.join("geth"))
+    shutil.copy2(shutil.which(get_geth_binary_path()), binary_path)
+    monkeypatch.setenv("GETH_BINARY", binary_path)
+    yield binary_path
+    clear_geth_version_cache()
+
+
+def fail_geth_wrapper(*args, **kwargs):
+    raise AssertionError("geth should not have been executed")
+
+
+def test_get_geth_version_is_cached(geth_binary_copy, monkeypatch):
+    version = get_geth_version()
+
+    monkeypatch.setattr(geth.main, "geth_wrapper", fail_geth_wrapper)
+
+    assert get_geth_version() == version
+
+
+def test_get_geth_version_cache_invalidated_by_binary_change(
+    geth_binary_copy, monkeypatch
+):
+    get_geth_version()
+
+    stat_result = os.stat(geth_binary_copy)
+    os.utime(
+        geth_binary_copy,
+        ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000),
+    )
+
+    calls = []
+    original_geth_wrapper = geth.main.geth_wrapper
+
+    def counting_geth_wrapper(*args, **kwargs):
+        calls.append(args)
+        return original_geth_wrapper(*args, **kwargs)
+
+    monkeypatch.setattr(geth.main, "geth_wrapper", counting_geth_wrapper)
+
+    get_geth_version()
+    assert len(calls) == 1
+
+
+def test_get_geth_version_disk_cache(geth_binary_copy, tmpdir, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmpdir.mkdir("home")))
+    monkeypatch.setenv("GETH_VERSION_DISK_CACHE", "1")
+
+    version = get_geth_version()
+    assert os.path.exists(get_geth_version_disk_cache_path())
+
+    # a fresh process only has the on-disk cache
+    clear_geth_version_cache()
+    monkeypatch.setattr(geth.main, "geth_wrapper", fail_geth_wrapper)
+
+    assert get_geth_version() == version
@@ -0,0 +1,52 @@
+import pytest
+import json
+import os
+import socket
+import threading
+
+from geth.exceptions import (
+    PyGethValueError,
+)
+from geth.utils.networking import (
+    ipc_request,
+)
+
+
+@pytest.fixture
+def ipc_server(tmpdir):
+    ipc_path = os.path.join(str(tmpdir), "geth.ipc")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(ipc_path)
+    server.listen(1)
+
+    def serve():
+        conn, _ = server.accept()
+        with conn:
+            request = json.loads(conn.recv(4096))
+            if request["method"] == "eth_blockNumber":
+                response = {"jsonrpc": "2.0", "id": request["id"], "result": "0x2a"}
+            else:
+                response = {
+                    "jsonrpc": "2.0",
+                    "id": request["id"],
+                    "error": {"code": -32601, "message": "method not found"},
+                }
+            # send the response in pieces to exercise reassembly
+            data = json.dumps(response).encode()
+            conn.sendall(data[:10])
+            conn.sendall(data[10:])
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    yield ipc_path
+    thread.join(5)
+    server.close()
+
+
+def test_ipc_request_returns_result(ipc_server):
+    assert ipc_request(ipc_server, "eth_blockNumber") == "0x2a"
+
+
+def test_ipc_request_raises_on_error(ipc_server):
+    with pytest.raises(PyGethValueError, match="method not found"):
+        ipc_request(ipc_server, "debug_unknown")
@@ -0,0 +1,98 @@
+import pytest
+import subprocess
+import sys
+import time
+
+from geth.utils.proc import (
+    EPHEMERAL_SHUTDOWN_POLICY,
+    ShutdownPolicy,
+    kill_proc,
+    kill_procs,
+    wait_for_popen,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="relies on posix signal semantics"
+)
+
+FAST_POLICY = ShutdownPolicy(
+    interrupt_timeout=0.5, terminate_timeout=0.5, kill_timeout=2
+)
+
+
+def spawn_python(script):
+    proc = subprocess.Popen(
+        (
+            sys.executable,
+            "-c",
+            f"{script}\nprint('ready', flush=True)\n"
+            "import time\nwhile True: time.sleep(1)",
+        ),
+        stdout=subprocess.PIPE,
+    )
+    # wait until the signal handlers are installed
+    assert proc.stdout.readline() == b"ready\n"
+    return proc
+
+
+def test_wait_for_popen_reports_timeout():
+    proc = spawn_python("")
+    try:
+        assert wait_for_popen(proc, 0.1) is False
+    finally:
+        proc.kill()
+    assert wait_for_popen(proc, 5) is True
+
+
+def test_already_exited_process():
+    proc = subprocess.Popen((sys.executable, "-c", "pass"))
+    proc.wait()
+
+    assert kill_proc(proc) == "exited"
+
+
+def test_process_stopped_by_interrupt():
+    proc = spawn_python("")
+
+    assert kill_proc(proc, FAST_POLICY) == "interrupt"
+
+
+def test_process_ignoring_interrupt_is_terminated():
+    proc = spawn_python("import signal\nsignal.signal(signal.SIGINT, signal.SIG_IGN)")
+
+    assert kill_proc(proc, FAST_POLICY) == "terminate"
+
+
+def test_process_ignoring_interrupt_and_terminate_is_killed():
+    proc = spawn_python(
+        "import signal\n"
+        "signal.signal(signal.SIGINT, signal.SIG_IGN)\n"
+        "signal.signal(signal.SIGTERM, signal.SIG_IGN)"
+    )
+
+    assert kill_proc(proc, FAST_POLICY) == "kill"
+
+
+def test_ephemeral_policy_kills_immediately():
+    proc = spawn_python("import signal\nsignal.signal(signal.SIGINT, signal.SIG_IGN)")
+
+    started_at = time.monotonic()
+    assert kill_proc(proc, EPHEMERAL_SHUTDOWN_POLICY) == "kill"
+    assert time.monotonic() - started_at < 1
+
+
+def test_kill_procs_waits_for_all_processes_together():
+    exited_proc = subprocess.Popen((sys.executable, "-c", "pass"))
+    exited_proc.wait()
+    procs = [exited_proc, spawn_python("")] + [
+        spawn_python("import signal\nsignal.signal(signal.SIGINT, signal.SIG_IGN)")
+        for _ in range(4)
+    ]
+
+    started_at = time.monotonic()
+    stages = kill_procs(procs, FAST_POLICY)
+
+    assert stages == ["exited", "interrupt"] + ["terminate"] * 4
+    assert all(proc.poll() is not None for proc in procs)
+    # waiting in turn would take at least 4 * 0.5 seconds for the terminate stage
+    assert time.monotonic() - started_at < 1.5
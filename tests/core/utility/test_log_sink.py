@@ -0,0 +1,140 @@
+import pytest
+import gzip
+import os
+import sys
+
+from geth.exceptions import (
+    PyGethValueError,
+)
+from geth.utils.logs import (
+    LogSink,
+)
+
+
+def test_lines_are_written_as_raw_bytes(tmpdir):
+    path = str(tmpdir.join("geth.log"))
+    sink = LogSink(path)
+    sink.write(b"first")
+    sink.write("second")
+    sink.close()
+
+    with open(path, "rb") as log_file:
+        assert log_file.read() == b"first\nsecond\n"
+
+
+def test_flush_makes_lines_visible(tmpdir):
+    path = str(tmpdir.join("geth.log"))
+    sink = LogSink(path)
+    sink.write(b"line")
+
+    assert sink.flush(5)
+    with open(path, "rb") as log_file:
+        assert log_file.read() == b"line\n"
+    sink.close()
+
+
+def test_writing_after_close_appends(tmpdir):
+    path = str(tmpdir.join("geth.log"))
+    sink = LogSink(path)
+    sink.write(b"before")
+    sink.close()
+    sink.write(b"after")
+    sink.close()
+
+    with open(path, "rb") as log_file:
+        assert log_file.read() == b"before\nafter\n"
+
+
+def test_size_based_rotation_bounds_retained_logs(tmpdir):
+    path = str(tmpdir.join("geth.log"))
+    sink = LogSink(path, max_bytes=100, backup_count=2)
+    for i in range(100):
+        sink.write(f"line-{i:04d}".encode())
+    sink.close()
+
+    assert sorted(os.listdir(str(tmpdir))) == ["geth.log", "geth.log.1", "geth.log.2"]
+    for name in os.listdir(str(tmpdir)):
+        assert os.path.getsize(str(tmpdir.join(name))) <= 100
+
+    with open(path, "rb") as log_file:
+        assert log_file.read().endswith(b"line-0099\n")
+
+
+def test_time_based_rotation(tmpdir):
+    path = str(tmpdir.join("geth.log"))
+    sink = LogSink(path, rotate_interval=0)
+    sink.write(b"first")
+    assert sink.flush(5)
+    # nothing is written, so the log is not rotated
+    assert sink.flush(5)
+    sink.write(b"second")
+    sink.close()
+
+    with open(path, "rb") as log_file:
+        assert log_file.read() == b"second\n"
+    with open(path + ".1", "rb") as log_file:
+        assert log_file.read() == b"first\n"
+    assert not os.path.exists(path + ".2")
+
+
+def test_gzip_compression(tmpdir):
+    path = str(tmpdir.join("geth.log"))
+    sink = LogSink(path, compression="gzip")
+    sink.write(b"compressed")
+    sink.close()
+
+    assert sink.path == path + ".gz"
+    with gzip.open(sink.path) as log_file:
+        assert log_file.read() == b"compressed\n"
+
+
+def test_unknown_compression(tmpdir):
+    with pytest.raises(PyGethValueError):
+        LogSink(str(tmpdir.join("geth.log")), compression="bz2")
+
+
+def test_missing_zstd_backend_fails_on_creation(tmpdir, monkeypatch):
+    monkeypatch.setitem(sys.modules, "compression", None)
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+
+    with pytest.raises(PyGethValueError, match="zstd"):
+        LogSink(str(tmpdir.join("geth.log")), compression="zstd")
+
+
+def test_write_errors_are_raised_by_flush_and_close(tmpdir):
+    # the log directory cannot be created where a file is in the way
+    blocking_path = str(tmpdir.join("blocked"))
+    with open(blocking_path, "w"):
+        pass
+    path = os.path.join(blocking_path, "geth.log")
+    sink = LogSink(path)
+
+    sink.write(b"lost")
+    with pytest.raises(OSError):
+        sink.flush(5)
+    assert sink.dropped == 1
+
+    sink.write(b"lost too")
+    with pytest.raises(OSError):
+        sink.close()
+
+    # writing is attempted again once the error has been raised
+    os.remove(blocking_path)
+    sink.write(b"written")
+    sink.close()
+    with open(path, "rb") as log_file:
+        assert log_file.read() == b"written\n"
+
+
+def test_pending_lines_are_bounded(tmpdir):
+    path = str(tmpdir.join("geth.log"))
+    sink = LogSink(path, max_pending_lines=2)
+    # holding the lock keeps the writer thread from taking the pending lines
+    with sink._condition:
+        for i in range(5):
+            sink.write(f"line-{i}".encode())
+    sink.close()
+
+    assert sink.dropped == 3
+    with open(path, "rb") as log_file:
+        assert log_file.read() == b"line-0\nline-1\n"
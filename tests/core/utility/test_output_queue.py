@@ -0,0 +1,117 @@
+import pytest
+import threading
+import time
+
+from geth.exceptions import (
+    PyGethValueError,
+)
+from geth.mixins import (
+    JoinableQueue,
+)
+from geth.utils.timeout import (
+    Timeout,
+)
+
+
+def test_batches_contain_all_available_lines():
+    output_queue = JoinableQueue()
+    output_queue.put_lines([b"a", b"b", b"c"])
+    output_queue.close()
+
+    assert list(output_queue.iter_batches()) == [[b"a", b"b", b"c"]]
+
+
+def test_unbounded_queue_never_drops():
+    output_queue = JoinableQueue()
+    output_queue.put_lines([str(i).encode() for i in range(1000)])
+
+    assert output_queue.qsize() == 1000
+    assert output_queue.dropped == 0
+
+
+def test_drop_oldest_keeps_newest_lines():
+    output_queue = JoinableQueue(3, "drop-oldest")
+    output_queue.put_lines([b"1", b"2", b"3", b"4", b"5"])
+    output_queue.close()
+
+    assert output_queue.dropped == 2
+    assert list(output_queue) == [b"3", b"4", b"5"]
+    # evicted lines do not count as unfinished tasks
+    assert output_queue.unfinished_tasks == 3
+
+
+def test_count_and_drop_keeps_oldest_lines():
+    output_queue = JoinableQueue(3, "count-and-drop")
+    output_queue.put_lines([b"1", b"2", b"3", b"4", b"5"])
+    output_queue.close()
+
+    assert output_queue.dropped == 2
+    assert list(output_queue) == [b"1", b"2", b"3"]
+
+
+@pytest.mark.parametrize("overflow_policy", ("drop-oldest", "count-and-drop"))
+def test_close_is_never_dropped(overflow_policy):
+    output_queue = JoinableQueue(1, overflow_policy)
+    output_queue.put_lines([b"1"])
+    output_queue.close()
+
+    assert list(output_queue.iter_batches()) == [[b"1"]]
+
+
+def test_unknown_overflow_policy():
+    with pytest.raises(PyGethValueError):
+        JoinableQueue(1, "drop-newest")
+
+
+def test_join_waits_for_task_done():
+    output_queue = JoinableQueue()
+    output_queue.put_lines([b"1", b"2"])
+    output_queue.close()
+
+    def consume():
+        for _ in output_queue:
+            time.sleep(0.05)
+            output_queue.task_done()
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    output_queue.join(5)
+
+    assert output_queue.unfinished_tasks == 0
+    consumer.join()
+
+
+def test_join_times_out_without_busy_waiting():
+    output_queue = JoinableQueue()
+    output_queue.put_lines([b"never consumed"])
+
+    cpu_time_at_start = time.process_time()
+    with pytest.raises(Timeout):
+        output_queue.join(1)
+
+    assert time.process_time() - cpu_time_at_start < 0.5
+
+
+def test_offer_lines_never_waits_and_reports_room():
+    output_queue = JoinableQueue(2)
+    on_room = threading.Event()
+
+    assert output_queue.offer_lines([b"1"], on_room.set)
+    assert not output_queue.offer_lines([b"2", b"3"], on_room.set)
+    # lines past ``maxsize`` are kept, not dropped
+    assert output_queue.qsize() == 3
+    assert output_queue.dropped == 0
+
+    output_queue.get()
+    assert not on_room.is_set()
+    output_queue.get()
+    assert on_room.is_set()
+
+
+@pytest.mark.parametrize("overflow_policy", ("drop-oldest", "count-and-drop"))
+def test_offer_lines_applies_dropping_policies(overflow_policy):
+    output_queue = JoinableQueue(1, overflow_policy)
+
+    assert output_queue.offer_lines([b"1", b"2"], lambda: None)
+    assert output_queue.qsize() == 1
+    assert output_queue.dropped == 1
@@ -0,0 +1,90 @@
+import pytest
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+import subprocess
+import sys
+
+from geth.utils.networking import (
+    find_open_port,
+    get_open_port,
+    release_port,
+    reserve_port,
+    try_reserve_port,
+)
+
+
+@pytest.fixture(autouse=True)
+def port_lock_dir(tmpdir, monkeypatch):
+    lock_dir = str(tmpdir.mkdir("port-locks"))
+    monkeypatch.setenv("GETH_PORT_LOCK_DIR", lock_dir)
+    return lock_dir
+
+
+def test_preferred_port_is_reserved_once():
+    preferred_port = int(get_open_port())
+
+    first_port = reserve_port(preferred_port)
+    second_port = reserve_port(preferred_port)
+
+    assert first_port == str(preferred_port)
+    assert second_port != first_port
+
+    release_port(first_port)
+    release_port(second_port)
+
+
+def test_released_port_can_be_reserved_again():
+    port = reserve_port()
+    release_port(port)
+
+    assert reserve_port(int(port)) == port
+    release_port(port)
+
+
+def test_found_ports_are_not_reserved():
+    preferred_port = int(get_open_port())
+
+    assert find_open_port(preferred_port) == str(preferred_port)
+    # nothing is held, so the port can still be reserved
+    assert reserve_port(preferred_port) == str(preferred_port)
+    # but reserved ports are skipped
+    assert find_open_port(preferred_port) != str(preferred_port)
+
+    release_port(preferred_port)
+
+
+def test_concurrent_reservations_are_unique():
+    with ThreadPoolExecutor(16) as executor:
+        ports = list(executor.map(lambda _: reserve_port(8545), range(48)))
+
+    assert len(set(ports)) == len(ports)
+
+    for port in ports:
+        release_port(port)
+
+
+def test_reservations_are_exclusive_across_processes():
+    holder = subprocess.Popen(
+        (
+            sys.executable,
+            "-c",
+            "from geth.utils.networking import reserve_port\n"
+            "print(reserve_port(), flush=True)\n"
+            "input()\n",
+        ),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        held_port = holder.stdout.readline().strip()
+
+        assert held_port
+        assert not try_reserve_port(held_port)
+    finally:
+        holder.communicate("\n")
+
+    # the lock is dropped with the process that held it
+    assert try_reserve_port(held_port)
+    release_port(held_port)
@@ -0,0 +1,59 @@
+import pytest
+
+from geth.utils.readiness import (
+    ReadinessMonitor,
+)
+
+HTTP_LINE = (
+    b"INFO [06-19|20:40:52.123] HTTP server started                      "
+    b"endpoint=127.0.0.1:8545 auth=false prefix= cors= vhosts=localhost"
+)
+AUTH_HTTP_LINE = (
+    b"INFO [06-19|20:40:52.123] HTTP server started                      "
+    b"endpoint=127.0.0.1:8551 auth=true  prefix= cors=localhost vhosts=localhost"
+)
+IPC_LINE = (
+    b"INFO [06-19|20:40:52.120] IPC endpoint opened                      "
+    b"url=/tmp/testing/geth.ipc"
+)
+
+
+def test_nothing_ready_by_default():
+    monitor = ReadinessMonitor("8545")
+
+    assert not monitor.rpc_ready.is_set()
+    assert not monitor.ipc_ready.is_set()
+
+
+@pytest.mark.parametrize("line", (HTTP_LINE, HTTP_LINE.decode()))
+def test_http_server_started_marks_rpc_ready(line):
+    monitor = ReadinessMonitor("8545")
+    monitor.feed(line)
+
+    assert monitor.rpc_ready.is_set()
+    assert not monitor.ipc_ready.is_set()
+
+
+def test_http_server_on_other_port_is_ignored():
+    monitor = ReadinessMonitor("8545")
+    monitor.feed(AUTH_HTTP_LINE)
+
+    assert not monitor.rpc_ready.is_set()
+
+
+def test_ipc_endpoint_opened_marks_ipc_ready():
+    monitor = ReadinessMonitor("8545")
+    monitor.feed(IPC_LINE)
+
+    assert monitor.ipc_ready.is_set()
+    assert not monitor.rpc_ready.is_set()
+
+
+def test_reset_clears_readiness():
+    monitor = ReadinessMonitor("8545")
+    monitor.feed(HTTP_LINE)
+    monitor.feed(IPC_LINE)
+    monitor.reset()
+
+    assert not monitor.rpc_ready.is_set()
+    assert not monitor.ipc_ready.is_set()
@@ -0,0 +1,127 @@
+import pytest
+import os
+import subprocess
+import sys
+import threading
+
+from geth.utils.streams import (
+    IS_STREAM_PUMP_SUPPORTED,
+    StreamPump,
+    get_stream_pump,
+)
+
+pytestmark = pytest.mark.skipif(
+    not IS_STREAM_PUMP_SUPPORTED,
+    reason="The stream pump is not supported on this platform",
+)
+
+
+def pump_output(script):
+    proc = subprocess.Popen(
+        (sys.executable, "-c", script),
+        stdout=subprocess.PIPE,
+    )
+    lines = []
+    closed = threading.Event()
+    get_stream_pump().register(proc.stdout, lines.extend, closed.set)
+    return proc, lines, closed
+
+
+def test_lines_are_delivered_in_order():
+    proc, lines, closed = pump_output(
+        "import sys\nfor i in range(10000): sys.stdout.write(f'line-{i}\\n')"
+    )
+
+    assert closed.wait(10)
+    proc.wait()
+    assert lines == [f"line-{i}\n".encode() for i in range(10000)]
+
+
+def test_unterminated_last_line_is_delivered_on_close():
+    proc, lines, closed = pump_output("import sys; sys.stdout.write('a\\nb')")
+
+    assert closed.wait(10)
+    proc.wait()
+    assert lines == [b"a\n", b"b"]
+
+
+def test_many_streams_share_one_pump():
+    pumped = [
+        pump_output(f"import sys; sys.stdout.write('proc-{i}\\n')") for i in range(20)
+    ]
+
+    for i, (proc, lines, closed) in enumerate(pumped):
+        assert closed.wait(10)
+        proc.wait()
+        assert lines == [f"proc-{i}\n".encode()]
+
+
+def test_callback_errors_do_not_stop_the_pump():
+    def fail(lines):
+        raise ValueError("callback failure")
+
+    failing_proc = subprocess.Popen(
+        (sys.executable, "-c", "print('boom')"), stdout=subprocess.PIPE
+    )
+    failing_closed = threading.Event()
+    get_stream_pump().register(failing_proc.stdout, fail, failing_closed.set)
+    assert failing_closed.wait(10)
+    failing_proc.wait()
+
+    proc, lines, closed = pump_output("print('still pumping')")
+    assert closed.wait(10)
+    proc.wait()
+    assert lines == [b"still pumping\n"]
+
+
+def test_stale_registration_of_a_reused_fd_is_replaced():
+    stale_read_fd, stale_write_fd = os.pipe()
+    stale_stream = os.fdopen(stale_read_fd, "rb", buffering=0)
+    get_stream_pump().register(stale_stream, lambda lines: None, lambda: None)
+
+    # the OS reuses the fd of the stale stream, which was never unregistered
+    read_fd, write_fd = os.pipe()
+    os.dup2(read_fd, stale_read_fd)
+    os.close(read_fd)
+    os.close(stale_write_fd)
+
+    lines = []
+    closed = threading.Event()
+    get_stream_pump().register(stale_stream, lines.extend, closed.set)
+    os.write(write_fd, b"reused\n")
+    os.close(write_fd)
+
+    assert closed.wait(10)
+    assert lines == [b"reused\n"]
+    stale_stream.close()
+
+
+def test_stream_errors_do_not_stop_the_pump():
+    stream_pump = StreamPump()
+    failing_proc = subprocess.Popen(
+        (sys.executable, "-c", "print('boom')"), stdout=subprocess.PIPE
+    )
+    failing_fd = failing_proc.stdout.fileno()
+    pump = stream_pump._pump
+
+    def fail_on_failing_fd(fd, pumped_stream):
+        if fd == failing_fd:
+            raise RuntimeError("read failure")
+        pump(fd, pumped_stream)
+
+    stream_pump._pump = fail_on_failing_fd
+    failing_closed = threading.Event()
+    stream_pump.register(failing_proc.stdout, lambda lines: None, failing_closed.set)
+    assert failing_closed.wait(10)
+    failing_proc.wait()
+
+    proc = subprocess.Popen(
+        (sys.executable, "-c", "print('still pumping')"), stdout=subprocess.PIPE
+    )
+    lines = []
+    closed = threading.Event()
+    stream_pump.register(proc.stdout, lines.extend, closed.set)
+    assert closed.wait(10)
+    proc.wait()
+    assert lines == [b"still pumping\n"]
+    assert stream_pump._thread.is_alive()
@@ -4,10 +4,15 @@ from __future__ import (
 
 import pytest
 
+from pydantic import (
+    ValidationError,
+)
+
 from geth.exceptions import (
     PyGethValueError,
 )
 from geth.utils.validation import (
+    get_geth_config,
     validate_genesis_data,
     validate_geth_kwargs,
 )
@@ -90,3 +95,27 @@ def test_validate_genesis_data_good(genesis_data):
 def test_validate_genesis_data_bad(genesis_data):
     with pytest.raises(PyGethValueError):
         validate_genesis_data(genesis_data)
+
+
+def test_geth_config_is_validated_once():
+    geth_config = get_geth_config({"data_dir": "/tmp", "dev_mode": True})
+
+    assert get_geth_config(geth_config) is geth_config
+    assert validate_geth_kwargs(geth_config) is None
+    assert geth_config.to_kwargs() == {"data_dir": "/tmp", "dev_mode": True}
+
+
+def test_geth_config_is_immutable():
+    geth_config = get_geth_config({"data_dir": "/tmp"})
+
+    with pytest.raises(ValidationError):
+        geth_config.data_dir = "/other"
+
+    updated_config = geth_config.model_copy(update={"suffix_args": ["version"]})
+    assert updated_config.suffix_args == ["version"]
+    assert geth_config.suffix_args is None
+
+
+def test_get_geth_config_bad():
+    with pytest.raises(PyGethValueError):
+        get_geth_config({"data_dir": "/tmp", "not_a_kwarg": True})